@@ -30,8 +30,15 @@
 '''
 
 from . import pcg_extras, pcg_detail, pcg_engines
-from .pcg_detail import AbstractEngine, Engine, Extended
+from .pcg_detail import AbstractEngine, Engine, Extended, Leapfrog, Buffered, Tabulated, EngineView
+from .discrete import AliasTable
+from .inverse_cdf import InverseCDF
+from .keyed import KeyedEngineCache, SqliteStore
+from .pcg_extras import SeedSequence
+from .permutation import RandomPermutation
+from .counter import CounterHash
 from .python import PcgRandom
+from .threadlocal import ThreadLocalEngine
 
 
 pcg32 = pcg_engines.setseq_xsh_rr_64_32
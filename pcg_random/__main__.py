@@ -0,0 +1,67 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Command-line tools.
+
+    python -m pcg_random shuffle SRC DST --seed SEED
+'''
+
+import argparse
+import sys
+
+from . import external_shuffle
+
+
+def _seed(text):
+    try:
+        return int(text, 0)
+    except ValueError:
+        return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pcg_random')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    shuffle = commands.add_parser('shuffle', help='shuffle the records of a file, out of core')
+    shuffle.add_argument('src')
+    shuffle.add_argument('dst')
+    shuffle.add_argument('--seed', type=_seed, required=True,
+            help='an int, or any other string')
+    shuffle.add_argument('--record-size', type=int, default=None,
+            help='fixed record size in bytes (default: lines)')
+    shuffle.add_argument('--leaf-bytes', type=int, default=external_shuffle.LEAF_BYTES,
+            help='largest bucket shuffled in memory (affects the output)')
+    shuffle.add_argument('--fanout', type=int, default=external_shuffle.FANOUT,
+            help='buckets per scatter pass (affects the output)')
+    shuffle.add_argument('--buffer-bytes', type=int, default=1 << 20,
+            help='total write buffering')
+    shuffle.add_argument('--tmpdir', default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == 'shuffle':
+        try:
+            external_shuffle.shuffle_file(args.src, args.dst, args.seed, args.record_size,
+                    leaf_bytes=args.leaf_bytes, fanout=args.fanout,
+                    buffer_bytes=args.buffer_bytes, tmpdir=args.tmpdir)
+        except (OSError, ValueError) as e:
+            parser.exit(1, '%s: error: %s\n' % (parser.prog, e))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,467 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Bulk generation into NumPy arrays, and jumping many engines at once.
+
+    Unlike the rest of the package, this module requires NumPy, so it is
+    only imported by the methods that need it.
+'''
+
+import sys
+
+import numpy as np
+
+from . import pcg_detail
+
+
+_word_dtypes = {
+        8: np.uint8,
+        16: np.uint16,
+        32: np.uint32,
+        64: np.uint64,
+}
+
+_float_bits = {
+        np.dtype(np.float64): 53,
+        np.dtype(np.float32): 24,
+}
+
+
+def words(engine, n):
+    ''' n consecutive raw outputs, as an array of the matching dtype.
+    '''
+    BITS = engine.result_type.BITS
+    dtype = _word_dtypes.get(BITS)
+    if dtype is None:
+        raise TypeError('No NumPy dtype for %d-bit outputs' % BITS)
+    rv = np.empty(n, dtype)
+    engine.readinto(rv, sys.byteorder)
+    return rv
+
+def random_bits(engine, n, k):
+    ''' Equivalent to n calls of PcgRandom.getrandbits(k), for k <= 64.
+    '''
+    assert 0 < k <= 64
+    BITS = engine.result_type.BITS
+    mask = (1 << k) - 1
+    if BITS > 64:
+        return np.fromiter((int(engine()) & mask for _ in range(n)), np.uint64, n)
+    per = -(-k // BITS)
+    w = words(engine, n * per).astype(np.uint64).reshape(n, per)
+    rv = w[:, 0].copy()
+    for j in range(1, per):
+        rv |= w[:, j] << np.uint64(j * BITS)
+    if k < 64:
+        rv &= np.uint64(mask)
+    return rv
+
+def float_bits(dtype):
+    ''' The number of random bits used for each float of the given dtype.
+    '''
+    dtype = np.dtype(dtype)
+    try:
+        return _float_bits[dtype]
+    except KeyError:
+        raise TypeError('Unsupported float dtype: %s' % dtype) from None
+
+def random_floats(engine, n, dtype=np.float64):
+    ''' Equivalent to n calls of PcgRandom.random(), for float64, or of
+        getrandbits(24) / 2**24 for float32.
+
+        The conversion is exact: k random bits, scaled by 2**-k.
+    '''
+    dtype = np.dtype(dtype)
+    k = float_bits(dtype)
+    return (random_bits(engine, n, k).astype(dtype) * dtype.type(2.0 ** -k))
+
+
+# Jumping many LCGs at once. Each lane has its own state, delta (or
+# target), multiplier and increment; the loops run over bit positions, so
+# all lanes go through square-and-multiply together.
+
+def _lanes(dtype_source, *arrays):
+    dtype = np.asarray(dtype_source).dtype
+    if dtype.type not in _word_dtypes.values():
+        raise TypeError('States must be an unsigned integer array, not %s' % dtype)
+    return [a.astype(dtype) for a in np.broadcast_arrays(*map(np.asarray, arrays))]
+
+def vector_advance(states, deltas, mults, incs):
+    ''' Array version of Engine._staticmethod_advance, for states of 8 to
+        64 bits. Negative deltas go the long way round, as usual.
+    '''
+    with np.errstate(over='ignore'):
+        states, deltas, cur_mult, cur_plus = _lanes(states, states, deltas, mults, incs)
+        dtype = states.dtype.type
+        one = dtype(1)
+        acc_mult = np.ones_like(states)
+        acc_plus = np.zeros_like(states)
+        while deltas.any():
+            take = (deltas & one).astype(bool)
+            acc_mult = np.where(take, acc_mult * cur_mult, acc_mult)
+            acc_plus = np.where(take, acc_plus * cur_mult + cur_plus, acc_plus)
+            cur_plus = (cur_mult + one) * cur_plus
+            cur_mult = cur_mult * cur_mult
+            deltas = deltas >> one
+        return acc_mult * states + acc_plus
+
+def vector_distance(cur_states, new_states, mults, incs, mask=None, mcg=False):
+    ''' Array version of Engine._staticmethod_distance (the bitwise
+        algorithm), for states of 8 to 64 bits.
+    '''
+    with np.errstate(over='ignore'):
+        cur, new, cur_mult, cur_plus = _lanes(cur_states, cur_states, new_states, mults, incs)
+        dtype = cur.dtype.type
+        bits = cur.dtype.itemsize * 8
+        full = (1 << bits) - 1
+        mask = dtype(full if mask is None else int(mask) & full)
+        shift = 2 if mcg else 0
+        distance = np.zeros_like(cur)
+        for bit in range(shift, bits):
+            active = (cur & mask) != (new & mask)
+            if not active.any():
+                break
+            the_bit = dtype(1 << bit)
+            step = active & (((cur ^ new) & the_bit) != 0)
+            cur = np.where(step, cur * cur_mult + cur_plus, cur)
+            distance |= np.where(step, the_bit, dtype(0))
+            cur_plus = (cur_mult + dtype(1)) * cur_plus
+            cur_mult = cur_mult * cur_mult
+        return distance >> dtype(shift)
+
+
+# 128-bit lanes, as (..., 2) arrays of uint64 limbs: [low, high].
+
+_M32 = np.uint64(0xffffffff)
+_S32 = np.uint64(32)
+
+def to_limbs(values):
+    ''' Convert ints (or uint128_t) to an (n, 2) array of uint64 limbs.
+    '''
+    values = [int(v) % (1 << 128) for v in values]
+    return np.array([(v & 0xffffffffffffffff, v >> 64) for v in values], np.uint64).reshape(len(values), 2)
+
+def from_limbs(limbs):
+    ''' Convert a (..., 2) limb array back to a list of ints.
+    '''
+    limbs = np.asarray(limbs, np.uint64).reshape(-1, 2)
+    return [int(lo) | int(hi) << 64 for lo, hi in limbs.tolist()]
+
+def _mul64(a, b):
+    # full 128-bit product of uint64 arrays, via 32-bit halves
+    a0 = a & _M32
+    a1 = a >> _S32
+    b0 = b & _M32
+    b1 = b >> _S32
+    p00 = a0 * b0
+    p01 = a0 * b1
+    p10 = a1 * b0
+    mid = (p00 >> _S32) + (p01 & _M32) + (p10 & _M32)
+    lo = (p00 & _M32) | (mid << _S32)
+    hi = a1 * b1 + (p01 >> _S32) + (p10 >> _S32) + (mid >> _S32)
+    return lo, hi
+
+def _mul128(a, b):
+    lo, hi = _mul64(a[0], b[0])
+    hi = hi + a[0] * b[1] + a[1] * b[0]
+    return lo, hi
+
+def _add128(a, b):
+    lo = a[0] + b[0]
+    hi = a[1] + b[1] + (lo < a[0]).astype(np.uint64)
+    return lo, hi
+
+def _where128(cond, a, b):
+    return np.where(cond, a[0], b[0]), np.where(cond, a[1], b[1])
+
+def _split(arr):
+    arr = np.asarray(arr, np.uint64)
+    if arr.shape[-1:] != (2,):
+        raise ValueError('128-bit lanes must have a last axis of 2 limbs')
+    return arr[..., 0], arr[..., 1]
+
+def _limbs128(*arrays):
+    parts = [_split(a) for a in arrays]
+    flat = np.broadcast_arrays(*[p for pair in parts for p in pair])
+    return [(flat[i].copy(), flat[i + 1].copy()) for i in range(0, len(flat), 2)]
+
+def vector_advance128(states, deltas, mults, incs):
+    ''' vector_advance for 128-bit lanes; all arguments are limb arrays.
+    '''
+    with np.errstate(over='ignore'):
+        state, delta, cur_mult, cur_plus = _limbs128(states, deltas, mults, incs)
+        one = np.uint64(1)
+        zero = np.zeros_like(state[0])
+        acc_mult = (zero + one, zero.copy())
+        acc_plus = (zero.copy(), zero.copy())
+        while delta[0].any() or delta[1].any():
+            take = (delta[0] & one).astype(bool)
+            acc_mult = _where128(take, _mul128(acc_mult, cur_mult), acc_mult)
+            acc_plus = _where128(take, _add128(_mul128(acc_plus, cur_mult), cur_plus), acc_plus)
+            cur_plus = _mul128(_add128(cur_mult, (zero + one, zero)), cur_plus)
+            cur_mult = _mul128(cur_mult, cur_mult)
+            delta = ((delta[0] >> one) | (delta[1] << np.uint64(63)), delta[1] >> one)
+        lo, hi = _add128(_mul128(acc_mult, state), acc_plus)
+        return np.stack([lo, hi], axis=-1)
+
+def vector_distance128(cur_states, new_states, mults, incs, mask=None, mcg=False):
+    ''' vector_distance for 128-bit lanes; all arguments are limb arrays,
+        except mask, which is an int.
+    '''
+    with np.errstate(over='ignore'):
+        cur, new, cur_mult, cur_plus = _limbs128(cur_states, new_states, mults, incs)
+        mask = (1 << 128) - 1 if mask is None else int(mask) % (1 << 128)
+        mask = (np.uint64(mask & 0xffffffffffffffff), np.uint64(mask >> 64))
+        zero = np.zeros_like(cur[0])
+        one = (zero + np.uint64(1), zero)
+        shift = 2 if mcg else 0
+        dist = [zero.copy(), zero.copy()]
+        for bit in range(shift, 128):
+            active = ((cur[0] & mask[0]) != (new[0] & mask[0])) | ((cur[1] & mask[1]) != (new[1] & mask[1]))
+            if not active.any():
+                break
+            limb, the_bit = divmod(bit, 64)
+            the_bit = np.uint64(1 << the_bit)
+            step = active & (((cur[limb] ^ new[limb]) & the_bit) != 0)
+            cur = _where128(step, _add128(_mul128(cur, cur_mult), cur_plus), cur)
+            dist[limb] |= np.where(step, the_bit, np.uint64(0))
+            cur_plus = _mul128(_add128(cur_mult, one), cur_plus)
+            cur_mult = _mul128(cur_mult, cur_mult)
+        if shift:
+            s = np.uint64(shift)
+            dist = [(dist[0] >> s) | (dist[1] << np.uint64(64 - shift)), dist[1] >> s]
+        return np.stack(dist, axis=-1)
+
+
+# Whole runs of one engine's outputs. The states come from a ladder:
+# each pass extends the run so far by its own length, with the stride of
+# that length, so n states take log2(n) passes. The output functions are
+# the mixins' output(), for arrays of states of up to 64 bits, or for
+# (low, high) pairs of uint64 limbs for 128-bit states.
+
+def _lcg_states(state, n, mult, plus, bits):
+    # states[0] is state, and states[n] the one after n steps
+    full = (1 << bits) - 1
+    if bits <= 64:
+        dtype = _word_dtypes[bits]
+        states = np.empty(n + 1, dtype)
+        states[0] = state
+    else:
+        lo = np.empty(n + 1, np.uint64)
+        hi = np.empty(n + 1, np.uint64)
+        lo[0], hi[0] = state & 0xffffffffffffffff, state >> 64
+    m = 1
+    with np.errstate(over='ignore'):
+        while m <= n:
+            take = min(m, n + 1 - m)
+            if bits <= 64:
+                states[m:m + take] = states[:take] * dtype(mult) + dtype(plus)
+            else:
+                a = (np.uint64(mult & 0xffffffffffffffff), np.uint64(mult >> 64))
+                c = (np.uint64(plus & 0xffffffffffffffff), np.uint64(plus >> 64))
+                lo[m:m + take], hi[m:m + take] = _add128(_mul128((lo[:take], hi[:take]), a), c)
+            mult, plus = mult * mult & full, (mult + 1) * plus & full
+            m += take
+    if bits <= 64:
+        return states
+    return lo, hi
+
+def _shr(x, k):
+    # x >> k, where x is an array or a (low, high) pair, and k is an int
+    # or (for pairs, only between 1 and 63) an array
+    if not isinstance(x, tuple):
+        return x >> np.asarray(k).astype(x.dtype)
+    lo, hi = x
+    if isinstance(k, int):
+        if not k:
+            return x
+        if k >= 64:
+            return hi >> np.uint64(k - 64), np.zeros_like(hi)
+    k = np.asarray(k).astype(np.uint64)
+    return (lo >> k) | (hi << (np.uint64(64) - k)), hi >> k
+
+def _xorshift(x, k):
+    y = _shr(x, k)
+    if isinstance(x, tuple):
+        return x[0] ^ y[0], x[1] ^ y[1]
+    return x ^ y
+
+def _low(x, dtype):
+    # the low bits of x, as dtype
+    if isinstance(x, tuple):
+        x = x[0]
+    return x.astype(dtype)
+
+def _top(x, bits, k, dtype):
+    # the top k of the bits of x, as dtype
+    if not k:
+        return np.zeros(len(x[0]) if isinstance(x, tuple) else len(x), dtype)
+    return _low(_shr(x, bits - k), dtype) & dtype((1 << k) - 1)
+
+def _rotr(x, rot, bits):
+    dtype = x.dtype.type
+    return (x >> rot) | (x << ((dtype(bits) - rot) & dtype(bits - 1)))
+
+def _xsh_rs(x, bits, xtypebits):
+    xdtype = _word_dtypes[xtypebits]
+    sparebits = bits - xtypebits
+    opbits = (
+            5 if sparebits-5 >= 64 else
+            4 if sparebits-4 >= 32 else
+            3 if sparebits-3 >= 16 else
+            2 if sparebits-2 >= 4 else
+            1 if sparebits-1 >= 1 else
+            0
+    )
+    maxrandshift = (1 << opbits) - 1
+    topspare = opbits
+    bottomspare = sparebits - topspare
+    xshift = topspare + (xtypebits+maxrandshift)//2
+    rshift = _top(x, bits, opbits, xdtype)
+    x = _xorshift(x, xshift)
+    return _low(_shr(x, xdtype(bottomspare - maxrandshift) + rshift), xdtype)
+
+def _xsh_rr(x, bits, xtypebits, topspare=None):
+    xdtype = _word_dtypes[xtypebits]
+    sparebits = bits - xtypebits
+    wantedopbits = (
+            6 if xtypebits >= 64 else
+            5 if xtypebits >= 32 else
+            4 if xtypebits >= 16 else
+            3
+    )
+    opbits = min(sparebits, wantedopbits)
+    amplifier = wantedopbits - opbits
+    mask = xdtype((1 << opbits) - 1)
+    if topspare is None:
+        topspare = opbits
+    bottomspare = sparebits - topspare
+    xshift = (topspare + xtypebits)//2
+    rot = _top(x, bits, opbits, xdtype)
+    amprot = (rot << xdtype(amplifier)) & mask
+    x = _xorshift(x, xshift)
+    return _rotr(_low(_shr(x, bottomspare), xdtype), amprot, xtypebits)
+
+def _xsl_rr(x, bits, xtypebits):
+    # XSL RR is XSH RR with all the spare bits on top
+    return _xsh_rr(x, bits, xtypebits, topspare=bits - xtypebits)
+
+_mcg_multipliers = {itype.BITS: int(mult) for itype, mult in pcg_detail.mcg_multiplier_data.items()}
+
+def _rxs_m_xs(x, bits, xtypebits, last=True):
+    dtype = x.dtype.type
+    xdtype = _word_dtypes[xtypebits]
+    opbits = (
+            5 if xtypebits >= 64 else
+            4 if xtypebits >= 32 else
+            3 if xtypebits >= 16 else
+            2
+    )
+    rshift = _top(x, bits, opbits, dtype)
+    x = x ^ (x >> (rshift + dtype(opbits)))
+    x = x * dtype(_mcg_multipliers[bits])
+    result = (x >> dtype(bits - xtypebits)).astype(xdtype)
+    if last:
+        result ^= result >> xdtype((2*xtypebits+2)//3)
+    return result
+
+def _rxs_m(x, bits, xtypebits):
+    return _rxs_m_xs(x, bits, xtypebits, last=False)
+
+def _xsl_rr_rr(x, bits, xtypebits):
+    dtype = x.dtype.type
+    htypebits = bits // 2
+    hdtype = _word_dtypes[htypebits]
+    wantedopbits = (
+            6 if htypebits >= 64 else
+            5 if htypebits >= 32 else
+            4 if htypebits >= 16 else
+            3
+    )
+    opbits = min(htypebits, wantedopbits)
+    amplifier = wantedopbits - opbits
+    mask = hdtype((1 << opbits) - 1)
+    rot = _top(x, bits, opbits, hdtype)
+    amprot = (rot << hdtype(amplifier)) & mask
+    x = x ^ (x >> dtype(htypebits))
+    lowbits = _rotr(x.astype(hdtype), amprot, htypebits)
+    highbits = (x >> dtype(htypebits)).astype(hdtype)
+    amprot2 = ((lowbits & mask) << hdtype(amplifier)) & mask
+    highbits = _rotr(highbits, amprot2, htypebits)
+    return (highbits.astype(dtype) << dtype(htypebits)) ^ lowbits.astype(dtype)
+
+def _xsh(x, bits, xtypebits):
+    sparebits = bits - xtypebits
+    x = _xorshift(x, xtypebits // 2)
+    return _low(_shr(x, sparebits), _word_dtypes[xtypebits])
+
+def _xsl(x, bits, xtypebits):
+    x = _xorshift(x, bits // 2)
+    return _low(x, _word_dtypes[xtypebits])
+
+# Those that work on (low, high) pairs as well.
+_wide_outputs = {
+        pcg_detail.xsh_rs_mixin: _xsh_rs,
+        pcg_detail.xsh_rr_mixin: _xsh_rr,
+        pcg_detail.xsl_rr_mixin: _xsl_rr,
+        pcg_detail.xsh_mixin: _xsh,
+        pcg_detail.xsl_mixin: _xsl,
+}
+
+_outputs = dict(_wide_outputs)
+_outputs.update({
+        pcg_detail.rxs_m_xs_mixin: _rxs_m_xs,
+        pcg_detail.rxs_m_mixin: _rxs_m,
+        pcg_detail.xsl_rr_rr_mixin: _xsl_rr_rr,
+})
+
+def lcg_outputs(engine, state, n, mult, plus):
+    ''' n outputs of an Engine's output function, over the LCG with the
+        given multiplier and increment (its own, or those of a stride)
+        starting from state, and the int state after them.
+
+        Returns None if there is no array version for the engine.
+    '''
+    bits = engine.itype.BITS
+    xtypebits = engine.xtype.BITS
+    output = (_outputs if bits <= 64 else _wide_outputs).get(engine.output_mixin)
+    if output is None or bits > 128 or xtypebits not in _word_dtypes:
+        return None
+    if bits <= 64 and bits not in _word_dtypes:
+        return None
+    states = _lcg_states(state, n, mult, plus, bits)
+    if bits <= 64:
+        last = int(states[n])
+        run = states[:n]
+    else:
+        last = int(states[0][n]) | int(states[1][n]) << 64
+        run = states[0][:n], states[1][:n]
+    step = int(engine._multiplier()), int(engine.increment())
+    with np.errstate(over='ignore'):
+        if not engine.output_previous:
+            # the output is of one step of the engine itself, even when
+            # the run goes by a stride
+            if (mult, plus) == step:
+                run = states[1:] if bits <= 64 else (states[0][1:], states[1][1:])
+            elif bits <= 64:
+                dtype = run.dtype.type
+                run = run * dtype(step[0]) + dtype(step[1])
+            else:
+                a = (np.uint64(step[0] & 0xffffffffffffffff), np.uint64(step[0] >> 64))
+                c = (np.uint64(step[1] & 0xffffffffffffffff), np.uint64(step[1] >> 64))
+                run = _add128(_mul128(run, a), c)
+        return output(run, bits, xtypebits), last
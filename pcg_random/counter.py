@@ -0,0 +1,150 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Stateless, counter-based random numbers.
+
+    Instead of an engine's state, each output is a function of a key and
+    a counter: one LCG step of (counter + offset(key)), passed through a
+    PCG output function. With a permuting output function, such as
+    RXS M XS, the counters of any one key map to distinct outputs.
+
+    Since nothing is carried from one value to the next, any value can be
+    computed anywhere, in any order; e.g. hash(user_id, day).
+'''
+
+import functools
+import hashlib
+
+from . import pcg_detail
+from .ints import uint32_t, uint64_t
+from .pcg_extras import SeedSequence, _seed_material
+
+
+class CounterHash:
+    ''' Maps (key, counter) to an output of xtype, under a seed.
+
+        Keys that are ints in range(itype.MOD) are used directly (and so
+        are the values in vectorized calls); any other key, such as a str
+        or a tuple, is first hashed to such an int. Counters are reduced
+        modulo itype.MOD.
+    '''
+    __slots__ = ('itype', 'xtype', 'output_mixin', 'key_add', 'increment', '_output', '_mult')
+
+    def __init__(self, seed=None, itype=uint64_t, output_mixin=pcg_detail.rxs_m_xs_mixin, xtype=None):
+        if not isinstance(seed, SeedSequence):
+            seed = SeedSequence(seed)
+        key_add, increment = seed.generate(itype, 2)
+        self._init(itype, output_mixin, xtype, int(key_add), int(increment))
+
+    @classmethod
+    def from_words(cls, itype, output_mixin, xtype, key_add, increment):
+        ''' Rebuild from the words the seed produced.
+        '''
+        self = cls.__new__(cls)
+        self._init(itype, output_mixin, xtype, key_add, increment)
+        return self
+
+    def _init(self, itype, output_mixin, xtype, key_add, increment):
+        if xtype is None:
+            xtype = itype
+        engine = pcg_detail.oneseq_base(xtype, itype, output_mixin, seed=False)
+        self.itype = itype
+        self.xtype = xtype
+        self.output_mixin = output_mixin
+        self.key_add = key_add & itype.MASK
+        self.increment = (increment | 1) & itype.MASK
+        self._output = engine._output
+        self._mult = pcg_detail.default_multiplier_data[itype]
+
+    def __reduce__(self):
+        return (CounterHash.from_words, (self.itype, self.output_mixin, self.xtype, self.key_add, self.increment))
+
+    def __eq__(self, other):
+        if not isinstance(other, CounterHash):
+            return NotImplemented
+        return self.__reduce__() == other.__reduce__()
+
+    def __repr__(self):
+        return '<CounterHash %s -> %s, %s>' % (self.itype.__name__, self.xtype.__name__, self.output_mixin.__name__)
+
+    def _key_word(self, key):
+        itype = self.itype
+        if not (isinstance(key, int) and not isinstance(key, bool) and 0 <= key < itype.MOD):
+            digest = hashlib.blake2b(_seed_material(key), digest_size=itype.BYTES, person=b'pcg_counter')
+            key = int.from_bytes(digest.digest(), 'little')
+        return key
+
+    def offset(self, key):
+        ''' The starting point of the key's counters.
+        '''
+        itype = self.itype
+        x = (self._key_word(key) * self._mult + self.key_add) & itype.MASK
+        return int(self._output(itype(x)))
+
+    def __call__(self, key, counter=0):
+        itype = self.itype
+        x = ((counter + self.offset(key)) * self._mult + self.increment) & itype.MASK
+        return self._output(itype(x))
+
+    def random(self, key, counter=0):
+        ''' A float in [0, 1), from the top 53 bits of the output.
+        '''
+        bits = self.xtype.BITS
+        if bits < 53:
+            raise TypeError('Need at least 53 output bits')
+        return (int(self(key, counter)) >> (bits - 53)) * 2.0 ** -53
+
+    def array(self, keys, counters):
+        ''' Vectorized __call__ over broadcast NumPy arrays of integer keys
+            and counters, for 32- or 64-bit RXS M XS.
+        '''
+        import numpy as np
+        itype = self.itype
+        dtype = _numpy_dtype(itype)
+        if dtype is None or self.output_mixin is not pcg_detail.rxs_m_xs_mixin or self.xtype is not itype:
+            raise TypeError('Only 32- and 64-bit RXS M XS are vectorized')
+        keys = np.asarray(keys)
+        counters = np.asarray(counters)
+        if keys.dtype.kind not in 'ui' or counters.dtype.kind not in 'ui':
+            raise TypeError('Keys and counters must be integer arrays')
+        if keys.size and (keys.min() < 0 or (keys.dtype.itemsize > itype.BYTES and keys.max() > itype.MASK)):
+            raise ValueError('Keys must be in range(%d)' % itype.MOD)
+        mult = dtype(self._mult)
+        with np.errstate(over='ignore'):
+            offsets = _rxs_m_xs(keys.astype(dtype) * mult + dtype(self.key_add), itype)
+            x = (counters.astype(dtype) + offsets) * mult + dtype(self.increment)
+            return _rxs_m_xs(x, itype)
+
+
+@functools.lru_cache(None)
+def _numpy_dtype(itype):
+    # Looked up on first use, so that importing this module does not
+    # import NumPy.
+    import numpy as np
+    return {uint32_t: np.uint32, uint64_t: np.uint64}.get(itype)
+
+
+def _rxs_m_xs(x, itype):
+    # rxs_m_xs_mixin.output, for arrays where itype is xtype
+    dtype = x.dtype.type
+    bits = itype.BITS
+    opbits = 5 if bits >= 64 else 4
+    rshift = (x >> dtype(bits - opbits)) & dtype((1 << opbits) - 1)
+    x = x ^ (x >> (rshift + dtype(opbits)))
+    x = x * dtype(pcg_detail.mcg_multiplier_data[itype])
+    return x ^ (x >> dtype((2*bits + 2) // 3))
@@ -0,0 +1,458 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Discrete distributions, drawn from a PcgRandom.
+
+    Small parameters use inversion of a cumulative table; large ones use
+    the usual rejection algorithms:
+
+        binomial        BTPE (Kachitvichyanukul and Schmeiser, 1988)
+        poisson         PTRS (Hoermann, 1993)
+        hypergeometric  HRUA (Stadlober, 1989)
+
+    AliasTable samples from an arbitrary finite distribution in constant
+    time per draw.
+
+    The setup for each set of parameters is cached, so repeated draws with
+    the same parameters skip it. Pass `size` to get a NumPy array; table
+    lookups are then vectorized.
+'''
+
+import bisect
+import collections
+import functools
+import math
+import threading
+
+
+_CACHE_SIZE = 128
+
+
+def _count(size):
+    import numpy as np
+    return int(np.prod(size))
+
+def _invert(rng, cdf, size):
+    # Smallest k with U < cdf[k]; U past the end of the table is redrawn.
+    if size is None:
+        while True:
+            k = bisect.bisect_right(cdf, rng.random())
+            if k < len(cdf):
+                return k
+    import numpy as np
+    n = _count(size)
+    table = np.asarray(cdf)
+    rv = np.searchsorted(table, rng.random_array(n), side='right')
+    while True:
+        bad = np.flatnonzero(rv >= len(table))
+        if not len(bad):
+            break
+        rv[bad] = np.searchsorted(table, rng.random_array(len(bad)), side='right')
+    return rv.astype(np.int64).reshape(size)
+
+def _repeat(sample, size):
+    import numpy as np
+    n = _count(size)
+    return np.fromiter((sample() for _ in range(n)), np.int64, n).reshape(size)
+
+def _cumulative(pmf):
+    total = 0.0
+    cdf = []
+    for p in pmf:
+        total += p
+        cdf.append(total)
+    return tuple(cdf)
+
+
+# Binomial
+
+def binomial(rng, n, p, size=None):
+    ''' Number of successes in n trials of probability p.
+    '''
+    if not (isinstance(n, int) and n >= 0):
+        raise ValueError('n must be a non-negative int')
+    if not 0.0 <= p <= 1.0:
+        raise ValueError('p must be in [0, 1]')
+    r = min(p, 1.0 - p)
+    if n == 0 or r == 0.0:
+        value = n if p > 0.5 else 0
+        if size is None:
+            return value
+        import numpy as np
+        return np.full(size, value, np.int64)
+    if n * r <= 30.0:
+        rv = _invert(rng, _binomial_table(n, r), size)
+    elif size is None:
+        rv = _btpe(rng, n, r)
+    else:
+        rv = _repeat(lambda: _btpe(rng, n, r), size)
+    return n - rv if p > 0.5 else rv
+
+@functools.lru_cache(_CACHE_SIZE)
+def _binomial_table(n, p):
+    q = 1.0 - p
+    bound = int(min(n, n*p + 10.0*math.sqrt(n*p*q + 1)))
+    pmf = [math.exp(n * math.log(q))]
+    for x in range(1, bound + 1):
+        pmf.append(pmf[-1] * (n - x + 1) * p / (x * q))
+    return _cumulative(pmf)
+
+@functools.lru_cache(_CACHE_SIZE)
+def _btpe_setup(n, r):
+    q = 1.0 - r
+    fm = n*r + r
+    m = int(math.floor(fm))
+    p1 = math.floor(2.195*math.sqrt(n*r*q) - 4.6*q) + 0.5
+    xm = m + 0.5
+    xl = xm - p1
+    xr = xm + p1
+    c = 0.134 + 20.5/(15.3 + m)
+    a = (fm - xl)/(fm - xl*r)
+    laml = a*(1.0 + a/2.0)
+    a = (xr - fm)/(xr*q)
+    lamr = a*(1.0 + a/2.0)
+    p2 = p1*(1.0 + 2.0*c)
+    p3 = p2 + c/laml
+    p4 = p3 + c/lamr
+    return q, m, p1, xm, xl, xr, c, laml, lamr, p2, p3, p4
+
+def _stirling(x):
+    x2 = x * x
+    return (13680.0 - (462.0 - (132.0 - (99.0 - 140.0/x2)/x2)/x2)/x2)/x/166320.0
+
+def _btpe(rng, n, r):
+    # Requires r <= 0.5 and n*r > 30.
+    q, m, p1, xm, xl, xr, c, laml, lamr, p2, p3, p4 = _btpe_setup(n, r)
+    nrq = n * r * q
+    random = rng.random
+    while True:
+        u = random() * p4
+        v = random()
+        if v == 0.0:
+            continue
+        if u <= p1:
+            # triangular center: always accepted
+            return int(math.floor(xm - p1*v + u))
+        if u <= p2:
+            x = xl + (u - p1)/c
+            v = v*c + 1.0 - abs(m - x + 0.5)/p1
+            if v > 1.0:
+                continue
+            y = int(math.floor(x))
+        elif u <= p3:
+            y = int(math.floor(xl + math.log(v)/laml))
+            if y < 0:
+                continue
+            v = v*(u - p2)*laml
+        else:
+            y = int(math.floor(xr - math.log(v)/lamr))
+            if y > n:
+                continue
+            v = v*(u - p3)*lamr
+
+        k = abs(y - m)
+        if not (20 < k < nrq/2.0 - 1):
+            # explicit evaluation of the pmf ratio
+            s = r/q
+            a = s*(n + 1)
+            F = 1.0
+            if m < y:
+                for i in range(m + 1, y + 1):
+                    F *= a/i - s
+            elif m > y:
+                for i in range(y + 1, m + 1):
+                    F /= a/i - s
+            if v <= F:
+                return y
+            continue
+
+        # squeeze, then the final Stirling-approximated test
+        rho = (k/nrq)*((k*(k/3.0 + 0.625) + 0.1666666666666)/nrq + 0.5)
+        t = -k*k/(2.0*nrq)
+        if v <= 0.0:
+            continue
+        A = math.log(v)
+        if A < t - rho:
+            return y
+        if A > t + rho:
+            continue
+        x1 = y + 1.0
+        f1 = m + 1.0
+        z = n + 1.0 - m
+        w = n - y + 1.0
+        if A <= (xm*math.log(f1/x1) + (n - m + 0.5)*math.log(z/w)
+                + (y - m)*math.log(w*r/(x1*q))
+                + _stirling(f1) + _stirling(z) + _stirling(x1) + _stirling(w)):
+            return y
+
+
+# Poisson
+
+def poisson(rng, lam, size=None):
+    ''' Number of events, for a Poisson process with mean lam.
+    '''
+    if not lam >= 0.0:
+        raise ValueError('lam must be non-negative')
+    if lam == 0.0:
+        if size is None:
+            return 0
+        import numpy as np
+        return np.zeros(size, np.int64)
+    if lam < 10.0:
+        return _invert(rng, _poisson_table(lam), size)
+    if size is None:
+        return _ptrs(rng, lam)
+    return _repeat(lambda: _ptrs(rng, lam), size)
+
+@functools.lru_cache(_CACHE_SIZE)
+def _poisson_table(lam):
+    bound = int(lam + 10.0*math.sqrt(lam) + 10.0)
+    pmf = [math.exp(-lam)]
+    for k in range(1, bound + 1):
+        pmf.append(pmf[-1] * lam / k)
+    return _cumulative(pmf)
+
+@functools.lru_cache(_CACHE_SIZE)
+def _ptrs_setup(lam):
+    slam = math.sqrt(lam)
+    loglam = math.log(lam)
+    b = 0.931 + 2.53*slam
+    a = -0.059 + 0.02483*b
+    invalpha = 1.1239 + 1.1328/(b - 3.4)
+    vr = 0.9277 - 3.6224/(b - 2)
+    return loglam, a, b, math.log(invalpha), vr
+
+def _ptrs(rng, lam):
+    # Transformed rejection with squeeze; requires lam >= 10.
+    loglam, a, b, loginvalpha, vr = _ptrs_setup(lam)
+    random = rng.random
+    while True:
+        U = random() - 0.5
+        V = random()
+        us = 0.5 - abs(U)
+        if us == 0.0 or V == 0.0:
+            continue
+        k = int(math.floor((2*a/us + b)*U + lam + 0.43))
+        if us >= 0.07 and V <= vr:
+            return k
+        if k < 0 or (us < 0.013 and V > us):
+            continue
+        if (math.log(V) + loginvalpha - math.log(a/(us*us) + b)
+                <= -lam + k*loglam - math.lgamma(k + 1)):
+            return k
+
+
+# Geometric
+
+def geometric(rng, p, size=None):
+    ''' Number of trials up to and including the first success.
+    '''
+    if not 0.0 < p <= 1.0:
+        raise ValueError('p must be in (0, 1]')
+    if p == 1.0:
+        if size is None:
+            return 1
+        import numpy as np
+        return np.ones(size, np.int64)
+    # P(X > k) = (1-p)**k, so invert with V = 1 - U in (0, 1].
+    log_q = math.log1p(-p)
+    if size is None:
+        return 1 + int(math.log(1.0 - rng.random()) / log_q)
+    import numpy as np
+    n = _count(size)
+    u = rng.random_array(n)
+    return (1 + np.floor(np.log(1.0 - u) / log_q)).astype(np.int64).reshape(size)
+
+
+# Hypergeometric
+
+def hypergeometric(rng, ngood, nbad, nsample, size=None):
+    ''' Number of good items, in nsample drawn without replacement.
+    '''
+    for v in (ngood, nbad, nsample):
+        if not (isinstance(v, int) and v >= 0):
+            raise ValueError('Parameters must be non-negative ints')
+    if nsample > ngood + nbad:
+        raise ValueError('nsample must be at most ngood + nbad')
+    low = max(0, nsample - nbad)
+    high = min(nsample, ngood)
+    if high - low < _HYPERGEOMETRIC_TABLE_MAX:
+        low, cdf = _hypergeometric_table(ngood, nbad, nsample)
+        return low + _invert(rng, cdf, size)
+    if size is None:
+        return _hrua(rng, ngood, nbad, nsample)
+    return _repeat(lambda: _hrua(rng, ngood, nbad, nsample), size)
+
+# Above this many possible outcomes, use rejection rather than a table.
+_HYPERGEOMETRIC_TABLE_MAX = 1000
+
+def _log_choose(n, k):
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+@functools.lru_cache(_CACHE_SIZE)
+def _hypergeometric_table(ngood, nbad, nsample):
+    low = max(0, nsample - nbad)
+    high = min(nsample, ngood)
+    log_total = _log_choose(ngood + nbad, nsample)
+    pmf = [math.exp(_log_choose(ngood, k) + _log_choose(nbad, nsample - k) - log_total)
+            for k in range(low, high + 1)]
+    cdf = _cumulative(pmf)
+    # Normalize so that rounding can't leave a gap at the top.
+    return low, tuple(c / cdf[-1] for c in cdf)
+
+_HRUA_D1 = 1.7155277699214135   # 2 * sqrt(2 / e)
+_HRUA_D2 = 0.8989161620588988   # 3 - 2 * sqrt(3 / e)
+
+@functools.lru_cache(_CACHE_SIZE)
+def _hrua_setup(ngood, nbad, nsample):
+    popsize = ngood + nbad
+    small = min(ngood, nbad)
+    large = max(ngood, nbad)
+    m = min(nsample, popsize - nsample)
+    d4 = small / popsize
+    d5 = 1.0 - d4
+    d6 = m*d4 + 0.5
+    d7 = math.sqrt((popsize - m) * nsample * d4 * d5 / (popsize - 1) + 0.5)
+    d8 = _HRUA_D1*d7 + _HRUA_D2
+    d9 = (m + 1) * (small + 1) // (popsize + 2)
+    d10 = (math.lgamma(d9 + 1) + math.lgamma(small - d9 + 1)
+            + math.lgamma(m - d9 + 1) + math.lgamma(large - m + d9 + 1))
+    # 16 standard deviations is past double precision
+    d11 = min(min(m, small) + 1.0, math.floor(d6 + 16*d7))
+    return small, large, m, d6, d8, d10, d11
+
+def _hrua(rng, ngood, nbad, nsample):
+    # Ratio of uniforms, for the smaller of the good and bad counts drawn
+    # in the smaller of the sample and its complement.
+    small, large, m, d6, d8, d10, d11 = _hrua_setup(ngood, nbad, nsample)
+    random = rng.random
+    while True:
+        X = random()
+        Y = random()
+        if X == 0.0:
+            continue
+        W = d6 + d8*(Y - 0.5)/X
+        if not 0.0 <= W < d11:
+            continue
+        Z = int(math.floor(W))
+        T = d10 - (math.lgamma(Z + 1) + math.lgamma(small - Z + 1)
+                + math.lgamma(m - Z + 1) + math.lgamma(large - m + Z + 1))
+        if X*(4.0 - X) - 3.0 <= T:
+            break
+        if X*(X - T) >= 1.0:
+            continue
+        if 2.0*math.log(X) <= T:
+            break
+    if ngood > nbad:
+        Z = m - Z
+    if m < nsample:
+        Z = ngood - Z
+    return Z
+
+
+# Arbitrary finite distributions
+
+class AliasTable:
+    ''' Walker's alias method, using Vose's construction.
+
+        Setup is O(n); each draw is then one bounded draw to pick a column
+        and one float compare to pick between it and its alias.
+    '''
+    __slots__ = ('prob', 'alias')
+
+    _cache = collections.OrderedDict()
+    _cache_lock = threading.Lock()
+    cache_size = 32
+
+    def __init__(self, weights):
+        if hasattr(weights, 'tolist'):
+            weights = weights.tolist()
+        weights = [float(w) for w in weights]
+        n = len(weights)
+        if not n:
+            raise ValueError('Need at least one weight')
+        if not all(0.0 <= w < math.inf for w in weights):
+            raise ValueError('Weights must be finite and non-negative')
+        total = math.fsum(weights)
+        if not total > 0.0:
+            raise ValueError('Total of weights must be greater than zero')
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Anything left over is 1 up to rounding.
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self):
+        return len(self.prob)
+
+    def __repr__(self):
+        return '<AliasTable of %d>' % len(self.prob)
+
+    @classmethod
+    def cached(cls, weights):
+        ''' Like the constructor, but reuse a recently built table.
+
+            Tables are keyed by the weights' values; NumPy arrays are keyed
+            by their bytes, so that no conversion is needed to look up.
+        '''
+        if hasattr(weights, 'tobytes') and hasattr(weights, 'dtype'):
+            key = (weights.dtype.str, weights.shape, weights.tobytes())
+        else:
+            key = tuple(weights)
+        cache = cls._cache
+        with cls._cache_lock:
+            table = cache.get(key)
+            if table is not None:
+                cache.move_to_end(key)
+                return table
+        table = cls(weights)
+        with cls._cache_lock:
+            cache[key] = table
+            while len(cache) > cls.cache_size:
+                cache.popitem(last=False)
+        return table
+
+    def sample(self, rng, size=None):
+        ''' An index, drawn from a PcgRandom with probability proportional
+            to its weight.
+
+            If size is given, a NumPy array of indices; the columns are then
+            taken from random_array() floats, as InverseCDF does, so the
+            sequence differs from that of repeated scalar draws.
+        '''
+        prob = self.prob
+        if size is None:
+            i = rng.randrange(len(prob))
+            return i if rng.random() < prob[i] else self.alias[i]
+        import numpy as np
+        count = _count(size)
+        n = len(prob)
+        cols = (rng.random_array(count) * n).astype(np.intp)
+        keep = rng.random_array(count) < np.asarray(prob)[cols]
+        rv = np.where(keep, cols, np.asarray(self.alias, np.intp)[cols])
+        return rv.astype(np.int64).reshape(size)
@@ -0,0 +1,188 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Shuffle the records of a file that may be much larger than memory.
+
+    Records are either lines or fixed-size blocks. A file larger than the
+    leaf size is scattered, one record at a time, into `fanout` bucket
+    files chosen uniformly at random; each bucket is then shuffled the same
+    way (recursively), and the results are concatenated. Buckets that fit
+    in the leaf size are read into memory and permuted directly. This
+    produces a uniformly random permutation of the records.
+
+    Every random choice comes from an engine seeded by a SeedSequence whose
+    spawn key names the bucket, so the output depends only on the input,
+    the seed, the leaf size and the fan-out; not on the buffer size, the
+    temporary directory, or whether NumPy is installed.
+'''
+
+import array
+import mmap
+import os
+import shutil
+import tempfile
+
+from . import pcg_extras
+from .pcg_engines import setseq_xsl_rr_128_64 as pcg64
+from .pcg_extras import SeedSequence
+
+
+LEAF_BYTES = 64 << 20
+FANOUT = 256
+
+
+def _records(view, record_size):
+    # An unterminated last line gets its newline, so that records can
+    # always be concatenated.
+    size = len(view)
+    if record_size:
+        if size % record_size:
+            raise ValueError('File size is not a multiple of the record size')
+        for pos in range(0, size, record_size):
+            yield view[pos:pos + record_size]
+        return
+    pos = 0
+    while pos < size:
+        end = view.find(b'\n', pos)
+        if end < 0:
+            yield view[pos:] + b'\n'
+            return
+        yield view[pos:end + 1]
+        pos = end + 1
+
+def _line_starts(view):
+    size = len(view)
+    find = view.find
+    pos = 0
+    while pos < size:
+        yield pos
+        end = find(b'\n', pos)
+        if end < 0:
+            return
+        pos = end + 1
+
+
+class _Shuffler:
+    def __init__(self, seed, record_size, leaf_bytes, fanout, buffer_bytes, workdir, engine):
+        self.seed = seed
+        self.record_size = record_size
+        self.leaf_bytes = leaf_bytes
+        self.fanout = fanout
+        self.buffer_bytes = buffer_bytes
+        self.workdir = workdir
+        self.engine = engine
+
+    def _engine(self, key, role):
+        return self.engine(SeedSequence(self.seed, spawn_key=key + (role,)))
+
+    def shuffle(self, path, out, key=(), count=None):
+        size = os.path.getsize(path)
+        if not size:
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if size <= self.leaf_bytes or count == 1:
+                self._leaf(view, out, key)
+                return
+            buckets = self._scatter(view, key)
+        for i, (bucket, n) in enumerate(buckets):
+            self.shuffle(bucket, out, key + (i,), n)
+            os.remove(bucket)
+
+    def _scatter(self, view, key):
+        fanout = self.fanout
+        choose = pcg_extras.PackedBounded(self._engine(key, 'scatter'), fanout)
+        buffering = max(4096, self.buffer_bytes // fanout)
+        prefix = os.path.join(self.workdir, '-'.join(map(str, key)) or 'root')
+        paths = ['%s.%d' % (prefix, i) for i in range(fanout)]
+        counts = [0] * fanout
+        files = [open(p, 'wb', buffering=buffering) for p in paths]
+        try:
+            writes = [f.write for f in files]
+            for record in _records(view, self.record_size):
+                i = choose()
+                writes[i](record)
+                counts[i] += 1
+        finally:
+            for f in files:
+                f.close()
+        return list(zip(paths, counts))
+
+    def _leaf(self, view, out, key):
+        # Shuffle the records' offsets rather than the records themselves;
+        # the same swaps give the same order either way.
+        record_size = self.record_size
+        size = len(view)
+        if record_size:
+            if size % record_size:
+                raise ValueError('File size is not a multiple of the record size')
+            starts = array.array('Q', range(0, size, record_size))
+        else:
+            starts = array.array('Q', _line_starts(view))
+        pcg_extras.packed_shuffle(starts, self._engine(key, 'leaf'))
+        if record_size:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+            else:
+                # gather whole rows at once, a buffer's worth at a time
+                table = np.frombuffer(view, np.uint8).reshape(-1, record_size)
+                rows = np.frombuffer(starts, np.uint64) // np.uint64(record_size)
+                step = max(1, self.buffer_bytes // record_size)
+                for lo in range(0, len(rows), step):
+                    out.write(table[rows[lo:lo + step].astype(np.intp)].tobytes())
+                del table
+                return
+        find = view.find
+        pending = []
+        pending_bytes = 0
+        for start in starts:
+            if record_size:
+                record = view[start:start + record_size]
+            else:
+                end = find(b'\n', start)
+                record = view[start:end + 1] if end >= 0 else view[start:] + b'\n'
+            pending.append(record)
+            pending_bytes += len(record)
+            if pending_bytes >= self.buffer_bytes:
+                out.write(b''.join(pending))
+                pending = []
+                pending_bytes = 0
+        out.write(b''.join(pending))
+
+
+def shuffle_file(src, dst, seed, record_size=None, *,
+        leaf_bytes=LEAF_BYTES, fanout=FANOUT, buffer_bytes=1 << 20,
+        tmpdir=None, engine=pcg64):
+    ''' Write the records of src to dst in a random order.
+
+        Records are lines, or blocks of record_size bytes. Each leaf of up
+        to leaf_bytes is mapped rather than read, so RAM use is about
+        buffer_bytes plus 8 bytes per record of a leaf; temporary files, in
+        tmpdir, take up to twice the size of the input.
+    '''
+    if record_size is not None and not record_size > 0:
+        raise ValueError('Record size must be positive')
+    if not fanout > 1:
+        raise ValueError('Fan-out must be at least 2')
+    with tempfile.TemporaryDirectory(prefix='pcg-shuffle-', dir=tmpdir) as workdir:
+        shuffler = _Shuffler(seed, record_size, leaf_bytes, fanout, buffer_bytes, workdir, engine)
+        tmp = os.path.join(workdir, 'output')
+        with open(tmp, 'wb', buffering=buffer_bytes) as out:
+            shuffler.shuffle(src, out)
+        shutil.move(tmp, dst)
@@ -0,0 +1,160 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Sampling from arbitrary distributions by inverting their CDF.
+
+    The quantile function is tabulated once, at evenly spaced
+    probabilities, so that each sample is a direct index and a linear
+    interpolation; no search is needed. The table size trades accuracy
+    for memory: for a smooth density the interpolation error shrinks with
+    the square of the size.
+'''
+
+import bisect
+import math
+
+
+class InverseCDF:
+    ''' Quantiles at probabilities 0, 1/size, ..., 1, linearly interpolated.
+
+        Instances are immutable and pickle as just their table, so they can
+        be built once and shipped to workers.
+    '''
+    __slots__ = ('quantiles',)
+
+    def __init__(self, quantiles):
+        quantiles = tuple(float(q) for q in quantiles)
+        if len(quantiles) < 2:
+            raise ValueError('Need at least 2 quantiles')
+        if not all(math.isfinite(q) for q in quantiles):
+            raise ValueError('Quantiles must be finite')
+        if any(a > b for a, b in zip(quantiles, quantiles[1:])):
+            raise ValueError('Quantiles must be non-decreasing')
+        self.quantiles = quantiles
+
+    @classmethod
+    def from_samples(cls, samples, size=1024):
+        ''' Tabulate the empirical distribution of some samples.
+
+            Between order statistics, the empirical quantile function is
+            interpolated linearly.
+        '''
+        xs = sorted(float(x) for x in samples)
+        if not xs:
+            raise ValueError('Need at least one sample')
+        last = len(xs) - 1
+        if not last:
+            return cls(xs * (size + 1))
+        quantiles = []
+        for i in range(size + 1):
+            pos = i * last / size
+            j = min(int(pos), last - 1)
+            quantiles.append(xs[j] + (xs[j + 1] - xs[j]) * (pos - j))
+        return cls(quantiles)
+
+    @classmethod
+    def from_cdf(cls, cdf, lo, hi, size=1024, tol=1e-12):
+        ''' Tabulate the inverse of a non-decreasing function cdf, which
+            must reach 0 at lo and 1 at hi (truncate infinite tails there).
+
+            Each quantile is found by bisection to within tol; since the
+            probabilities increase, each search starts from the previous
+            result.
+        '''
+        if not lo < hi:
+            raise ValueError('Need lo < hi')
+        quantiles = [float(lo)]
+        left = float(lo)
+        for i in range(1, size):
+            u = i / size
+            a, b = left, float(hi)
+            while b - a > tol:
+                mid = a + (b - a) / 2
+                if mid <= a or mid >= b:
+                    break
+                if cdf(mid) < u:
+                    a = mid
+                else:
+                    b = mid
+            quantiles.append(b)
+            left = a
+        quantiles.append(float(hi))
+        return cls(quantiles)
+
+    @property
+    def size(self):
+        return len(self.quantiles) - 1
+
+    def __eq__(self, other):
+        if not isinstance(other, InverseCDF):
+            return NotImplemented
+        return self.quantiles == other.quantiles
+
+    def __hash__(self):
+        return hash(self.quantiles)
+
+    def __reduce__(self):
+        return (InverseCDF, (self.quantiles,))
+
+    def __repr__(self):
+        return '<InverseCDF of size %d on [%r, %r]>' % (self.size, self.quantiles[0], self.quantiles[-1])
+
+    def ppf(self, u):
+        ''' The interpolated quantile at probability u, in [0, 1].
+        '''
+        q = self.quantiles
+        x = u * (len(q) - 1)
+        i = min(int(x), len(q) - 2)
+        return q[i] + (q[i + 1] - q[i]) * (x - i)
+
+    def cdf(self, x):
+        ''' The inverse of ppf(), i.e. the distribution actually sampled.
+        '''
+        q = self.quantiles
+        if x < q[0]:
+            return 0.0
+        if x >= q[-1]:
+            return 1.0
+        i = bisect.bisect_right(q, x) - 1
+        return (i + (x - q[i]) / (q[i + 1] - q[i])) / (len(q) - 1)
+
+    def max_error(self, cdf):
+        ''' The largest difference between the probability of each cell's
+            midpoint and cdf() of its interpolated quantile.
+
+            A cheap estimate of whether the table is large enough.
+        '''
+        n = self.size
+        return max(abs(cdf(self.ppf((i + 0.5) / n)) - (i + 0.5) / n) for i in range(n))
+
+    def sample(self, rng, size=None):
+        ''' Draw from a PcgRandom, using one random() per sample.
+
+            If size is given, return a NumPy array, with the same values as
+            repeated scalar calls.
+        '''
+        if size is None:
+            return self.ppf(rng.random())
+        import numpy as np
+        count = int(np.prod(size))
+        q = np.asarray(self.quantiles)
+        n = len(q) - 1
+        x = rng.random_array(count) * n
+        i = np.minimum(x.astype(np.intp), n - 1)
+        rv = q[i] + (q[i + 1] - q[i]) * (x - i)
+        return rv.reshape(size)
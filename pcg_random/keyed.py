@@ -0,0 +1,179 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' One engine per key, derived from a master seed, with bounded residency.
+'''
+
+import collections
+import collections.abc
+
+from .pcg_detail import Engine
+from .pcg_engines import setseq_xsh_rr_64_32 as pcg32
+from .pcg_extras import SeedSequence, _seed_material
+
+
+class KeyedEngineCache:
+    ''' Engines derived from SeedSequence((master_seed, key)), created on
+        first use and then kept, so that each key continues its own
+        sequence across draws.
+
+        At most `capacity` engines are resident. The least recently used
+        one is evicted by writing its (seed, stream) pair, as plain ints,
+        to `store` (any mutable mapping, e.g. a dict or a SqliteStore);
+        the next access to that key rebuilds it exactly from there.
+
+        An engine returned by cache[key] should not be kept across other
+        accesses, since after eviction further draws from it are lost.
+    '''
+    def __init__(self, master_seed, factory=pcg32, capacity=4096, store=None):
+        if master_seed is None:
+            raise ValueError('Need an explicit master seed')
+        if not capacity > 0:
+            raise ValueError('Capacity must be positive')
+        self.master_seed = master_seed
+        self.factory = factory
+        self.capacity = capacity
+        self.store = {} if store is None else store
+        self._resident = collections.OrderedDict()
+        template = factory(False)
+        if not isinstance(template, Engine):
+            raise TypeError('Factory must produce an Engine')
+        self._template = template._template_arguments
+        self._itype = template.itype
+
+        self.hits = 0
+        self.misses = 0
+        self.restores = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return '<KeyedEngineCache: %d resident, %d hits, %d misses, %d restores, %d evictions>' % (
+                len(self._resident), self.hits, self.misses, self.restores, self.evictions)
+
+    def __len__(self):
+        return len(self._resident)
+
+    def __contains__(self, key):
+        return key in self._resident or key in self.store
+
+    def __getitem__(self, key):
+        resident = self._resident
+        engine = resident.get(key)
+        if engine is not None:
+            resident.move_to_end(key)
+            self.hits += 1
+            return engine
+        self.misses += 1
+        spilled = self.store.pop(key, None)
+        if spilled is not None:
+            self.restores += 1
+            itype = self._itype
+            seed, stream = spilled
+            engine = Engine(*self._template, itype(seed), None if stream is None else itype(stream))
+        else:
+            engine = self.factory(SeedSequence((self.master_seed, key)))
+        resident[key] = engine
+        while len(resident) > self.capacity:
+            self._spill(*resident.popitem(last=False))
+            self.evictions += 1
+        return engine
+
+    def __call__(self, key, bound=None):
+        ''' Draw from the key's engine.
+        '''
+        return self[key](bound)
+
+    def _spill(self, key, engine):
+        seed, stream = engine._instance_args()
+        self.store[key] = (int(seed), None if stream is None else int(stream))
+
+    def flush(self):
+        ''' Write every resident engine's state to the store (keeping them
+            resident), e.g. before saving the store.
+        '''
+        for key, engine in self._resident.items():
+            self._spill(key, engine)
+
+
+def _decode_key(data, pos=0):
+    # Inverse of pcg_extras._seed_material.
+    tag = data[pos:pos + 1]
+    size = int.from_bytes(data[pos + 1:pos + 9], 'little')
+    start = pos + 9
+    body = data[start:start + size]
+    if tag == b'i':
+        key = int.from_bytes(body, 'little', signed=True)
+    elif tag == b's':
+        key = body.decode('utf-8')
+    elif tag == b'b':
+        key = bytes(body)
+    elif tag == b't':
+        items = []
+        i = start
+        while i < start + size:
+            item, i = _decode_key(data, i)
+            items.append(item)
+        key = tuple(items)
+    else:
+        raise ValueError('Bad key encoding')
+    return key, start + size
+
+
+class SqliteStore(collections.abc.MutableMapping):
+    ''' A side store for KeyedEngineCache, in an SQLite table.
+
+        Keys may be ints, strs, bytes or tuples of those; lists come back
+        as tuples.
+    '''
+    def __init__(self, path, table='engines'):
+        import sqlite3
+        if not table.isidentifier():
+            raise ValueError('Bad table name')
+        self._db = sqlite3.connect(path)
+        self._table = table
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS %s (key BLOB PRIMARY KEY, seed TEXT NOT NULL, stream TEXT)' % table)
+
+    def close(self):
+        self._db.close()
+
+    def __getitem__(self, key):
+        row = self._db.execute('SELECT seed, stream FROM %s WHERE key = ?' % self._table, (_seed_material(key),)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        seed, stream = row
+        return (int(seed), None if stream is None else int(stream))
+
+    def __setitem__(self, key, value):
+        seed, stream = value
+        with self._db:
+            self._db.execute('INSERT OR REPLACE INTO %s VALUES (?, ?, ?)' % self._table,
+                    (_seed_material(key), str(int(seed)), None if stream is None else str(int(stream))))
+
+    def __delitem__(self, key):
+        with self._db:
+            cursor = self._db.execute('DELETE FROM %s WHERE key = ?' % self._table, (_seed_material(key),))
+        if not cursor.rowcount:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for (data,) in self._db.execute('SELECT key FROM %s' % self._table).fetchall():
+            yield _decode_key(data)[0]
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM %s' % self._table).fetchone()[0]
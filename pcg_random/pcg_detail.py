@@ -27,6 +27,9 @@
 '''
 
 import abc
+import functools
+import operator
+import struct
 import types
 
 from .ints import *
@@ -42,6 +45,171 @@ class AbstractEngine(metaclass=abc.ABCMeta):
             or from 0 up to the bound if given.
         '''
 
+    def fill(self, out):
+        ''' Store consecutive outputs into every slot of `out`, in order.
+
+            Subclasses may override this with something less generic.
+        '''
+        for i in range(len(out)):
+            out[i] = self()
+        return out
+
+    def _bulk_words(self, n):
+        # The next n outputs as a NumPy array, if this engine can make
+        # them all at once; otherwise None, having drawn nothing.
+        return None
+
+    def readinto(self, buffer, byteorder='little'):
+        ''' Fill a writable buffer with whole output words, without building
+            any large intermediate int.
+
+            Words are written little-endian, so the bytes are the same on
+            every platform; pass sys.byteorder to fill a typed array (e.g.
+            array('I')) with the words themselves. If the buffer is not a
+            multiple of the word size, the last word contributes only its
+            first bytes. Returns the number of bytes.
+        '''
+        view = memoryview(buffer).cast('B')
+        size = self.result_type.BYTES
+        count = len(view)
+        words, tail = divmod(count, size)
+        code = _struct_codes.get(size)
+        prefix = '<' if byteorder == 'little' else '>'
+        pos = 0
+        chunk = [None] * min(words, _READINTO_CHUNK)
+        while words:
+            if words < len(chunk):
+                chunk = [None] * words
+            bulk = self._bulk_words(len(chunk))
+            if bulk is not None:
+                data = bulk.astype(bulk.dtype.newbyteorder(prefix)).tobytes()
+            else:
+                self.fill(chunk)
+                if code is not None:
+                    data = struct.pack('%s%d%s' % (prefix, len(chunk), code), *chunk)
+                else:
+                    data = b''.join([int(w).to_bytes(size, byteorder) for w in chunk])
+            view[pos:pos+len(data)] = data
+            pos += len(data)
+            words -= len(chunk)
+        if tail:
+            view[pos:] = int(self()).to_bytes(size, byteorder)[:tail]
+        return count
+
+    def randbytes(self, n):
+        ''' Return n random bytes: little-endian words, as laid out by
+            readinto().
+        '''
+        rv = bytearray(n)
+        self.readinto(rv, 'little')
+        return bytes(rv)
+
+    def view(self, checkpoints=64):
+        ''' Return an EngineView of the outputs from the current position.
+
+            This engine is not modified, now or later.
+        '''
+        return EngineView(self, checkpoints)
+
+    def bernoulli_bits(self, p, n, precision=2**-32, out=None):
+        ''' Return n independent bits, each set with probability p, packed
+            8 to a byte with the first bit in the low bit of the first byte.
+
+            p is rounded to a multiple of 2**-k, where 2**-k <= precision.
+            Working through its binary expansion from the lowest set bit,
+            each step draws one random bit per decision, and either ANDs
+            (for a 0) or ORs (for a 1) it into the result, so the cost is
+            at most k bits per decision, drawn as whole words. The steps
+            run over one fixed-size chunk of the result at a time.
+
+            If out is given, it must be a writable buffer (e.g. a bytearray,
+            or a NumPy uint8 or uint64 array) of at least ceil(n/8) bytes;
+            the bits are written to its start and it is returned.
+        '''
+        n = operator.index(n)
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if not 0.0 <= p <= 1.0:
+            raise ValueError('p must be in [0, 1]')
+        if not 0.0 < precision < 1.0:
+            raise ValueError('precision must be in (0, 1)')
+        nbytes = (n + 7) // 8
+        if out is None:
+            rv = bytearray(nbytes)
+            view = memoryview(rv)
+        else:
+            view = memoryview(out).cast('B')
+            if len(view) < nbytes:
+                raise ValueError('Buffer too small for %d bits' % n)
+        k = 0
+        while 2.0 ** -k > precision:
+            k += 1
+        q = round(p * (1 << k))
+        if q == 0 or q >> k:
+            fill = b'\xff' if q else b'\0'
+            for lo in range(0, nbytes, _BERNOULLI_CHUNK):
+                size = min(_BERNOULLI_CHUNK, nbytes - lo)
+                view[lo:lo + size] = fill * size
+        else:
+            # bits below the lowest set bit would AND into an empty result
+            while not q & 1:
+                q >>= 1
+                k -= 1
+            buf = bytearray(_BERNOULLI_CHUNK)
+            for lo in range(0, nbytes, _BERNOULLI_CHUNK):
+                size = min(_BERNOULLI_CHUNK, nbytes - lo)
+                if size < len(buf):
+                    buf = bytearray(size)
+                acc = 0
+                bits = q
+                for _ in range(k):
+                    self.readinto(buf, 'little')
+                    r = int.from_bytes(buf, 'little')
+                    acc = acc | r if bits & 1 else acc & r
+                    bits >>= 1
+                view[lo:lo + size] = acc.to_bytes(size, 'little')
+        if n % 8:
+            view[nbytes - 1] &= (1 << n % 8) - 1
+        if out is None:
+            return bytes(rv)
+        return out
+
+
+_READINTO_CHUNK = 4096
+_BULK_MIN = 32                 # outputs; fewer don't pay for the NumPy setup
+_BERNOULLI_CHUNK = 1 << 16     # bytes, a multiple of every word size
+_struct_codes = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+@functools.lru_cache(None)
+def _arrays_module():
+    # The arrays module, if NumPy is installed.
+    try:
+        from . import arrays
+    except ImportError:
+        return None
+    return arrays
+
+def _lcg_bulk_words(engine, n, mult, plus):
+    # n outputs of an Engine, stepping by the LCG (mult, plus), computed
+    # with NumPy; None if it is missing or can't do this output function,
+    # or if n is too small to be worth it.
+    if n < _BULK_MIN:
+        return None
+    arrays = _arrays_module()
+    if arrays is None:
+        return None
+    rv = arrays.lcg_outputs(engine, int(engine._state), n, int(mult), int(plus))
+    if rv is None:
+        return None
+    words, state = rv
+    engine._state = engine.itype(state)
+    return words
+
+def _fill_from(out, words, result_type):
+    for i, w in enumerate(words.tolist()):
+        out[i] = result_type(w)
+    return out
+
 
 # The LCG generators need some constants to function.  This code lets you
 # look up the constant by *type*.
@@ -253,7 +421,12 @@ class Engine(AbstractEngine):
             # The C++ version defaults seed to itype(0xcafef00dd15ea5e5)
             # However, unwanted early construction isn't a thing in python,
             # so we default to seeding from /dev/urandom instead.
-            seed = itype.urandom()
+            seed = pcg_extras.SeedSequence()
+        if isinstance(seed, pcg_extras.SeedSequence):
+            seed_seq = seed
+            seed = seed_seq.generate(itype)
+            if stream_seed is None and self.can_specify_stream:
+                stream_seed = seed_seq.generate(itype)
         elif not isinstance(seed, itype):
             # disallow int, since who knows how many real bits it has
             raise TypeError('Seed of wrong type!')
@@ -262,8 +435,6 @@ class Engine(AbstractEngine):
             if stream_seed is None:
                 stream_seed = False
 
-        if stream_seed is None and self.can_specify_stream:
-            stream_seed = itype.urandom()
         if stream_seed is not None and stream_seed is not False:
             if not self.can_specify_stream:
                 raise TypeError('Stream mixin not seedable, but stream seed given!')
@@ -350,6 +521,30 @@ class Engine(AbstractEngine):
         else:
             return self._output(self._base_generate())
 
+    def _bulk_words(self, n):
+        return _lcg_bulk_words(self, n, self._multiplier(), self.increment())
+
+    def fill(self, out):
+        # Same as the generic version, but with the lookups hoisted, and
+        # long runs done by NumPy where it can.
+        words = self._bulk_words(len(out))
+        if words is not None:
+            return _fill_from(out, words, self.result_type)
+        output = self._output
+        mult = self._multiplier()
+        plus = self.increment()
+        state = self._state
+        if self.output_previous:
+            for i in range(len(out)):
+                out[i] = output(state)
+                state = state * mult + plus
+        else:
+            for i in range(len(out)):
+                state = state * mult + plus
+                out[i] = output(state)
+        self._state = state
+        return out
+
     # quasi-@staticmethod, but needs template arguments
     def _staticmethod_advance(self, state, delta, cur_mult, cur_plus):
         ''' efficient O(log n) version of n calls to _bump()
@@ -363,7 +558,17 @@ class Engine(AbstractEngine):
             signed integer to go backwards, it just goes "the long way round".
         '''
         itype = self.itype
-        assert itype is type(state) is type(cur_mult) is type(cur_plus)
+        assert itype is type(state)
+        acc_mult, acc_plus = self._staticmethod_stride(delta, cur_mult, cur_plus)
+        return acc_mult * state + acc_plus
+
+    # quasi-@staticmethod, but needs template arguments
+    def _staticmethod_stride(self, delta, cur_mult, cur_plus):
+        ''' The (multiplier, increment) pair of the LCG that takes
+            delta steps of the given LCG at once.
+        '''
+        itype = self.itype
+        assert itype is type(cur_mult) is type(cur_plus)
         delta = itype.coerce(delta)
 
         acc_mult = itype.ONE
@@ -375,13 +580,29 @@ class Engine(AbstractEngine):
             cur_plus = (cur_mult+1)*cur_plus
             cur_mult *= cur_mult
             delta >>= 1
-        return acc_mult * state + acc_plus
+        return acc_mult, acc_plus
 
     # quasi-@staticmethod, but needs template arguments
     def _staticmethod_distance(self, cur_state, newstate, cur_mult, cur_plus, mask=-1):
+        ''' The number of steps from cur_state until the bits in mask
+            match those of newstate.
+
+            For the usual LCGs, and a mask of low bits, this is solved as a
+            discrete logarithm; anything else takes the bitwise route.
+        '''
         itype = self.itype
         assert itype is type(cur_state) is type(newstate) is type(cur_mult) is type(cur_plus)
         assert type(mask) in (itype, int)
+        if not self._is_mcg and cur_plus & 1 and cur_mult & 3 == 1:
+            mask = int(mask) & itype.MASK
+            if not mask & (mask + 1):
+                return itype(_lcg_distance(int(cur_mult), int(cur_plus),
+                        int(cur_state), int(newstate), mask.bit_length()))
+        return self._staticmethod_distance_bitwise(cur_state, newstate, cur_mult, cur_plus, mask)
+
+    # quasi-@staticmethod, but needs template arguments
+    def _staticmethod_distance_bitwise(self, cur_state, newstate, cur_mult, cur_plus, mask=-1):
+        itype = self.itype
         maybe_mcg_shift = 2 * self._is_mcg
 
         the_bit = itype.ONE << maybe_mcg_shift
@@ -407,6 +628,43 @@ class Engine(AbstractEngine):
 
     discard = advance
 
+    def leapfrog(self, k, r=0):
+        ''' Derive an engine producing outputs r, r+k, r+2k, ... of this one.
+
+            This engine is not modified.
+        '''
+        return Leapfrog(self, k, r)
+
+    def jumped(self, n=1):
+        ''' Return a copy advanced by n * 2**(period_pow2 // 2) steps.
+
+            This engine is not modified.
+        '''
+        period_pow2 = self.period_pow2()
+        rv = self.copy()
+        rv.advance((n << (period_pow2 // 2)) % (1 << period_pow2))
+        return rv
+
+    def split(self):
+        ''' Derive a child engine of the same type, consuming some outputs.
+
+            The child's seed (and stream, if this engine can specify one)
+            are hashed from this engine's outputs, so an entire tree of
+            splits is determined by the state of its root.
+        '''
+        seed = self._split_word()
+        stream_seed = self._split_word() if self.can_specify_stream else None
+        rv = Engine(*self._template_arguments, seed=False)
+        rv.seed(seed, stream_seed)
+        return rv
+
+    def _split_word(self):
+        itype = self.itype
+        value = 0
+        for shift in range(0, itype.BITS, self.xtype.BITS):
+            value |= int(self()) << shift
+        return _split_mix(itype(value))
+
     def wrapped(self):
         # For MCGs, the low order two bits never change. In this
         # implementation, we keep them fixed at 3 to make this test
@@ -427,6 +685,193 @@ class Engine(AbstractEngine):
         assert self.multiplier_mixin is other.multiplier_mixin
         return other._distance(self._state)
 
+
+_DLOG_CHUNK = 8
+
+@functools.lru_cache(maxsize=64)
+def _dlog_table(a, bits):
+    # For a = 1 mod 4, the powers of a modulo 2**(bits + v), v = v2(a-1),
+    # form a cyclic group of order 2**bits. Its subgroup of order
+    # 2**chunk is generated by a**(2**(bits - chunk)); index it.
+    chunk = min(bits, _DLOG_CHUNK)
+    v = ((a - 1) & -(a - 1)).bit_length() - 1
+    mod = 1 << (bits + v)
+    g = pow(a, 1 << (bits - chunk), mod)
+    table = {}
+    x = 1
+    for i in range(1 << chunk):
+        table[x] = i
+        x = x * g % mod
+    # a**-(2**shift), for each chunk's shift
+    inverses = [pow(a, -(1 << shift), mod) for shift in range(0, bits, chunk)]
+    return table, chunk, v, inverses
+
+def _lcg_distance(a, c, cur, new, bits):
+    ''' The n in [0, 2**bits) taking the LCG x -> a*x + c from cur to new,
+        modulo 2**bits; needs a = 1 mod 4 and c odd.
+
+        After n steps, new - cur = (1 + a + ... + a**(n-1)) * ((a-1)*cur + c),
+        and the second factor is odd, so the sum is known; multiplying
+        it by a - 1 and adding 1 gives a**n (modulo 2**(bits + v2(a-1))).
+        The exponent is then found a chunk of bits at a time, from the low
+        end, each by one lookup (Pohlig-Hellman).
+    '''
+    if not bits:
+        return 0
+    mod_n = 1 << bits
+    table, chunk, v, inverses = _dlog_table(a, bits)
+    mod = 1 << (bits + v)
+    y = ((a - 1) * cur + c) % mod_n
+    total = (new - cur) * pow(y, -1, mod_n) % mod_n
+    # a**n, divided by a**(the bits of n found so far)
+    rest = (1 + (a - 1) * total) % mod
+    n = 0
+    for i, shift in enumerate(range(0, bits, chunk)):
+        width = min(chunk, bits - shift)
+        h = pow(rest, 1 << (bits - shift - width), mod)
+        # h is in the subgroup of order 2**width, i.e. g**(digit << (chunk - width))
+        digit = table[h] >> (chunk - width)
+        n |= digit << shift
+        rest = rest * pow(inverses[i], digit, mod) % mod
+    return n
+
+def _split_mix(x):
+    ''' Bijective avalanche of a seed word, so that a child's seed doesn't
+        look like an output its parent already handed out.
+    '''
+    itype = type(x)
+    shift = itype.BITS // 2
+    mult = mcg_multiplier_data[itype]
+    x ^= x >> shift
+    x *= mult
+    x ^= x >> shift
+    x *= mult
+    x ^= x >> shift
+    return x
+
+
+class Leapfrog(AbstractEngine):
+    ''' Every k-th output of an Engine, starting with output r.
+
+        Taking k steps of an LCG is itself an LCG step, with multiplier
+        a**k and a correspondingly-summed increment. So each output costs
+        a single multiply-add, rather than an advance() of the full engine.
+
+        Worker r of k can thus consume its share of a single sequence
+        without any coordination.
+    '''
+    def __init__(self, engine, k, r=0):
+        if not isinstance(engine, Engine):
+            raise TypeError('Can only leapfrog an Engine')
+        if not 0 < k < engine.itype.MOD:
+            raise ValueError('Stride out of range!')
+        if not 0 <= r < k:
+            raise ValueError('Offset must be less than the stride!')
+        engine = engine.copy()
+        engine.advance(r)
+        self.engine = engine
+        self.k = k
+        self.r = r
+
+        self.itype = engine.itype
+        self.xtype = engine.xtype
+        self.MIN = engine.MIN
+        self.MAX = engine.MAX
+        self.streams_pow2 = engine.streams_pow2
+        self.can_specify_stream = engine.can_specify_stream
+
+        self.state_type = engine.state_type
+        self.result_type = engine.result_type
+
+        self._mult, self._plus = engine._staticmethod_stride(k, engine._multiplier(), engine.increment())
+        # Even strides visit only part of the period.
+        self._k_pow2 = (k & -k).bit_length() - 1
+
+    def __repr__(self):
+        return 'Leapfrog(%r, %r, %r)' % self.pickle_args()
+
+    def copy(self):
+        return Leapfrog(*self.pickle_args())
+
+    def __reduce__(self):
+        return (Leapfrog, self.pickle_args())
+
+    def pickle_args(self):
+        # The base engine, r steps behind this lane.
+        base = self.engine.copy()
+        base.backstep(self.r)
+        return (base, self.k, self.r)
+
+    def seed(self, *seed_args, **seed_kwargs):
+        ''' Reseed the base engine, and take up lane r of it again.
+        '''
+        self.engine.seed(*seed_args, **seed_kwargs)
+        self.engine.advance(self.r)
+
+    def period_pow2(self):
+        return max(self.engine.period_pow2() - self._k_pow2, 0)
+
+    def __call__(self, upper_bound=None):
+        if upper_bound is not None:
+            return pcg_extras.bounded_rand(self, upper_bound)
+
+        engine = self.engine
+        state = engine._state
+        engine._state = state * self._mult + self._plus
+        if engine.output_previous:
+            return engine._output(state)
+        else:
+            return engine._output(engine._bump(state))
+
+    def _bulk_words(self, n):
+        return _lcg_bulk_words(self.engine, n, self._mult, self._plus)
+
+    def fill(self, out):
+        words = self._bulk_words(len(out))
+        if words is not None:
+            return _fill_from(out, words, self.result_type)
+        engine = self.engine
+        output = engine._output
+        mult = self._mult
+        plus = self._plus
+        state = engine._state
+        if engine.output_previous:
+            for i in range(len(out)):
+                out[i] = output(state)
+                state = state * mult + plus
+        else:
+            bump = engine._bump
+            for i in range(len(out)):
+                out[i] = output(bump(state))
+                state = state * mult + plus
+        engine._state = state
+        return out
+
+    def advance(self, delta):
+        self.engine.advance(self.itype.coerce(delta) * self.k)
+
+    def backstep(self, delta):
+        self.advance(-delta)
+
+    discard = advance
+
+    def __eq__(self, other):
+        if not isinstance(other, Leapfrog):
+            return NotImplemented
+        return self.k == other.k and self.r == other.r and self.engine == other.engine
+
+    def __sub__(self, other):
+        if not isinstance(other, Leapfrog):
+            return NotImplemented
+        assert self.k == other.k
+        distance = int(self.engine - other.engine)
+        t = self._k_pow2
+        if distance & ((1 << t) - 1):
+            raise ValueError('Engines are not on the same leapfrog lane!')
+        mod = 1 << self.period_pow2()
+        return self.state_type((distance >> t) * pow(self.k >> t, -1, mod) % mod)
+
+
 def oneseq_base(xtype, itype, output_mixin, output_previous=None, *seed_args, **seed_kwargs):
     if output_previous is None:
         output_previous = itype.BYTES <= 8
@@ -879,12 +1324,16 @@ class Extended(AbstractEngine):
             assert stream_seed is None
             assert data is None
             return
+        if seed is None or seed is True:
+            seed = pcg_extras.SeedSequence()
         self.baseclass.seed(seed, stream_seed)
         if data is False:
             self._selfinit()
         else:
             if data is True:
                 data = None
+            if data is None and isinstance(seed, pcg_extras.SeedSequence):
+                data = seed.generate(self.result_type, self._table_size)
             self._datainit(data)
 
     def __repr__(self):
@@ -1027,7 +1476,7 @@ class Extended(AbstractEngine):
         result_type = self.result_type
 
         if data is None:
-            data = result_type.urandom(count=table_size)
+            data = pcg_extras.SeedSequence().generate(result_type, table_size)
         else:
             data = list(data)
             if len(data) != table_size:
@@ -1053,3 +1502,379 @@ class Extended(AbstractEngine):
         # detect if the appropriate number of wraps (0 or 1) have occurred.
         # It's *something* to do with the distance from zero ...
         return self.baseclass - other.baseclass
+
+
+class Buffered(AbstractEngine):
+    ''' Serve scalar calls from blocks generated by the wrapped engine's fill().
+
+        The wrapped engine runs ahead of the logical position by the number
+        of unconsumed outputs. Everything that observes the state (advance,
+        backstep, copy, pickling, comparison, subtraction) takes that into
+        account, so the wrapper behaves exactly like the bare engine.
+
+        When NumPy is installed, an Engine or Leapfrog fills a block with a
+        few array operations (see arrays.lcg_outputs), rather than one
+        step and one output() call per word.
+    '''
+    def __init__(self, engine, block=4096):
+        if not isinstance(engine, AbstractEngine):
+            raise TypeError('Can only buffer an engine')
+        if not block > 0:
+            raise ValueError('Block size must be positive!')
+        self.engine = engine
+        self.block = block
+        self._buffer = []
+        self._pos = 0
+
+        self.itype = engine.itype
+        self.xtype = engine.xtype
+        self.MIN = engine.MIN
+        self.MAX = engine.MAX
+        self.state_type = engine.state_type
+        self.result_type = engine.result_type
+
+    def __repr__(self):
+        return 'Buffered(%r, %r)' % (self._logical(), self.block)
+
+    def copy(self):
+        rv = Buffered(self.engine.copy(), self.block)
+        rv._buffer = list(self._buffer)
+        rv._pos = self._pos
+        return rv
+
+    def __reduce__(self):
+        return (Buffered, self.pickle_args())
+
+    def pickle_args(self):
+        return (self._logical(), self.block)
+
+    def seed(self, *seed_args, **seed_kwargs):
+        self.engine.seed(*seed_args, **seed_kwargs)
+        self._buffer = []
+        self._pos = 0
+
+    def period_pow2(self):
+        return self.engine.period_pow2()
+
+    def streams_pow2(self):
+        return self.engine.streams_pow2()
+
+    def _remaining(self):
+        return len(self._buffer) - self._pos
+
+    def _logical(self):
+        # A copy of the engine, at the position the caller thinks it's at.
+        rv = self.engine.copy()
+        remaining = self._remaining()
+        if remaining:
+            rv.backstep(remaining)
+        return rv
+
+    def _sync(self):
+        remaining = self._remaining()
+        if remaining:
+            self.engine.backstep(remaining)
+        self._buffer = []
+        self._pos = 0
+
+    def _refill(self):
+        buffer = self._buffer
+        if len(buffer) != self.block:
+            buffer = self._buffer = [None] * self.block
+        self.engine.fill(buffer)
+        self._pos = 0
+        return buffer
+
+    def __call__(self, upper_bound=None):
+        if upper_bound is not None:
+            return pcg_extras.bounded_rand(self, upper_bound)
+
+        pos = self._pos
+        buffer = self._buffer
+        if pos == len(buffer):
+            buffer = self._refill()
+            pos = 0
+        self._pos = pos + 1
+        return buffer[pos]
+
+    def fill(self, out):
+        i = 0
+        count = len(out)
+        while i < count:
+            if self._pos == len(self._buffer):
+                self._refill()
+            pos = self._pos
+            take = min(count - i, len(self._buffer) - pos)
+            out[i:i+take] = self._buffer[pos:pos+take]
+            self._pos = pos + take
+            i += take
+        return out
+
+    def advance(self, delta):
+        if 0 <= delta <= self._remaining():
+            self._pos += delta
+            return
+        self._sync()
+        self.engine.advance(delta)
+
+    def backstep(self, delta):
+        # Outputs already handed out are still in the buffer.
+        if 0 <= delta <= self._pos:
+            self._pos -= delta
+            return
+        self._sync()
+        self.engine.backstep(delta)
+
+    discard = advance
+
+    def __eq__(self, other):
+        if isinstance(other, Buffered):
+            other = other._logical()
+        elif not isinstance(other, AbstractEngine):
+            return NotImplemented
+        return self._logical() == other
+
+    def __sub__(self, other):
+        if isinstance(other, Buffered):
+            other = other._logical()
+        elif not isinstance(other, AbstractEngine):
+            return NotImplemented
+        return self._logical() - other
+
+    def __rsub__(self, other):
+        if not isinstance(other, AbstractEngine):
+            return NotImplemented
+        return other - self._logical()
+
+
+_TABULATE_MAX_BITS = 16
+
+@functools.lru_cache(maxsize=16)
+def _cycle_table(template, increment):
+    # One full cycle of states and outputs, for a given configuration and
+    # stream; small enough to keep a few around.
+    engine = Engine(*template, seed=False)
+    itype = engine.itype
+    if engine.can_specify_stream:
+        engine.set_stream(itype(increment >> 1))
+    engine._state = itype(3 if engine._is_mcg else 0)
+    period = 1 << engine.period_pow2()
+    states = [None] * period
+    outputs = [None] * period
+    positions = [None] * itype.MOD
+    for i in range(period):
+        state = int(engine._state)
+        states[i] = state
+        positions[state] = i
+        outputs[i] = engine()
+    return states, outputs, positions
+
+
+class Tabulated(AbstractEngine):
+    ''' Serve an engine with at most 16 bits of state from a table of its
+        entire cycle, shared between all engines of the same configuration
+        and stream.
+
+        Generating is then an index, advance and backstep are index
+        arithmetic, and subtraction is a lookup.
+    '''
+    def __init__(self, engine):
+        if not isinstance(engine, Engine):
+            raise TypeError('Can only tabulate an Engine')
+        if engine.itype.BITS > _TABULATE_MAX_BITS:
+            raise ValueError('State too large to tabulate!')
+        if engine.stream_mixin is unique_stream:
+            # the stream comes from the object's address
+            raise TypeError('Cannot tabulate a unique-stream engine')
+        self._template = engine._template_arguments
+        self._increment = int(engine.increment())
+        self._states, self._outputs, self._positions = _cycle_table(self._template, self._increment)
+        self._period = len(self._states)
+        self._pos = self._positions[int(engine._state)]
+
+        self.itype = engine.itype
+        self.xtype = engine.xtype
+        self.MIN = engine.MIN
+        self.MAX = engine.MAX
+        self.state_type = engine.state_type
+        self.result_type = engine.result_type
+
+    def __repr__(self):
+        return 'Tabulated(%r)' % self._logical()
+
+    def _logical(self):
+        # A plain engine at the same position.
+        rv = Engine(*self._template, seed=False)
+        if rv.can_specify_stream:
+            rv.set_stream(self.itype(self._increment >> 1))
+        rv._state = self.itype(self._states[self._pos])
+        return rv
+
+    def copy(self):
+        rv = Tabulated.__new__(Tabulated)
+        rv.__dict__.update(self.__dict__)
+        return rv
+
+    def __reduce__(self):
+        return (Tabulated, self.pickle_args())
+
+    def pickle_args(self):
+        return (self._logical(),)
+
+    def seed(self, *seed_args, **seed_kwargs):
+        engine = self._logical()
+        engine.seed(*seed_args, **seed_kwargs)
+        self.__init__(engine)
+
+    def period_pow2(self):
+        return self._period.bit_length() - 1
+
+    def streams_pow2(self):
+        return self._logical().streams_pow2()
+
+    def __call__(self, upper_bound=None):
+        if upper_bound is not None:
+            return pcg_extras.bounded_rand(self, upper_bound)
+        pos = self._pos
+        rv = self._outputs[pos]
+        pos += 1
+        self._pos = 0 if pos == self._period else pos
+        return rv
+
+    def fill(self, out):
+        outputs = self._outputs
+        period = self._period
+        i = 0
+        count = len(out)
+        while i < count:
+            pos = self._pos
+            take = min(count - i, period - pos)
+            out[i:i+take] = outputs[pos:pos+take]
+            self._pos = (pos + take) % period
+            i += take
+        return out
+
+    def advance(self, delta):
+        self._pos = (self._pos + delta) % self._period
+
+    def backstep(self, delta):
+        self._pos = (self._pos - delta) % self._period
+
+    discard = advance
+
+    def _position_of(self, other):
+        # other's position in this table, or None if it's on another cycle
+        if isinstance(other, Tabulated):
+            if other._states is self._states:
+                return other._pos
+        elif isinstance(other, Engine):
+            if other._template_arguments == self._template and int(other.increment()) == self._increment:
+                return self._positions[int(other._state)]
+        return None
+
+    def __eq__(self, other):
+        if not isinstance(other, AbstractEngine):
+            return NotImplemented
+        pos = self._position_of(other)
+        if pos is not None:
+            return pos == self._pos
+        if isinstance(other, Tabulated):
+            other = other._logical()
+        return self._logical() == other
+
+    def __sub__(self, other):
+        if not isinstance(other, AbstractEngine):
+            return NotImplemented
+        pos = self._position_of(other)
+        if pos is not None:
+            return self.state_type((self._pos - pos) % self._period)
+        if isinstance(other, Tabulated):
+            other = other._logical()
+        return self._logical() - other
+
+    def __rsub__(self, other):
+        if not isinstance(other, AbstractEngine):
+            return NotImplemented
+        pos = self._position_of(other)
+        if pos is not None:
+            return self.state_type((pos - self._pos) % self._period)
+        return other - self._logical()
+
+
+class EngineView:
+    ''' Random access to the outputs of an engine, without disturbing it.
+
+        view[i] is the output that the i-th call would produce (so view[0]
+        is the next one); indices are taken modulo the period, so negative
+        ones reach back before the starting position. Slices give lists.
+
+        Each lookup starts from a copy of the nearest remembered state,
+        and remembers where it ended, so scanning forwards or looking
+        around one spot only moves a short distance. At most `checkpoints`
+        states are kept, discarding the least recently used.
+    '''
+    def __init__(self, engine, checkpoints=64):
+        if not checkpoints > 0:
+            raise ValueError('Need at least one checkpoint!')
+        self._period = 1 << engine.period_pow2()
+        self._capacity = checkpoints
+        self._checkpoints = {0: engine.copy()}
+
+    def __repr__(self):
+        return '<EngineView with %d checkpoints>' % len(self._checkpoints)
+
+    def _nearest(self, i):
+        # A copy of the engine at position i, from the closest checkpoint
+        # in either direction.
+        period = self._period
+        half = period >> 1
+        best_pos = best_delta = None
+        for pos in self._checkpoints:
+            delta = (i - pos) % period
+            if delta > half:
+                delta -= period
+            if best_delta is None or abs(delta) < abs(best_delta):
+                best_pos, best_delta = pos, delta
+        checkpoint = self._checkpoints.pop(best_pos)
+        self._checkpoints[best_pos] = checkpoint
+        rv = checkpoint.copy()
+        if best_delta > 0:
+            rv.advance(best_delta)
+        elif best_delta < 0:
+            rv.backstep(-best_delta)
+        return rv
+
+    def _remember(self, pos, engine):
+        checkpoints = self._checkpoints
+        checkpoints.pop(pos, None)
+        checkpoints[pos] = engine
+        if len(checkpoints) > self._capacity:
+            del checkpoints[next(iter(checkpoints))]
+
+    def engine_at(self, i):
+        ''' A new engine, whose next output is view[i].
+        '''
+        return self._nearest(operator.index(i) % self._period)
+
+    def __getitem__(self, i):
+        period = self._period
+        if isinstance(i, slice):
+            positions = range(period)[i]
+            if not positions:
+                return []
+            engine = self._nearest(positions[0])
+            skip = positions.step - 1
+            rv = [engine()]
+            for _ in positions[1:]:
+                if skip > 0:
+                    engine.advance(skip)
+                elif skip < 0:
+                    engine.backstep(-skip)
+                rv.append(engine())
+            self._remember((positions[-1] + 1) % period, engine)
+            return rv
+        i = operator.index(i) % period
+        engine = self._nearest(i)
+        rv = engine()
+        self._remember((i + 1) % period, engine)
+        return rv
@@ -24,6 +24,10 @@
     implemented in a more sensible location.
 '''
 
+import hashlib
+import os
+import threading
+
 
 def PCG_128BIT_CONSTANT(high, low):
     ''' Some members of the PCG library use 128-bit math.
@@ -59,8 +63,114 @@ def unxorshift(x, bits, shift):
 
 # rotl and rotr are implemented on the ints.* classes
 
-# C++-style seed sequences don't exist. Instead, the seed must always be
-# a bytestring of appropriate length, or defaults to urandom.
+# C++-style seed sequences don't exist. Instead, the seed must be a value
+# of the engine's state type, or else a SeedSequence (below), which is also
+# how the engines seed themselves from urandom by default.
+
+_ENTROPY_POOL_BYTES = 4096
+_entropy_lock = threading.Lock()
+_entropy_pool = b''
+
+def _reset_entropy_pool():
+    global _entropy_lock, _entropy_pool
+    _entropy_lock = threading.Lock()
+    _entropy_pool = b''
+
+# A forked child must not hand out the same entropy as its parent, nor
+# inherit the lock from a thread that held it at the time of the fork.
+os.register_at_fork(after_in_child=_reset_entropy_pool)
+
+def pooled_urandom(count):
+    ''' Like os.urandom, but amortizes the syscall over many small calls.
+    '''
+    global _entropy_pool
+    if count > _ENTROPY_POOL_BYTES:
+        return os.urandom(count)
+    with _entropy_lock:
+        if len(_entropy_pool) < count:
+            _entropy_pool = os.urandom(_ENTROPY_POOL_BYTES)
+        rv = _entropy_pool[:count]
+        _entropy_pool = _entropy_pool[count:]
+    return rv
+
+def _seed_material(key):
+    # Unambiguous encoding, so that e.g. 1, b'\x01' and '\x01' all differ.
+    if isinstance(key, bool) or key is None:
+        raise TypeError('Unsupported seed key: %r' % (key,))
+    if isinstance(key, int):
+        body = key.to_bytes(key.bit_length() // 8 + 1, 'little', signed=True)
+        tag = b'i'
+    elif isinstance(key, str):
+        body = key.encode('utf-8')
+        tag = b's'
+    elif isinstance(key, (bytes, bytearray, memoryview)):
+        body = bytes(key)
+        tag = b'b'
+    elif isinstance(key, (tuple, list)):
+        body = b''.join(_seed_material(k) for k in key)
+        tag = b't'
+    else:
+        raise TypeError('Unsupported seed key: %r' % (key,))
+    return tag + len(body).to_bytes(8, 'little') + body
+
+class SeedSequence:
+    ''' Derive any number of seed words from a small amount of entropy.
+
+        The entropy is either a deterministic user key (an int, str, bytes,
+        or a tuple of those), or else 256 bits from a process-wide pool
+        that is refilled from os.urandom only occasionally.
+
+        Words are produced by hashing (entropy, spawn_key, counter) with
+        BLAKE2b, so successive calls to generate() return fresh values and
+        spawn() produces independent children without any further entropy.
+    '''
+    ENTROPY_BYTES = 32
+
+    def __init__(self, entropy=None, spawn_key=()):
+        if entropy is None:
+            entropy = pooled_urandom(self.ENTROPY_BYTES)
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        self.n_children_spawned = 0
+        self._material = _seed_material((entropy, self.spawn_key))
+        self._counter = 0
+        self._buffer = b''
+
+    def __repr__(self):
+        return 'SeedSequence(%r, %r)' % (self.entropy, self.spawn_key)
+
+    def _read(self, count):
+        chunks = [self._buffer]
+        have = len(self._buffer)
+        while have < count:
+            h = hashlib.blake2b(self._material, digest_size=64, person=b'pcg_random')
+            h.update(self._counter.to_bytes(8, 'little'))
+            self._counter += 1
+            chunks.append(h.digest())
+            have += 64
+        data = b''.join(chunks)
+        self._buffer = data[count:]
+        return data[:count]
+
+    def generate(self, itype, count=None):
+        ''' Produce the next value(s) of the given unsigned int type.
+
+            The signature matches itype.urandom().
+        '''
+        if count is not None:
+            assert isinstance(count, int) and count > 0
+        if count is None:
+            return itype._make(int.from_bytes(self._read(itype.BYTES), 'little'))
+        rb = self._read(itype.BYTES * count)
+        return [itype._make(int.from_bytes(rb[i1:i1+itype.BYTES], 'little')) for i1 in range(0, len(rb), itype.BYTES)]
+
+    def spawn(self, n):
+        ''' Create n child sequences, distinct from each other and from
+            every child spawned previously.
+        '''
+        start = self.n_children_spawned
+        self.n_children_spawned += n
+        return [SeedSequence(self.entropy, self.spawn_key + (i,)) for i in range(start, start + n)]
 
 def bounded_rand(rng, upper_bound):
     if not 0 < upper_bound:
@@ -73,9 +183,9 @@ def bounded_rand(rng, upper_bound):
 
     threshold = (rtype.MOD - upper_bound) % upper_bound
     while True:
-        r = rng()
+        r = int(rng())
         if r >= threshold:
-            return int(r) % upper_bound
+            return r % upper_bound
 
 def shuffle(arr, rng):
     count = len(arr)
@@ -84,6 +194,119 @@ def shuffle(arr, rng):
         count -= 1
         arr[chosen], arr[count] = arr[count], arr[chosen]
 
+# Packed bounded draws: several small bounds share one output.
+#
+# For bounds whose product P fits comfortably in an output, Lemire's
+# multiply-high method (with its exact rejection) gives one value in [0, P),
+# which is then split into mixed-radix digits. Each digit is exactly uniform
+# over its own bound, and they are independent.
+
+_PACK_SLACK = 8
+
+def _pack_limit(rng):
+    return 1 << max(0, type(rng.MAX).BITS - _PACK_SLACK)
+
+def _bounded_product(rng, product):
+    # Lemire: the high half of r * product, rejecting a low half that
+    # falls in the first (2**L mod product) values.
+    BITS = type(rng.MAX).BITS
+    mask = (1 << BITS) - 1
+    threshold = (1 << BITS) % product
+    while True:
+        m = int(rng()) * product
+        if (m & mask) >= threshold:
+            return m >> BITS
+
+def _check_bound(rng, upper_bound):
+    if not 0 < upper_bound:
+        raise ValueError('Bound must be positive!')
+    if not upper_bound <= rng.MAX:
+        raise ValueError('Bound must (currently) fit in result size!')
+
+def _packed_groups(rng, bounds):
+    # Greedily group consecutive bounds, yielding lists of digits.
+    limit = _pack_limit(rng)
+    group = []
+    product = 1
+    for b in bounds:
+        _check_bound(rng, b)
+        if group and product * b > limit:
+            yield _split_digits(_bounded_product(rng, product), group)
+            group = []
+            product = 1
+        group.append(b)
+        product *= b
+    if group:
+        yield _split_digits(_bounded_product(rng, product), group)
+
+def _split_digits(x, bounds):
+    digits = []
+    for b in bounds:
+        x, d = divmod(x, b)
+        digits.append(d)
+    return digits
+
+def bounded_rand_batch(rng, bounds):
+    ''' A list with one value in [0, b) for each b in bounds.
+
+        Unlike repeated bounded_rand(), consecutive small bounds share
+        engine outputs, so fewer are used.
+    '''
+    rv = []
+    for digits in _packed_groups(rng, bounds):
+        rv.extend(digits)
+    return rv
+
+def bounded_rand_n(rng, upper_bound, count):
+    ''' A list of count values in [0, upper_bound).
+    '''
+    return bounded_rand_batch(rng, [upper_bound] * count)
+
+class PackedBounded:
+    ''' Scalar form of bounded_rand_n(): each call returns one value in
+        [0, upper_bound), drawing a new engine output only when the
+        values extracted from the previous one have been used up.
+
+        A bound of 1 always gives 0, without drawing.
+    '''
+    __slots__ = ('rng', 'upper_bound', '_per', '_pending')
+
+    def __init__(self, rng, upper_bound):
+        _check_bound(rng, upper_bound)
+        self.rng = rng
+        self.upper_bound = upper_bound
+        per = 1
+        limit = _pack_limit(rng)
+        if upper_bound > 1:
+            while upper_bound ** (per + 1) <= limit:
+                per += 1
+        self._per = per
+        self._pending = []
+
+    def __call__(self):
+        pending = self._pending
+        if not pending:
+            bound = self.upper_bound
+            if bound == 1:
+                return 0
+            x = _bounded_product(self.rng, bound ** self._per)
+            digits = _split_digits(x, [bound] * self._per)
+            digits.reverse()
+            pending.extend(digits)
+        return pending.pop()
+
+def packed_shuffle(arr, rng):
+    ''' Like shuffle(), but the bounds share engine outputs.
+
+        The result differs from shuffle() for the same engine state.
+    '''
+    count = len(arr)
+    bounds = range(count, 1, -1)
+    for digits in _packed_groups(rng, bounds):
+        for chosen in digits:
+            count -= 1
+            arr[chosen], arr[count] = arr[count], arr[chosen]
+
 # static_arbitrary_seed appears to be used by *nobody* at all,
 # and what would it even mean in Python?
 
@@ -0,0 +1,243 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Random permutations of range(n), computed one element at a time.
+
+    A balanced Feistel network permutes [0, 2**b) for the smallest even
+    b with 2**b >= n; values outside range(n) are mapped again until they
+    land inside (cycle walking), which takes fewer than 4 steps on average.
+    Each round mixes one half with the RXS M XS output function, applied
+    to an LCG step of it plus a round key, so nothing is stored beyond the
+    keys.
+'''
+
+import functools
+
+from . import pcg_detail
+from .ints import uint64_t, uint128_t
+from .pcg_detail import AbstractEngine
+from .pcg_extras import SeedSequence
+
+
+@functools.lru_cache(None)
+def _mixer(itype):
+    engine = pcg_detail.oneseq_base(itype, itype, pcg_detail.rxs_m_xs_mixin, seed=False)
+    return engine._output, pcg_detail.default_multiplier_data[itype]
+
+
+class RandomPermutation:
+    ''' A lazily evaluated random permutation of range(n).
+
+        The round keys are drawn from an engine, or derived from a
+        SeedSequence (or from anything SeedSequence accepts as entropy).
+    '''
+    __slots__ = ('n', 'keys', '_half', '_word')
+
+    ROUNDS = 4
+
+    def __init__(self, n, engine_or_seed=None):
+        if not (isinstance(n, int) and 0 <= n <= 1 << 256):
+            raise ValueError('n must be an int in [0, 2**256]')
+        word = uint64_t if self._half_bits(n) <= 64 else uint128_t
+        if isinstance(engine_or_seed, AbstractEngine):
+            buf = bytearray(word.BYTES)
+            keys = []
+            for _ in range(self.ROUNDS):
+                engine_or_seed.readinto(buf, 'little')
+                keys.append(int.from_bytes(buf, 'little'))
+        else:
+            seed_seq = engine_or_seed
+            if not isinstance(seed_seq, SeedSequence):
+                seed_seq = SeedSequence(seed_seq)
+            keys = [int(k) for k in seed_seq.generate(word, self.ROUNDS)]
+        self._init(n, keys)
+
+    @classmethod
+    def from_keys(cls, n, keys):
+        ''' Rebuild a permutation from its n and keys.
+        '''
+        self = cls.__new__(cls)
+        self._init(n, [int(k) for k in keys])
+        return self
+
+    def _init(self, n, keys):
+        half = self._half_bits(n)
+        if half > uint128_t.BITS:
+            raise ValueError('n must be an int in [0, 2**256]')
+        word = uint64_t if half <= 64 else uint128_t
+        if len(keys) != self.ROUNDS or not all(0 <= k < word.MOD for k in keys):
+            raise ValueError('Bad round keys')
+        self.n = n
+        self.keys = tuple(keys)
+        self._half = half
+        self._word = word
+
+    @staticmethod
+    def _half_bits(n):
+        return max(1, ((n - 1).bit_length() + 1) // 2)
+
+    def __reduce__(self):
+        return (RandomPermutation.from_keys, (self.n, self.keys))
+
+    def __eq__(self, other):
+        if not isinstance(other, RandomPermutation):
+            return NotImplemented
+        return (self.n, self.keys) == (other.n, other.keys)
+
+    def __hash__(self):
+        return hash((self.n, self.keys))
+
+    def __repr__(self):
+        return '<RandomPermutation of range(%d)>' % self.n
+
+    def _round(self, key, r):
+        output, mult = _mixer(self._word)
+        word = self._word
+        x = (r * mult + key) & word.MASK
+        return int(output(word(x))) >> (word.BITS - self._half)
+
+    def _encrypt(self, x):
+        half = self._half
+        mask = (1 << half) - 1
+        left, right = x >> half, x & mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(key, right)
+        return left << half | right
+
+    def _decrypt(self, x):
+        half = self._half
+        mask = (1 << half) - 1
+        left, right = x >> half, x & mask
+        for key in reversed(self.keys):
+            left, right = right ^ self._round(key, left), left
+        return left << half | right
+
+    def _walk(self, step, x):
+        n = self.n
+        x = step(x)
+        while x >= n:
+            x = step(x)
+        return x
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._walk(self._encrypt, j) for j in range(self.n)[i]]
+        n = self.n
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('RandomPermutation index out of range')
+        return self._walk(self._encrypt, i)
+
+    def index(self, x):
+        ''' The position of x, i.e. the inverse permutation.
+        '''
+        if not (isinstance(x, int) and 0 <= x < self.n):
+            raise ValueError('%r is not in the permutation' % (x,))
+        return self._walk(self._decrypt, x)
+
+    def __contains__(self, x):
+        return isinstance(x, int) and 0 <= x < self.n
+
+    def __iter__(self):
+        encrypt = self._encrypt
+        walk = self._walk
+        for i in range(self.n):
+            yield walk(encrypt, i)
+
+    def chunks(self, size, start=0):
+        ''' Yield consecutive lists of up to size elements, from position
+            start onwards.
+        '''
+        if not size > 0:
+            raise ValueError('Chunk size must be positive')
+        for lo in range(start, self.n, size):
+            yield self[lo:lo + size]
+
+
+class ShardedSampler:
+    ''' One worker's share of a per-epoch random order of range(n).
+
+        The epoch's permutation depends only on (seed, epoch); worker rank
+        of world_size takes every world_size-th position of it, starting
+        at rank. So the shards interleave to the same global order for any
+        number of workers, and nothing is materialized.
+
+        With pad, positions wrap around to the start of the order so that
+        every shard has the same length.
+    '''
+    __slots__ = ('n', 'seed', 'epoch', 'rank', 'world_size', 'pad', 'permutation')
+
+    def __init__(self, n, seed, epoch=0, rank=0, world_size=1, pad=False):
+        if seed is None:
+            raise ValueError('Workers must share an explicit seed')
+        if not world_size > 0:
+            raise ValueError('world_size must be positive')
+        if not 0 <= rank < world_size:
+            raise ValueError('rank must be in range(world_size)')
+        self.n = n
+        self.seed = seed
+        self.rank = rank
+        self.world_size = world_size
+        self.pad = pad
+        self.set_epoch(epoch)
+
+    def set_epoch(self, epoch):
+        self.epoch = epoch
+        self.permutation = RandomPermutation(self.n, SeedSequence(self.seed, spawn_key=(epoch,)))
+
+    def _positions(self):
+        n = self.n
+        world_size = self.world_size
+        total = n
+        if self.pad and n:
+            total = -(-n // world_size) * world_size
+        return range(self.rank, total, world_size)
+
+    def __len__(self):
+        return len(self._positions())
+
+    def __getitem__(self, i):
+        perm = self.permutation
+        n = self.n
+        if isinstance(i, slice):
+            return [perm[pos % n] for pos in self._positions()[i]]
+        return perm[self._positions()[i] % n]
+
+    def __iter__(self):
+        perm = self.permutation
+        n = self.n
+        for pos in self._positions():
+            yield perm[pos % n]
+
+    def batches(self, batch_size, drop_last=False):
+        ''' Yield this shard's indices as lists of batch_size.
+        '''
+        if not batch_size > 0:
+            raise ValueError('batch_size must be positive')
+        perm = self.permutation
+        n = self.n
+        positions = self._positions()
+        for lo in range(0, len(positions), batch_size):
+            chunk = positions[lo:lo + batch_size]
+            if drop_last and len(chunk) < batch_size:
+                return
+            yield [perm[pos % n] for pos in chunk]
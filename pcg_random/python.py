@@ -22,6 +22,8 @@
 import random
 from .pcg_detail import AbstractEngine
 from .pcg_engines import setseq_xsh_rr_64_32 as pcg32
+from .threadlocal import ThreadLocalEngine
+from . import discrete, ziggurat
 
 
 class PcgRandom(random.Random):
@@ -32,36 +34,137 @@ class PcgRandom(random.Random):
         # __init__. Our `engine` arg confuses it, so drop the arguments.
         return super().__new__(cls)
 
-    def __init__(self, engine=pcg32, *seed_args, **seed_kwargs):
+    def __init__(self, engine=pcg32, *seed_args, bit_reservoir=False, **seed_kwargs):
         if not isinstance(engine, AbstractEngine):
             self._engine = engine(*seed_args, **seed_kwargs)
         else:
             assert not seed_args and not seed_kwargs
             self._engine = engine
+        # If enabled, getrandbits() keeps the unused high bits of the last
+        # word for next time, instead of throwing them away.
+        self._bit_reservoir = bit_reservoir
+        self._reservoir = 0
+        self._reservoir_bits = 0
+
+    @classmethod
+    def thread_local(cls, master=None, engine=pcg32):
+        ''' Share one instance between threads, each drawing from its own
+            engine derived from `master`. See threadlocal.ThreadLocalEngine.
+        '''
+        return cls(ThreadLocalEngine(master, engine))
 
     def seed(self, *seed_args, **seed_kwargs):
         self._engine.seed(*seed_args, **seed_kwargs)
+        self._reservoir = 0
+        self._reservoir_bits = 0
 
     def getstate(self):
-        return self._engine.__reduce__()
+        state = self._engine.__reduce__()
+        if self._bit_reservoir:
+            state += (True, self._reservoir, self._reservoir_bits)
+        return state
 
     def setstate(self, state):
-        c, a = state
+        # This instance keeps its own mode: a plain one drops any saved
+        # reservoir bits, and a reservoir one starts empty from a plain
+        # state. Either way the engine continues from the same place.
+        c, a, *reservoir = state
         self._engine = c(*a)
+        if self._bit_reservoir and reservoir:
+            _, self._reservoir, self._reservoir_bits = reservoir
+        else:
+            self._reservoir = 0
+            self._reservoir_bits = 0
+
+    @classmethod
+    def from_state(cls, state, bit_reservoir=False):
+        ''' Make an instance in the given mode, and setstate() it.
+        '''
+        rv = cls(pcg32, False, bit_reservoir=bit_reservoir)
+        rv.setstate(state)
+        return rv
+
+    def __reduce__(self):
+        # random.Random's version rebuilds with the default arguments,
+        # which would lose the mode.
+        return (self.__class__.from_state, (self.getstate(), self._bit_reservoir))
 
     def getrandbits(self, k):
         assert isinstance(k, int) and k >= 0
+        if self._bit_reservoir:
+            return self._getrandbits_reservoir(k)
+        return self._getrandbits(k)
+
+    def _getrandbits(self, k):
+        engine = self._engine
+        BITS_PER_CALL = engine.result_type.BITS
+        if k <= BITS_PER_CALL:
+            if not k:
+                return 0
+            return int(engine()) & ((1 << k) - 1)
+        # Accumulating with shifts and ors is quadratic in k. Instead,
+        # lay out whole words as bytes and convert them all at once.
+        words = -(-k // BITS_PER_CALL)
+        buf = bytearray(words * engine.result_type.BYTES)
+        engine.readinto(buf, 'little')
+        return int.from_bytes(buf, 'little') & ((1 << k) - 1)
+
+    def _getrandbits_reservoir(self, k):
+        have = self._reservoir_bits
+        if k <= have:
+            rv = self._reservoir & ((1 << k) - 1)
+            self._reservoir >>= k
+            self._reservoir_bits = have - k
+            return rv
+        need = k - have
         BITS_PER_CALL = self._engine.result_type.BITS
-        shift = 0
-        rv = 0
-        while k >= BITS_PER_CALL:
-            rv |= int(self._engine()) << shift
-            shift += BITS_PER_CALL
-            k -= BITS_PER_CALL
-        if k:
-            rv |= (int(self._engine()) % (1 << k)) << shift
+        fresh_bits = -(-need // BITS_PER_CALL) * BITS_PER_CALL
+        fresh = self._getrandbits(fresh_bits)
+        rv = self._reservoir | (fresh & ((1 << need) - 1)) << have
+        self._reservoir = fresh >> need
+        self._reservoir_bits = fresh_bits - need
         return rv
 
+    def _randbelow(self, n):
+        # randrange, choice, shuffle and sample all come through here.
+        # Where the bound fits, use the engine's own bounded sampling
+        # rather than rejecting getrandbits() results bit by bit.
+        engine = self._engine
+        MAX = int(engine.MAX)
+        if n <= MAX:
+            return engine(n)
+        if n == MAX + 1:
+            return int(engine())
+        return self._randbelow_with_getrandbits(n)
+
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
+        if cum_weights is not None:
+            return super().choices(population, weights, cum_weights=cum_weights, k=k)
+        n = len(population)
+        if weights is not None:
+            # The base version bisects cumulative weights, rebuilt every call.
+            # Recent tables are cached by their weights; callers can also
+            # pass an AliasTable directly, and skip even the lookup.
+            if len(weights) != n:
+                raise ValueError('The number of weights does not match the population')
+            if not isinstance(weights, discrete.AliasTable):
+                weights = discrete.AliasTable.cached(weights)
+            sample = weights.sample
+            return [population[sample(self)] for _ in range(k)]
+        # The base version uses a float per pick.
+        if not n and k > 0:
+            raise IndexError('Cannot choose from an empty population')
+        randbelow = self._randbelow
+        return [population[randbelow(n)] for _ in range(k)]
+
+    def randbytes(self, n):
+        # The base version goes through one huge getrandbits() int.
+        # Little-endian words give the same bytes as that version, on
+        # every platform.
+        rv = bytearray(n)
+        self._engine.readinto(rv, 'little')
+        return bytes(rv)
+
     def random(self):
         # Floating-point division of integers is hard to do correctly.
         # (Python does it right, however.)
@@ -76,4 +179,45 @@ class PcgRandom(random.Random):
         # result rely on truncation. Consider if the RNG produced 2**64-1.
         # (There are other problems if addition is used on the result)
         # UNSAFE: return self.getrandbits(64) / 2**64
-        return self.getrandbits(53) / 2**53
+        engine = self._engine
+        BITS = engine.result_type.BITS
+        if self._bit_reservoir or BITS < 32:
+            return self.getrandbits(53) / 2**53
+        # Inline what getrandbits(53) would do, with one or two draws.
+        if BITS < 53:
+            return (int(engine()) | (int(engine()) & 0x1fffff) << 32) / 2**53
+        return (int(engine()) & 0x1fffffffffffff) / 2**53
+
+    def random_array(self, n, dtype='float64'):
+        ''' Return a NumPy array of n floats in [0, 1), with exactly the
+            values that n calls of random() would give (for float64), or
+            of getrandbits(24) / 2**24 (for float32).
+        '''
+        from . import arrays
+        if self._bit_reservoir:
+            import numpy as np
+            k = arrays.float_bits(dtype)
+            bits = np.array([self.getrandbits(k) for _ in range(n)], np.uint64)
+            return bits.astype(dtype) * np.dtype(dtype).type(2.0 ** -k)
+        return arrays.random_floats(self._engine, n, dtype)
+
+    def standard_normal(self, size=None):
+        ''' Ziggurat normal variates; a NumPy array if size is given.
+        '''
+        return ziggurat.standard_normal(self._engine, size)
+
+    def normal(self, mu=0.0, sigma=1.0, size=None):
+        return ziggurat.normal(self._engine, mu, sigma, size)
+
+    def exponential(self, lambd=1.0, size=None):
+        ''' Ziggurat exponential variates; a NumPy array if size is given.
+        '''
+        return ziggurat.exponential(self._engine, lambd, size)
+
+    # The base versions need several random() calls per variate.
+
+    def normalvariate(self, mu=0.0, sigma=1.0):
+        return ziggurat.normal(self._engine, mu, sigma)
+
+    def expovariate(self, lambd=1.0):
+        return ziggurat.exponential(self._engine, lambd)
@@ -0,0 +1,247 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Reservoir sampling: k items from a stream of unknown length.
+
+    Both samplers skip ahead rather than drawing for every item, so the
+    number of draws grows only logarithmically with the stream length:
+
+        Reservoir           Algorithm L (Li, 1994)
+        WeightedReservoir   A-ExpJ (Efraimidis and Spirakis, 2006)
+
+    Chunks that support len() and indexing (lists, NumPy arrays) are
+    indexed directly at the chosen positions; other iterables are consumed
+    with islice(). The results depend only on the items and the engine
+    state, not on how the stream was split into chunks (for weights given
+    as NumPy arrays, up to rounding in their cumulative sums).
+'''
+
+import heapq
+import itertools
+import math
+
+
+def _is_sequence(chunk):
+    return hasattr(chunk, '__len__') and hasattr(chunk, '__getitem__')
+
+def _log_random(rng):
+    # log of a uniform in (0, 1]
+    return math.log(1.0 - rng.random())
+
+
+class Reservoir:
+    ''' A uniform sample of k items, without replacement.
+    '''
+    __slots__ = ('k', 'rng', 'items', 'seen', '_log_w', '_next')
+
+    def __init__(self, k, rng):
+        if not k >= 0:
+            raise ValueError('k must be non-negative')
+        self.k = k
+        self.rng = rng
+        self.items = []
+        self.seen = 0
+        self._log_w = 0.0
+        self._next = None
+
+    def _advance(self):
+        # Set the index of the next item to take, and the new threshold.
+        self._log_w += _log_random(self.rng) / self.k
+        w = math.exp(self._log_w)
+        if w >= 1.0:
+            skip = 0
+        elif w <= 0.0:
+            skip = math.inf
+        else:
+            skip = math.floor(_log_random(self.rng) / math.log1p(-w))
+        self._next = self._next + skip + 1
+
+    def _take(self, item):
+        self.items[self.rng.randrange(self.k)] = item
+        self._advance()
+
+    def extend(self, chunk):
+        ''' Feed the next items of the stream.
+        '''
+        k = self.k
+        if not k:
+            return
+        if _is_sequence(chunk):
+            base = self.seen
+            count = len(chunk)
+            start = 0
+            if len(self.items) < k:
+                start = min(count, k - len(self.items))
+                self.items.extend(chunk[i] for i in range(start))
+                if len(self.items) < k:
+                    self.seen = base + count
+                    return
+                # the last item just added
+                self._next = base + start - 1
+                self._advance()
+            end = base + count
+            while self._next < end:
+                self._take(chunk[self._next - base])
+            self.seen = end
+            return
+        it = iter(chunk)
+        if len(self.items) < k:
+            self.items.extend(itertools.islice(it, k - len(self.items)))
+            self.seen = len(self.items)
+            if len(self.items) < k:
+                return
+            if self._next is None:
+                self._next = k - 1
+                self._advance()
+        counter = itertools.count(self.seen)
+        counted = zip(it, counter)
+        while True:
+            for item, index in itertools.islice(counted, self._next - self.seen, None):
+                self.seen = index + 1
+                self._take(item)
+                break
+            else:
+                self.seen = next(counter)
+                return
+
+    def append(self, item):
+        self.extend((item,))
+
+    def sample(self):
+        ''' The current sample, as a new list.
+        '''
+        return list(self.items)
+
+
+def reservoir_sample(iterable, k, rng):
+    ''' A list of k items chosen uniformly from iterable (or all of them,
+        if there are fewer), in O(k log(n/k)) draws from rng.
+    '''
+    r = Reservoir(k, rng)
+    r.extend(iterable)
+    return r.sample()
+
+
+class WeightedReservoir:
+    ''' A sample of k items, without replacement, where each item is
+        chosen with probability proportional to its weight among those
+        remaining (the Efraimidis-Spirakis scheme).
+
+        Keys are kept as logarithms, so that large weights do not
+        underflow. Items of weight 0 are never chosen.
+    '''
+    __slots__ = ('k', 'rng', 'heap', 'seen', '_jump', '_tiebreak')
+
+    def __init__(self, k, rng):
+        if not k >= 0:
+            raise ValueError('k must be non-negative')
+        self.k = k
+        self.rng = rng
+        self.heap = []
+        self.seen = 0
+        self._jump = None
+        self._tiebreak = itertools.count()
+
+    def _threshold(self):
+        # log of the smallest key: the one to beat
+        return self.heap[0][0]
+
+    def _new_jump(self):
+        self._jump = _log_random(self.rng) / self._threshold()
+
+    def _offer(self, item, weight):
+        if not weight >= 0.0:
+            raise ValueError('Weights must be non-negative')
+        heap = self.heap
+        if len(heap) < self.k:
+            if weight > 0.0:
+                heapq.heappush(heap, (_log_random(self.rng) / weight, next(self._tiebreak), item))
+                if len(heap) == self.k:
+                    self._new_jump()
+            return
+        self._jump -= weight
+        if self._jump > 0.0:
+            return
+        # The new key is uniform above the threshold, as seen by this weight.
+        t = math.exp(self._threshold() * weight)
+        r = t + (1.0 - t) * self.rng.random()
+        key = math.log(r) / weight if r < 1.0 else 0.0
+        heapq.heapreplace(heap, (key, next(self._tiebreak), item))
+        self._new_jump()
+
+    def extend(self, items, weights=None):
+        ''' Feed the next items of the stream, either as (item, weight)
+            pairs or as parallel items and weights.
+        '''
+        if not self.k:
+            return
+        if weights is None:
+            pairs = items
+        else:
+            if hasattr(weights, 'cumsum') and _is_sequence(items):
+                return self._extend_array(items, weights)
+            pairs = zip(items, weights)
+        for item, weight in pairs:
+            self.seen += 1
+            self._offer(item, float(weight))
+
+    def _extend_array(self, items, weights):
+        # Find each taken item by searching the cumulative weights.
+        import numpy as np
+        weights = np.asarray(weights, np.float64)
+        if len(weights) != len(items):
+            raise ValueError('Need one weight per item')
+        if len(weights) and not weights.min() >= 0.0:
+            raise ValueError('Weights must be non-negative')
+        n = len(weights)
+        i = 0
+        while i < n and len(self.heap) < self.k:
+            self._offer(items[i], float(weights[i]))
+            i += 1
+        cum = np.cumsum(weights[i:])
+        base = 0.0
+        while i < n:
+            # first item where the jump is used up
+            j = int(np.searchsorted(cum, base + self._jump, side='left'))
+            if j >= len(cum):
+                self._jump -= float(cum[-1]) - base
+                break
+            start = n - len(cum)
+            prev = float(cum[j - 1]) if j else 0.0
+            self._jump -= prev - base
+            self._offer(items[start + j], float(weights[start + j]))
+            base = float(cum[j])
+            i = start + j + 1
+        self.seen += n
+
+    def append(self, item, weight):
+        self.extend(((item, weight),))
+
+    def sample(self):
+        ''' The current sample, as a new list, highest key first.
+        '''
+        return [item for key, _, item in sorted(self.heap, reverse=True)]
+
+
+def weighted_reservoir_sample(pairs, k, rng):
+    ''' A list of k items from an iterable of (item, weight) pairs, chosen
+        without replacement with probability proportional to weight.
+    '''
+    r = WeightedReservoir(k, rng)
+    r.extend(pairs)
+    return r.sample()
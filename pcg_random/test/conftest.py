@@ -0,0 +1,73 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Engines with a fixed seed, shared by the tests.
+
+    Tests take `make_engine` or `make_random`, and call it for as many
+    identical copies as they need. They run once for each of ENGINE_NAMES;
+    a module overrides the `engine_name` fixture to use others, and a test
+    parametrizes `engine_name` directly to use just one.
+'''
+
+import pcg_random
+from pcg_random import pcg_detail, pcg_engines
+
+import pytest
+
+
+ENGINE_NAMES = ['pcg8_once_insecure', 'pcg16_once_insecure', 'pcg32', 'pcg32_oneseq', 'pcg32_fast', 'pcg64', 'pcg128_once_insecure']
+
+
+def seeded_engine(name):
+    ''' The named engine (from pcg_random, else pcg_engines) with state 42,
+        and stream 54 where it has a choice of streams.
+    '''
+    rng_class = getattr(pcg_random, name, None) or getattr(pcg_engines, name)
+    rng = rng_class(seed=False)
+    itype = rng.itype
+    args = [itype(42)]
+    if rng.can_specify_stream:
+        args.append(itype(54))
+    if isinstance(rng, pcg_detail.Extended):
+        rng.seed(*args, data=False)
+    else:
+        rng.seed(*args)
+    return rng
+
+
+@pytest.fixture(params=ENGINE_NAMES)
+def engine_name(request):
+    return request.param
+
+
+@pytest.fixture
+def make_engine(engine_name):
+    ''' A factory of seeded engines, of engine_name unless told otherwise.
+    '''
+    def make_engine(name=engine_name):
+        return seeded_engine(name)
+    return make_engine
+
+
+@pytest.fixture
+def make_random(engine_name):
+    ''' Like make_engine, but wrapped in a PcgRandom.
+    '''
+    def make_random(name=engine_name, **kwargs):
+        return pcg_random.PcgRandom(seeded_engine(name), **kwargs)
+    return make_random
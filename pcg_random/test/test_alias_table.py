@@ -0,0 +1,125 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import AliasTable
+
+import collections
+import pytest
+import random
+
+
+def frequencies(indices, n):
+    counts = [0] * n
+    for i in indices:
+        counts[i] += 1
+    return [c / len(indices) for c in counts]
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg64'
+
+
+class TestAliasTable:
+    def test_construction(self):
+        weights = [1, 2, 3, 0, 4]
+        table = AliasTable(weights)
+        assert len(table) == 5
+        # each column's own share plus what others alias to it
+        n = len(weights)
+        mass = [0.0] * n
+        for i in range(n):
+            mass[i] += table.prob[i] / n
+            mass[table.alias[i]] += (1 - table.prob[i]) / n
+        for m, w in zip(mass, weights):
+            assert m == pytest.approx(w / 10)
+
+    def test_sample(self, make_random):
+        rng = make_random()
+        weights = [1, 2, 3, 0, 4]
+        freq = frequencies([AliasTable(weights).sample(rng) for _ in range(20000)], 5)
+        assert freq[3] == 0
+        for f, w in zip(freq, weights):
+            assert abs(f - w / 10) < 0.015
+
+    def test_invalid(self):
+        for weights in [[], [0, 0], [1, -1], [1, float('inf')], [float('nan')]]:
+            with pytest.raises(ValueError):
+                AliasTable(weights)
+
+    def test_cached(self):
+        weights = [5, 1, 1]
+        table = AliasTable.cached(weights)
+        assert AliasTable.cached(tuple(weights)) is table
+        assert AliasTable.cached([5, 1, 2]) is not table
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_choices(self, make_random):
+        rng = make_random()
+        picks = rng.choices('abc', weights=[0, 3, 1], k=4000)
+        assert 'a' not in picks
+        assert abs(picks.count('b') / 4000 - 0.75) < 0.03
+        with pytest.raises(ValueError):
+            rng.choices('abc', weights=[1, 2])
+        # deterministic for a given seed
+        assert make_random().choices('abc', weights=[0, 3, 1], k=4000) == picks
+        # a prebuilt table gives the same picks
+        table = AliasTable([0, 3, 1])
+        assert make_random().choices('abc', weights=table, k=4000) == picks
+        with pytest.raises(ValueError):
+            rng.choices('ab', weights=table)
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_choices_cached(self, make_random, monkeypatch):
+        built = []
+        init = AliasTable.__init__
+        def counting_init(self, weights):
+            built.append(list(weights))
+            init(self, weights)
+        monkeypatch.setattr(AliasTable, '__init__', counting_init)
+        monkeypatch.setattr(AliasTable, '_cache', collections.OrderedDict())
+        rng = make_random()
+        first = rng.choices('abcd', weights=[4, 1, 1, 7], k=100)
+        second = rng.choices('abcd', weights=[4, 1, 1, 7], k=100)
+        assert built == [[4, 1, 1, 7]]
+        assert first != second
+        assert make_random().choices('abcd', weights=(4, 1, 1, 7), k=100) == first
+        assert built == [[4, 1, 1, 7]]
+
+    def test_random_random(self):
+        # only randrange() and random() are needed
+        table = AliasTable([1, 2, 3])
+        a = random.Random(5)
+        b = random.Random(5)
+        expected = []
+        for _ in range(50):
+            i = b.randrange(3)
+            expected.append(i if b.random() < table.prob[i] else table.alias[i])
+        assert [table.sample(a) for _ in range(50)] == expected
+
+    def test_batched(self, make_random):
+        np = pytest.importorskip('numpy')
+        weights = np.array([1.0, 2.0, 3.0, 0.0, 4.0])
+        table = AliasTable.cached(weights)
+        assert AliasTable.cached(weights.copy()) is table
+        a = table.sample(make_random(), (100, 200))
+        assert a.shape == (100, 200)
+        assert a.dtype == np.int64
+        freq = np.bincount(a.ravel(), minlength=5) / a.size
+        assert np.all(np.abs(freq - weights / 10) < 0.01)
+        assert np.array_equal(table.sample(make_random(), (100, 200)), a)
@@ -0,0 +1,167 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import random
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from pcg_random import arrays
+
+
+class TestWords:
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_words(self, make_engine):
+        rng = make_engine()
+        check = make_engine()
+        w = arrays.words(rng, 10)
+        assert w.dtype == np.uint32
+        assert w.tolist() == [int(check()) for _ in range(10)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg128_once_insecure'])
+    def test_no_dtype(self, make_engine):
+        with pytest.raises(TypeError):
+            arrays.words(make_engine(), 3)
+
+    @pytest.mark.parametrize('k', [1, 24, 53, 64])
+    def test_random_bits(self, make_random, k):
+        rng = make_random()
+        check = make_random()
+        assert arrays.random_bits(rng._engine, 20, k).tolist() == [check.getrandbits(k) for _ in range(20)]
+
+
+class TestRandomArray:
+    def test_float64(self, make_random):
+        rng = make_random()
+        check = make_random()
+        a = rng.random_array(50)
+        assert a.dtype == np.float64
+        assert a.tolist() == [check.random() for _ in range(50)]
+        assert rng._engine == check._engine
+
+    def test_float32(self, make_random):
+        rng = make_random()
+        check = make_random()
+        a = rng.random_array(50, np.float32)
+        assert a.dtype == np.float32
+        assert a.tolist() == [check.getrandbits(24) / 2**24 for _ in range(50)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_reservoir(self, make_random):
+        rng = make_random(bit_reservoir=True)
+        check = make_random(bit_reservoir=True)
+        assert rng.random_array(20).tolist() == [check.random() for _ in range(20)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_bad_dtype(self, make_random):
+        with pytest.raises(TypeError):
+            make_random().random_array(3, np.int32)
+
+
+VECTOR_NAMES = ['pcg8_once_insecure', 'pcg16_once_insecure', 'pcg32', 'pcg32_once_insecure', 'pcg32_fast']
+STATE_DTYPES = {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64}
+
+
+def lanes(engine, name, n=40):
+    itype = engine.itype
+    chooser = random.Random(name)
+    states = [chooser.randrange(itype.MOD) | (3 if engine._is_mcg else 0) for _ in range(n)]
+    deltas = [chooser.randrange(itype.MOD) for _ in range(n)]
+    return states, deltas
+
+
+class TestVectorJump:
+    @pytest.mark.parametrize('engine_name', VECTOR_NAMES)
+    def test_advance_distance(self, engine_name, make_engine):
+        engine = make_engine()
+        states, deltas = lanes(engine, engine_name)
+        itype = engine.itype
+        dtype = STATE_DTYPES[itype.BITS]
+        mult = engine._multiplier()
+        inc = engine.increment()
+        out = arrays.vector_advance(np.array(states, dtype), np.array(deltas, dtype), dtype(int(mult)), dtype(int(inc)))
+        expected = [int(engine._staticmethod_advance(itype(s), d, mult, inc)) for s, d in zip(states, deltas)]
+        assert out.tolist() == expected
+        dist = arrays.vector_distance(np.array(states, dtype), out, dtype(int(mult)), dtype(int(inc)), mcg=engine._is_mcg)
+        assert dist.tolist() == [int(engine._staticmethod_distance_bitwise(itype(s), itype(e), mult, inc))
+                for s, e in zip(states, expected)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_per_lane_parameters(self, make_engine):
+        # different streams, and negative deltas going backwards
+        engine = make_engine()
+        mult = int(engine._multiplier())
+        states = np.array([1, 2, 3], np.uint64)
+        incs = np.array([1, 3, 5], np.uint64)
+        forward = arrays.vector_advance(states, np.array([10, 20, 30]), mult, incs)
+        back = arrays.vector_advance(forward, np.array([-10, -20, -30]), mult, incs)
+        assert back.tolist() == [1, 2, 3]
+        assert arrays.vector_distance(states, forward, mult, incs).tolist() == [10, 20, 30]
+        assert arrays.vector_distance(states, forward, mult, incs, mask=0xf).tolist() == [10, 4, 14]
+
+    @pytest.mark.parametrize('engine_name', ['pcg64', 'pcg64_fast', 'pcg128_once_insecure'])
+    def test_advance_distance_128(self, engine_name, make_engine):
+        engine = make_engine()
+        states, deltas = lanes(engine, engine_name)
+        itype = engine.itype
+        mult = engine._multiplier()
+        inc = engine.increment()
+        out = arrays.vector_advance128(arrays.to_limbs(states), arrays.to_limbs(deltas),
+                arrays.to_limbs([mult]), arrays.to_limbs([inc]))
+        assert out.shape == (len(states), 2)
+        expected = [int(engine._staticmethod_advance(itype(s), d, mult, inc)) for s, d in zip(states, deltas)]
+        assert arrays.from_limbs(out) == expected
+        dist = arrays.vector_distance128(arrays.to_limbs(states), out,
+                arrays.to_limbs([mult]), arrays.to_limbs([inc]), mcg=engine._is_mcg)
+        assert arrays.from_limbs(dist) == [int(engine._staticmethod_distance_bitwise(itype(s), itype(e), mult, inc))
+                for s, e in zip(states, expected)]
+
+    def test_limbs(self):
+        values = [0, 1, (1 << 64) - 1, 1 << 64, (1 << 128) - 1]
+        assert arrays.from_limbs(arrays.to_limbs(values)) == values
+        with pytest.raises(ValueError):
+            arrays.vector_advance128(np.zeros(3, np.uint64), arrays.to_limbs([1]), arrays.to_limbs([5]), arrays.to_limbs([1]))
+        with pytest.raises(TypeError):
+            arrays.vector_advance(np.zeros(3, np.int64), 1, 5, 1)
+
+
+class TestLcgOutputs:
+    @pytest.mark.parametrize('engine_name', ['setseq_xsh_rs_16_8', 'mcg_xsh_rr_32_16', 'setseq_xsh_rr_64_32',
+            'oneseq_rxs_m_xs_8_8', 'setseq_rxs_m_xs_64_64', 'setseq_xsl_rr_64_32', 'oneseq_xsl_rr_rr_64_64',
+            'setseq_xsh_rs_128_64', 'mcg_xsh_rr_128_64', 'setseq_xsl_rr_128_64', 'oneseq_xsh_rr_128_64'])
+    def test_matches_scalar(self, make_engine):
+        engine = make_engine()
+        check = make_engine()
+        words, state = arrays.lcg_outputs(engine, int(engine._state), 300, int(engine._multiplier()), int(engine.increment()))
+        assert words.tolist() == [int(check()) for _ in range(300)]
+        assert state == int(check._state)
+
+    @pytest.mark.parametrize('engine_name', ['pcg32', 'pcg64'])
+    def test_stride(self, make_engine):
+        lane = make_engine().leapfrog(7, 3)
+        check = lane.copy()
+        words, _ = arrays.lcg_outputs(lane.engine, int(lane.engine._state), 50, int(lane._mult), int(lane._plus))
+        assert words.tolist() == [int(check()) for _ in range(50)]
+
+    @pytest.mark.parametrize('engine_name', ['setseq_rxs_m_xs_128_128', 'setseq_xsl_rr_rr_128_128'])
+    def test_unsupported(self, make_engine):
+        engine = make_engine()
+        assert arrays.lcg_outputs(engine, int(engine._state), 50, int(engine._multiplier()), int(engine.increment())) is None
+        # the scalar path still serves long fills
+        check = make_engine()
+        assert engine.fill([None] * 50) == [check() for _ in range(50)]
@@ -0,0 +1,118 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import Buffered, PcgRandom, pcg_detail
+
+import pickle
+import pytest
+
+
+@pytest.fixture(params=['pcg32', 'pcg64', 'pcg32_fast', 'pcg32_k2'])
+def engine_name(request):
+    return request.param
+
+
+class TestBuffered:
+    def test_outputs(self, make_engine):
+        plain = make_engine()
+        buffered = Buffered(make_engine(), block=7)
+        assert [buffered() for _ in range(30)] == [plain() for _ in range(30)]
+        assert [buffered(6) for _ in range(30)] == [plain(6) for _ in range(30)]
+        assert buffered.fill([None] * 19) == plain.fill([None] * 19)
+        assert buffered == plain
+        assert plain == buffered
+
+    def test_state(self, make_engine):
+        plain = make_engine()
+        buffered = Buffered(make_engine(), block=8)
+        for delta in [3, 2, 20, 1]:
+            for _ in range(delta):
+                buffered()
+                plain()
+            start = make_engine()
+            assert int(buffered - start) == int(plain - start)
+            assert int(start - buffered) == int(start - plain)
+            assert buffered.copy() == plain
+            assert pickle.loads(pickle.dumps(buffered)) == plain
+        buffered.backstep(2)
+        plain.backstep(2)
+        assert buffered() == plain()
+        buffered.backstep(20)
+        plain.backstep(20)
+        assert buffered() == plain()
+        buffered.advance(3)
+        plain.advance(3)
+        assert buffered() == plain()
+        buffered.advance(100)
+        plain.advance(100)
+        assert buffered() == plain()
+        assert buffered == plain
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_copy_independent(self, make_engine):
+        a = Buffered(make_engine(), block=4)
+        a()
+        b = a.copy()
+        assert [a() for _ in range(10)] == [b() for _ in range(10)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_seed(self, make_engine):
+        itype = pcg_random.pcg32.itype
+        a = Buffered(make_engine())
+        a()
+        a.seed(itype(1), itype(2))
+        assert a == pcg_random.pcg32(itype(1), itype(2))
+        assert a() == pcg_random.pcg32(itype(1), itype(2))()
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_pcg_random(self, make_engine):
+        plain = PcgRandom(make_engine())
+        buffered = PcgRandom(Buffered(make_engine(), block=16))
+        assert [buffered.random() for _ in range(40)] == [plain.random() for _ in range(40)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32', 'pcg64', 'pcg32_fast'])
+    def test_bulk(self, make_engine, monkeypatch):
+        # With NumPy, a refill is a handful of array operations, not one
+        # output() call per word.
+        pytest.importorskip('numpy')
+        plain = make_engine()
+        buffered = Buffered(make_engine(), block=256)
+        short = make_engine()
+        calls = []
+        for engine in [buffered.engine, short]:
+            output = engine._output
+            def counting_output(state, output=output):
+                calls.append(state)
+                return output(state)
+            monkeypatch.setattr(engine, '_output', counting_output)
+        assert [buffered() for _ in range(1000)] == [plain() for _ in range(1000)]
+        assert calls == []
+        assert buffered == plain
+        # too short to be worth it
+        assert short.fill([None] * 5) == make_engine().fill([None] * 5)
+        assert len(calls) == 5
+
+
+    @pytest.mark.parametrize('engine_name', ['pcg32', 'pcg64'])
+    def test_without_numpy(self, make_engine, monkeypatch):
+        monkeypatch.setattr(pcg_detail, '_arrays_module', lambda: None)
+        plain = make_engine()
+        buffered = Buffered(make_engine(), block=256)
+        assert [buffered() for _ in range(300)] == [plain() for _ in range(300)]
+        assert buffered.randbytes(1000) == plain.randbytes(1000)
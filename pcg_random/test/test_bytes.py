@@ -0,0 +1,165 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import Buffered, PcgRandom, pcg_detail
+
+import array
+import random
+import sys
+import pytest
+
+
+class TestReadinto:
+    @pytest.mark.parametrize('byteorder', ['little', 'big'])
+    @pytest.mark.parametrize('count', [0, 1, 5, 16, 37])
+    def test_layout(self, make_engine, byteorder, count):
+        rng = make_engine()
+        check = make_engine()
+        size = rng.result_type.BYTES
+        buf = bytearray(count)
+        assert rng.readinto(buf, byteorder) == count
+        words = -(-count // size)
+        expected = b''.join(int(check()).to_bytes(size, byteorder) for _ in range(words))
+        assert bytes(buf) == expected[:count]
+        assert rng == check
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_little_endian(self, make_engine):
+        rng = make_engine()
+        check = make_engine()
+        assert rng.randbytes(12) == b''.join(int(check()).to_bytes(4, 'little') for _ in range(3))
+        # fixed, whatever the platform
+        assert make_engine().randbytes(8).hex() == 'b7025ca109f4477b'
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_large(self, make_engine):
+        rng = make_engine()
+        check = make_engine()
+        data = rng.randbytes(8 * 5000 + 3)
+        assert data[:8] == int(check()).to_bytes(8, 'little')
+        check.advance(4998)
+        assert data[-11:-3] == int(check()).to_bytes(8, 'little')
+        assert data[-3:] == int(check()).to_bytes(8, 'little')[:3]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_memoryview(self, make_engine):
+        rng = make_engine()
+        arr = array.array('I', bytes(40))
+        rng.readinto(arr, sys.byteorder)
+        check = make_engine()
+        assert arr.tolist() == [int(check()) for _ in range(10)]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_buffered(self, make_engine):
+        assert Buffered(make_engine(), 3).randbytes(33) == make_engine().randbytes(33)
+
+
+class TestRandbytes:
+    def test_matches_stdlib(self, make_engine):
+        ours = PcgRandom(make_engine())
+        theirs = PcgRandom(make_engine())
+        for n in [0, 1, 7, 16, 33]:
+            assert ours.randbytes(n) == random.Random.randbytes(theirs, n)
+
+
+def popcount(data):
+    return sum(bin(b).count('1') for b in data)
+
+
+class TestBernoulliBits:
+    def test_half(self, make_engine):
+        # p = 1/2 is a single step: the raw bits themselves
+        rng = make_engine()
+        assert rng.bernoulli_bits(0.5, 80) == make_engine().randbytes(10)
+
+    @pytest.mark.parametrize('p', [0.01, 0.3, 0.75, 0.999])
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_frequency(self, make_engine, p):
+        rng = make_engine()
+        n = 40000
+        bits = rng.bernoulli_bits(p, n)
+        assert len(bits) == n // 8
+        assert abs(popcount(bits) / n - p) < 5 * (p * (1 - p) / n) ** 0.5
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_cost(self, make_engine):
+        # 0.375 = 0.011 in binary: three steps
+        rng = make_engine()
+        check = rng.copy()
+        rng.bernoulli_bits(0.375, 64 * 32)
+        assert int(rng - check) == 3 * 64
+        # coarse precision rounds p to 0.5
+        assert make_engine().bernoulli_bits(0.4, 64, precision=0.5) == make_engine().randbytes(8)
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_edges(self, make_engine):
+        rng = make_engine()
+        check = rng.copy()
+        assert rng.bernoulli_bits(0.0, 20) == bytes(3)
+        assert rng.bernoulli_bits(1.0, 20) == b'\xff\xff\x0f'
+        assert rng == check
+        assert make_engine().bernoulli_bits(0.9, 13)[-1] < 0x20
+        with pytest.raises(ValueError):
+            rng.bernoulli_bits(1.5, 8)
+        with pytest.raises(ValueError):
+            rng.bernoulli_bits(0.5, 8, precision=0)
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_count(self, make_engine):
+        rng = make_engine()
+        check = rng.copy()
+        assert rng.bernoulli_bits(0.3, 0) == b''
+        assert rng.bernoulli_bits(0.3, 0, out=bytearray()) == b''
+        assert rng == check
+        assert len(rng.bernoulli_bits(0.3, 1)) == 1
+        assert rng.bernoulli_bits(1.0, 8) == b'\xff'
+        with pytest.raises(ValueError):
+            rng.bernoulli_bits(0.5, -1)
+        with pytest.raises(TypeError):
+            rng.bernoulli_bits(0.5, 8.0)
+        with pytest.raises(TypeError):
+            rng.bernoulli_bits(0.5, '8')
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_chunks(self, make_engine, monkeypatch):
+        monkeypatch.setattr(pcg_detail, '_BERNOULLI_CHUNK', 64)
+        n = 8 * 64 * 20 + 13
+        # p = 1/2 still takes the raw bits, across chunk boundaries
+        expected = bytearray(make_engine().randbytes((n + 7) // 8))
+        expected[-1] &= 0x1f
+        assert make_engine().bernoulli_bits(0.5, n) == expected
+        bits = make_engine().bernoulli_bits(0.3, n)
+        assert abs(popcount(bits) / n - 0.3) < 5 * (0.21 / n) ** 0.5
+        assert make_engine().bernoulli_bits(1.0, n)[-2:] == b'\xff\x1f'
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_out(self, make_engine):
+        rng = make_engine()
+        out = bytearray(12)
+        assert rng.bernoulli_bits(0.2, 80, out=out) is out
+        assert out[:10] == make_engine().bernoulli_bits(0.2, 80)
+        assert out[10:] == bytes(2)
+        with pytest.raises(ValueError):
+            rng.bernoulli_bits(0.2, 100, out=bytearray(12))
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_numpy_out(self, make_engine):
+        np = pytest.importorskip('numpy')
+        out = np.zeros(4, np.uint64)
+        make_engine().bernoulli_bits(0.2, 256, out=out)
+        assert out.tobytes() == make_engine().bernoulli_bits(0.2, 256)
@@ -0,0 +1,91 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import pcg_detail
+from pcg_random.counter import CounterHash
+from pcg_random.ints import uint32_t, uint64_t, uint128_t
+
+import os
+import pickle
+import pytest
+import subprocess
+import sys
+
+
+class TestCounterHash:
+    def test_deterministic(self):
+        a = CounterHash(5)
+        b = CounterHash(5)
+        assert a == b
+        assert [a(k, c) for k in range(5) for c in range(5)] == [b(k, c) for k in range(5) for c in range(5)]
+        assert CounterHash(6)(1, 1) != a(1, 1)
+        assert a('user', 3) == b('user', 3)
+        assert a(('user', 7), 2) != a(('user', 8), 2)
+
+    def test_distinct(self):
+        # a permuting output function never repeats within one key
+        h = CounterHash(1, uint32_t)
+        assert len({int(h(7, c)) for c in range(10000)}) == 10000
+        assert len({int(h(k, 0)) for k in range(10000)}) == 10000
+
+    def test_uniform(self):
+        h = CounterHash(2)
+        values = [h.random(k, 0) for k in range(20000)]
+        assert all(0 <= v < 1 for v in values)
+        assert abs(sum(values) / len(values) - 0.5) < 0.01
+        with pytest.raises(TypeError):
+            CounterHash(2, uint32_t).random(1)
+
+    def test_mixins(self):
+        h = CounterHash(3, uint128_t, pcg_detail.xsl_rr_rr_mixin)
+        assert isinstance(h(1, 2), uint128_t)
+        h = CounterHash(3, uint64_t, pcg_detail.xsh_rr_mixin, uint32_t)
+        assert isinstance(h(1, 2), uint32_t)
+
+    def test_pickle(self):
+        h = CounterHash()
+        copy = pickle.loads(pickle.dumps(h))
+        assert copy == h
+        assert copy('k', 9) == h('k', 9)
+
+    @pytest.mark.parametrize('itype', [uint32_t, uint64_t])
+    def test_array(self, itype):
+        np = pytest.importorskip('numpy')
+        h = CounterHash(4, itype)
+        keys = np.arange(50, dtype=np.uint64)[:, None]
+        counters = np.arange(20)[None, :]
+        a = h.array(keys, counters)
+        assert a.shape == (50, 20)
+        assert a.tolist() == [[int(h(k, c)) for c in range(20)] for k in range(50)]
+
+    def test_array_errors(self):
+        np = pytest.importorskip('numpy')
+        with pytest.raises(TypeError):
+            CounterHash(4, uint128_t, pcg_detail.xsl_rr_rr_mixin).array([1], [2])
+        with pytest.raises(ValueError):
+            CounterHash(4).array(np.array([-1]), np.array([0]))
+        with pytest.raises(TypeError):
+            CounterHash(4).array(np.array([1.5]), np.array([0]))
+
+    def test_no_numpy_import(self):
+        # NumPy is only imported once array() is called
+        code = 'import sys, pcg_random.counter; print("numpy" in sys.modules)'
+        root = os.path.dirname(os.path.dirname(pcg_random.__file__))
+        out = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == 'False'
@@ -0,0 +1,198 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import discrete
+
+import math
+import pytest
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg64'
+
+
+class ZeroFirst:
+    ''' A PcgRandom whose first few random() calls return 0.0.
+    '''
+    def __init__(self, rng, zeros):
+        self.rng = rng
+        self.zeros = zeros
+
+    def random(self):
+        if self.zeros:
+            self.zeros -= 1
+            return 0.0
+        return self.rng.random()
+
+
+def moments(samples):
+    n = len(samples)
+    mean = sum(samples) / n
+    return mean, sum((x - mean) ** 2 for x in samples) / n
+
+
+def check_moments(samples, mean, var):
+    m, v = moments(samples)
+    # tolerance of several standard errors
+    assert abs(m - mean) < 5 * math.sqrt(var / len(samples))
+    assert abs(v - var) < 0.1 * var
+
+
+class TestBinomial:
+    @pytest.mark.parametrize('n, p', [(10, 0.3), (40, 0.5), (1000, 0.3), (1000, 0.9), (100000, 0.01)])
+    def test_moments(self, make_random, n, p):
+        rng = make_random()
+        samples = [discrete.binomial(rng, n, p) for _ in range(5000)]
+        assert all(0 <= x <= n for x in samples)
+        check_moments(samples, n * p, n * p * (1 - p))
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_pmf(self, make_random):
+        rng = make_random()
+        n, p = 6, 0.4
+        counts = [0] * (n + 1)
+        for _ in range(20000):
+            counts[discrete.binomial(rng, n, p)] += 1
+        for k in range(n + 1):
+            expected = math.comb(n, k) * p**k * (1 - p)**(n - k)
+            assert abs(counts[k] / 20000 - expected) < 0.015
+
+    def test_edges(self, make_random):
+        rng = make_random()
+        assert discrete.binomial(rng, 0, 0.5) == 0
+        assert discrete.binomial(rng, 10, 0.0) == 0
+        assert discrete.binomial(rng, 10, 1.0) == 10
+        with pytest.raises(ValueError):
+            discrete.binomial(rng, -1, 0.5)
+        with pytest.raises(ValueError):
+            discrete.binomial(rng, 10, 1.5)
+
+    @pytest.mark.parametrize('zeros', [1, 2, 3])
+    def test_zero_uniform(self, make_random, zeros):
+        rng = ZeroFirst(make_random(), zeros)
+        assert 0 <= discrete.binomial(rng, 1000, 0.3) <= 1000
+
+    def test_deterministic(self, make_random):
+        a = make_random()
+        b = make_random()
+        assert [discrete.binomial(a, 1000, 0.3) for _ in range(50)] == \
+                [discrete.binomial(b, 1000, 0.3) for _ in range(50)]
+
+
+class TestPoisson:
+    @pytest.mark.parametrize('lam', [0.5, 5, 10, 50, 1e6])
+    def test_moments(self, make_random, lam):
+        rng = make_random()
+        samples = [discrete.poisson(rng, lam) for _ in range(5000)]
+        assert min(samples) >= 0
+        check_moments(samples, lam, lam)
+
+    @pytest.mark.parametrize('zeros', [1, 2, 3])
+    def test_zero_uniform(self, make_random, zeros):
+        rng = ZeroFirst(make_random(), zeros)
+        assert discrete.poisson(rng, 50) >= 0
+
+    def test_edges(self, make_random):
+        rng = make_random()
+        assert discrete.poisson(rng, 0) == 0
+        with pytest.raises(ValueError):
+            discrete.poisson(rng, -1)
+
+
+class TestGeometric:
+    def test_moments(self, make_random):
+        rng = make_random()
+        samples = [discrete.geometric(rng, 0.2) for _ in range(5000)]
+        assert min(samples) >= 1
+        check_moments(samples, 5, 0.8 / 0.04)
+        assert discrete.geometric(rng, 1.0) == 1
+        with pytest.raises(ValueError):
+            discrete.geometric(rng, 0.0)
+
+
+class TestHypergeometric:
+    def test_moments(self, make_random):
+        rng = make_random()
+        ngood, nbad, nsample = 30, 70, 20
+        samples = [discrete.hypergeometric(rng, ngood, nbad, nsample) for _ in range(5000)]
+        N = ngood + nbad
+        p = ngood / N
+        check_moments(samples, nsample * p, nsample * p * (1 - p) * (N - nsample) / (N - 1))
+
+    def test_support(self, make_random):
+        rng = make_random()
+        # at least 5 good items must be drawn
+        samples = [discrete.hypergeometric(rng, 10, 5, 10) for _ in range(1000)]
+        assert min(samples) >= 5 and max(samples) <= 10
+        with pytest.raises(ValueError):
+            discrete.hypergeometric(rng, 1, 1, 3)
+
+    @pytest.mark.parametrize('ngood, nbad, nsample', [
+            (10**8, 10**8, 10**7), (3 * 10**8, 10**8, 2 * 10**8), (10**6, 10**9, 5000), (5000, 4000, 6000)])
+    def test_large(self, make_random, ngood, nbad, nsample):
+        rng = make_random()
+        before = discrete._hypergeometric_table.cache_info().currsize
+        samples = [discrete.hypergeometric(rng, ngood, nbad, nsample) for _ in range(5000)]
+        assert discrete._hypergeometric_table.cache_info().currsize == before
+        assert all(max(0, nsample - nbad) <= x <= min(nsample, ngood) for x in samples)
+        N = ngood + nbad
+        p = ngood / N
+        check_moments(samples, nsample * p, nsample * p * (1 - p) * (N - nsample) / (N - 1))
+
+    def test_zero_uniform(self, make_random):
+        rng = ZeroFirst(make_random(), 1)
+        assert 0 <= discrete.hypergeometric(rng, 10**6, 10**6, 10**5) <= 10**5
+
+
+class TestBatched:
+    def test_table_matches_scalar(self, make_random):
+        np = pytest.importorskip('numpy')
+        # one uniform per draw, and no redraws at these parameters
+        a = discrete.binomial(make_random(), 10, 0.3, size=200)
+        rng = make_random()
+        assert a.tolist() == [discrete.binomial(rng, 10, 0.3) for _ in range(200)]
+        a = discrete.poisson(make_random(), 3.0, size=(10, 20))
+        assert a.shape == (10, 20)
+        rng = make_random()
+        assert a.ravel().tolist() == [discrete.poisson(rng, 3.0) for _ in range(200)]
+
+    def test_rejection(self, make_random):
+        np = pytest.importorskip('numpy')
+        rng = make_random()
+        a = discrete.binomial(rng, 1000, 0.9, size=5000)
+        assert a.dtype == np.int64
+        check_moments(a.tolist(), 900, 90)
+        a = discrete.poisson(rng, 50, size=5000)
+        check_moments(a.tolist(), 50, 50)
+
+    def test_geometric(self, make_random):
+        np = pytest.importorskip('numpy')
+        a = discrete.geometric(make_random(), 0.2, size=200)
+        rng = make_random()
+        assert a.tolist() == [discrete.geometric(rng, 0.2) for _ in range(200)]
+
+    def test_hypergeometric(self, make_random):
+        np = pytest.importorskip('numpy')
+        a = discrete.hypergeometric(make_random(), 30, 70, 20, size=5000)
+        assert a.min() >= 0 and a.max() <= 20
+        assert abs(a.mean() - 6) < 0.1
+        a = discrete.hypergeometric(make_random(), 10**6, 10**6, 10**4, size=(50, 40))
+        assert a.shape == (50, 40)
+        rng = make_random()
+        assert a.ravel().tolist() == [discrete.hypergeometric(rng, 10**6, 10**6, 10**4) for _ in range(2000)]
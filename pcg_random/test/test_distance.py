@@ -0,0 +1,75 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import pcg_detail
+
+import random
+import pytest
+
+
+class TestDistance:
+    def test_matches_bitwise(self, engine_name, make_engine):
+        rng = make_engine()
+        itype = rng.itype
+        mult = rng._multiplier()
+        plus = rng.increment()
+        chooser = random.Random(engine_name)
+        for _ in range(50):
+            # an mcg only visits states that are 3 mod 4
+            low = 3 if rng._is_mcg else 0
+            cur = itype(chooser.randrange(itype.MOD) | low)
+            new = itype(chooser.randrange(itype.MOD) | low)
+            for mask in [-1, itype.MAX, (1 << chooser.randrange(itype.BITS + 1)) - 1]:
+                assert rng._staticmethod_distance(cur, new, mult, plus, mask) == \
+                        rng._staticmethod_distance_bitwise(cur, new, mult, plus, mask)
+
+    def test_subtract(self, make_engine):
+        start = make_engine()
+        rng = start.copy()
+        rng.advance(rng.itype(200))
+        assert int(rng - start) == 200
+        assert int(start - rng) == (1 << start.period_pow2()) - 200
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_other_masks(self, make_engine):
+        # not a run of low bits, so the bitwise version is used
+        rng = make_engine()
+        itype = rng.itype
+        other = rng.copy()
+        other.advance(itype(12345))
+        assert rng._distance(other._state, 0xf0) == rng._staticmethod_distance_bitwise(
+                rng._state, other._state, rng._multiplier(), rng.increment(), 0xf0)
+
+    def test_lcg_distance(self):
+        a, c = 747796405, 2891336453
+        x = 12345
+        for n in range(200):
+            assert pcg_detail._lcg_distance(a, c, 12345, x, 32) == n
+            x = (a * x + c) % 2**32
+
+    def test_extended_advance(self):
+        # crosses a tick of the extension table
+        itype = pcg_random.pcg32.itype
+        rng = pcg_random.pcg32_k2(itype(42), itype(54))
+        check = rng.copy()
+        rng.advance(itype(70000))
+        for _ in range(70000):
+            check()
+        assert rng == check
+        assert int(rng.baseclass - pcg_random.pcg32_k2(itype(42), itype(54)).baseclass) == 70000
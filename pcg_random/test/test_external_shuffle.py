@@ -0,0 +1,89 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import __main__ as cli
+from pcg_random import external_shuffle
+
+import builtins
+import os
+import pytest
+
+
+def lines_file(path, n):
+    path.write_bytes(b''.join(b'record %d\n' % i for i in range(n)))
+    return path
+
+
+def run(src, dst, seed=5, record_size=None, **kwargs):
+    kwargs.setdefault('leaf_bytes', 4000)
+    kwargs.setdefault('fanout', 8)
+    external_shuffle.shuffle_file(str(src), str(dst), seed, record_size, **kwargs)
+    return dst.read_bytes()
+
+
+class TestShuffleFile:
+    def test_lines(self, tmp_path):
+        src = lines_file(tmp_path / 'in', 5000)
+        out = run(src, tmp_path / 'out')
+        assert sorted(out.splitlines()) == sorted(src.read_bytes().splitlines())
+        assert out != src.read_bytes()
+        # recursed: the input is over 8 leaves' worth
+        assert os.path.getsize(src) > 8 * 4000
+
+    def test_deterministic(self, tmp_path):
+        src = lines_file(tmp_path / 'in', 3000)
+        a = run(src, tmp_path / 'a')
+        assert run(src, tmp_path / 'b', buffer_bytes=100, tmpdir=str(tmp_path)) == a
+        assert run(src, tmp_path / 'c', seed=6) != a
+        # temporary files are cleaned up
+        assert sorted(os.listdir(tmp_path)) == ['a', 'b', 'c', 'in']
+
+    def test_fixed_width(self, tmp_path, monkeypatch):
+        src = tmp_path / 'in'
+        src.write_bytes(b''.join(i.to_bytes(4, 'big') for i in range(3000)))
+        out = run(src, tmp_path / 'out', record_size=4)
+        values = [int.from_bytes(out[i:i + 4], 'big') for i in range(0, len(out), 4)]
+        assert sorted(values) == list(range(3000))
+        assert run(src, tmp_path / 'small', record_size=4, buffer_bytes=10) == out
+        # the same without NumPy
+        real_import = builtins.__import__
+        def no_numpy(name, *args, **kwargs):
+            if name == 'numpy':
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+        monkeypatch.setattr(builtins, '__import__', no_numpy)
+        assert run(src, tmp_path / 'plain', record_size=4) == out
+        with pytest.raises(ValueError):
+            run(src, tmp_path / 'bad', record_size=7)
+
+    def test_edges(self, tmp_path):
+        src = tmp_path / 'in'
+        src.write_bytes(b'')
+        assert run(src, tmp_path / 'out') == b''
+        src.write_bytes(b'a\nb')
+        assert sorted(run(src, tmp_path / 'out').splitlines(True)) == [b'a\n', b'b\n']
+        src.write_bytes(b'x' * 10000 + b'\n')
+        assert run(src, tmp_path / 'out') == src.read_bytes()
+
+    def test_cli(self, tmp_path):
+        src = lines_file(tmp_path / 'in', 500)
+        cli.main(['shuffle', str(src), str(tmp_path / 'out'), '--seed', '5',
+                '--leaf-bytes', '4000', '--fanout', '8'])
+        assert (tmp_path / 'out').read_bytes() == run(src, tmp_path / 'check')
+        with pytest.raises(SystemExit):
+            cli.main(['shuffle', str(tmp_path / 'missing'), str(tmp_path / 'out'), '--seed', '1'])
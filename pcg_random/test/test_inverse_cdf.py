@@ -0,0 +1,83 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random.inverse_cdf import InverseCDF
+
+import math
+import pickle
+import pytest
+
+
+def logistic_cdf(x):
+    return 1 / (1 + math.exp(-x))
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg64'
+
+
+class TestInverseCDF:
+    def test_from_cdf(self):
+        table = InverseCDF.from_cdf(logistic_cdf, -40, 40, size=256)
+        assert table.size == 256
+        assert table.ppf(0.5) == pytest.approx(0, abs=1e-9)
+        assert table.ppf(0.75) == pytest.approx(math.log(3), abs=1e-9)
+        # accuracy improves with size
+        coarse = InverseCDF.from_cdf(logistic_cdf, -40, 40, size=64)
+        assert table.max_error(logistic_cdf) < coarse.max_error(logistic_cdf)
+
+    def test_from_samples(self):
+        table = InverseCDF.from_samples([5, 1, 4, 2, 3], size=8)
+        assert table.quantiles[0] == 1 and table.quantiles[-1] == 5
+        assert table.ppf(0.5) == 3
+        assert table.cdf(table.ppf(0.3)) == pytest.approx(0.3)
+        assert InverseCDF.from_samples([7], size=4).ppf(0.9) == 7
+        with pytest.raises(ValueError):
+            InverseCDF.from_samples([])
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            InverseCDF([1])
+        with pytest.raises(ValueError):
+            InverseCDF([2, 1])
+        with pytest.raises(ValueError):
+            InverseCDF([0, float('inf')])
+
+    def test_sample(self, make_random):
+        table = InverseCDF.from_cdf(logistic_cdf, -40, 40, size=256)
+        rng = make_random()
+        samples = sorted(table.sample(rng) for _ in range(5000))
+        median = samples[len(samples) // 2]
+        assert abs(median) < 0.15
+        check = make_random()
+        assert table.sample(check) == table.ppf(make_random().random())
+
+    def test_pickle(self):
+        table = InverseCDF.from_samples(range(100), size=32)
+        copy = pickle.loads(pickle.dumps(table))
+        assert copy == table
+        assert hash(copy) == hash(table)
+
+    def test_batched(self, make_random):
+        np = pytest.importorskip('numpy')
+        table = InverseCDF.from_cdf(logistic_cdf, -40, 40, size=256)
+        a = table.sample(make_random(), (50, 40))
+        assert a.shape == (50, 40)
+        rng = make_random()
+        assert a.ravel().tolist() == [table.sample(rng) for _ in range(2000)]
@@ -0,0 +1,89 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import KeyedEngineCache, SeedSequence, SqliteStore
+
+import pytest
+import random
+
+
+def access_pattern(n=500, keys=10):
+    chooser = random.Random(0)
+    return [chooser.randrange(keys) for _ in range(n)]
+
+
+def draws(cache, pattern):
+    return [(k, int(cache(k))) for k in pattern]
+
+
+class TestKeyedEngineCache:
+    def test_derivation(self):
+        cache = KeyedEngineCache(1)
+        engine = cache['user']
+        assert engine == pcg_random.pcg32(SeedSequence((1, 'user')))
+        assert cache['user'] is engine
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_eviction_is_exact(self):
+        pattern = access_pattern()
+        expected = draws(KeyedEngineCache(1, capacity=100), pattern)
+        small = KeyedEngineCache(1, capacity=3)
+        assert draws(small, pattern) == expected
+        assert len(small) == 3
+        assert small.evictions > 0
+        assert small.restores == small.misses - 10
+        assert small.hits + small.misses == len(pattern)
+        assert len(small.store) == 7
+
+    def test_oneseq(self):
+        pattern = access_pattern(100)
+        expected = draws(KeyedEngineCache(2, pcg_random.pcg64_oneseq, capacity=100), pattern)
+        assert draws(KeyedEngineCache(2, pcg_random.pcg64_oneseq, capacity=2), pattern) == expected
+
+    def test_sqlite(self, tmp_path):
+        pattern = access_pattern()
+        expected = draws(KeyedEngineCache(1, capacity=100), pattern)
+        path = str(tmp_path / 'engines.db')
+        store = SqliteStore(path)
+        cache = KeyedEngineCache(1, capacity=3, store=store)
+        half = len(pattern) // 2
+        assert draws(cache, pattern[:half]) == expected[:half]
+        cache.flush()
+        store.close()
+        # a new process picks up where the first left off
+        cache = KeyedEngineCache(1, capacity=3, store=SqliteStore(path))
+        assert draws(cache, pattern[half:]) == expected[half:]
+
+    def test_sqlite_keys(self):
+        store = SqliteStore(':memory:')
+        keys = [5, -3, 'x', b'y', (1, ('a', b'b'))]
+        for i, k in enumerate(keys):
+            store[k] = (i, None if i % 2 else 1 << 100)
+        assert sorted(map(repr, store)) == sorted(map(repr, keys))
+        assert store[(1, ('a', b'b'))] == (4, 1 << 100)
+        del store['x']
+        assert len(store) == 4
+        with pytest.raises(KeyError):
+            del store['x']
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            KeyedEngineCache(None)
+        with pytest.raises(ValueError):
+            KeyedEngineCache(1, capacity=0)
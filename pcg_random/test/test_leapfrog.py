@@ -0,0 +1,93 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import PcgRandom
+
+import pickle
+import pytest
+
+
+@pytest.fixture(params=['pcg32', 'pcg32_fast', 'pcg64', 'pcg8_once_insecure', 'pcg128_oneseq_once_insecure'])
+def engine_name(request):
+    return request.param
+
+
+class TestLeapfrog:
+    @pytest.mark.parametrize('k', [1, 2, 3, 8])
+    def test_lanes(self, make_engine, k):
+        rng = make_engine()
+        expected = [rng() for _ in range(10 * k)]
+        for r in range(k):
+            lane = make_engine().leapfrog(k, r)
+            assert [lane() for _ in range(10)] == expected[r::k]
+        # the parent is not consumed
+        parent = make_engine()
+        parent.leapfrog(k, k - 1)
+        assert parent == make_engine()
+
+    def test_fill(self, make_engine):
+        a = make_engine().leapfrog(5, 2)
+        b = a.copy()
+        assert a.fill([None] * 17) == [b() for _ in range(17)]
+        assert a == b
+        # long enough for the NumPy path, if there is one
+        assert a.fill([None] * 300) == [b() for _ in range(300)]
+        assert a == b
+
+    def test_advance(self, make_engine):
+        a = make_engine().leapfrog(6, 1)
+        b = a.copy()
+        a.advance(7)
+        for _ in range(7):
+            b()
+        assert a == b
+        assert int(a - make_engine().leapfrog(6, 1)) == 7
+        a.backstep(3)
+        assert int(a - make_engine().leapfrog(6, 1)) == 4
+        with pytest.raises(ValueError):
+            a - make_engine().leapfrog(6, 0)
+
+    def test_seed(self, make_engine):
+        itype = make_engine().itype
+        base = make_engine()
+        base.seed(itype(7))
+        expected = [base() for _ in range(30)]
+        lane = make_engine().leapfrog(3, 2)
+        lane()
+        lane.seed(itype(7))
+        assert [lane() for _ in range(10)] == expected[2::3]
+        rng = PcgRandom(make_engine().leapfrog(3, 1))
+        rng.seed(itype(7))
+        assert [rng._engine() for _ in range(10)] == expected[1::3]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_pickle(self, make_engine):
+        a = make_engine().leapfrog(4, 3)
+        a()
+        b = pickle.loads(pickle.dumps(a))
+        assert a == b
+        assert a() == b()
+        assert b.r == 3 and a.copy() == a
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_bad_args(self, make_engine):
+        rng = make_engine()
+        with pytest.raises(ValueError):
+            rng.leapfrog(0)
+        with pytest.raises(ValueError):
+            rng.leapfrog(4, 4)
@@ -0,0 +1,108 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import pcg_extras
+from pcg_random.ints import uint16_t
+
+import collections
+import pytest
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg32'
+
+
+class Exhausted(Exception):
+    pass
+
+
+class Counting:
+    ''' Produces every 16-bit output exactly once.
+    '''
+    MAX = uint16_t.MAX
+
+    def __init__(self):
+        self.it = iter(range(1 << 16))
+
+    def __call__(self):
+        for x in self.it:
+            return uint16_t(x)
+        raise Exhausted
+
+
+class TestPacked:
+    def test_exact(self):
+        # Over a full cycle of outputs, every accepted triple appears
+        # equally often.
+        rng = Counting()
+        counts = collections.Counter()
+        try:
+            while True:
+                counts[tuple(pcg_extras.bounded_rand_batch(rng, [6, 5, 7]))] += 1
+        except Exhausted:
+            pass
+        assert len(counts) == 6 * 5 * 7
+        assert len(set(counts.values())) == 1
+
+    def test_fewer_outputs(self, make_engine):
+        rng = make_engine()
+        check = rng.copy()
+        values = pcg_extras.bounded_rand_n(rng, 6, 900)
+        assert all(0 <= v < 6 for v in values)
+        assert int(rng - check) < 200
+        freq = collections.Counter(values)
+        assert all(abs(freq[v] - 150) < 50 for v in range(6))
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_mixed_bounds(self, make_engine):
+        rng = make_engine()
+        bounds = [2, 1000, 3, 52, 1 << 60, 7]
+        for _ in range(20):
+            values = pcg_extras.bounded_rand_batch(rng, bounds)
+            assert all(0 <= v < b for v, b in zip(values, bounds))
+        with pytest.raises(ValueError):
+            pcg_extras.bounded_rand_batch(rng, [6, 0])
+        with pytest.raises(ValueError):
+            pcg_extras.bounded_rand_n(make_engine('pcg32'), 1 << 32, 1)
+
+    def test_scalar(self, make_engine):
+        a = make_engine()
+        b = make_engine()
+        dice = pcg_extras.PackedBounded(a, 6)
+        assert [dice() for _ in range(90)] == pcg_extras.bounded_rand_n(b, 6, 90)
+        assert a == b
+
+    def test_scalar_one(self, make_engine):
+        a = make_engine()
+        b = make_engine()
+        one = pcg_extras.PackedBounded(a, 1)
+        assert [one() for _ in range(10)] == [0] * 10
+        assert a == b
+
+    def test_shuffle(self, make_engine):
+        rng = make_engine()
+        check = rng.copy()
+        deck = list(range(52))
+        pcg_extras.packed_shuffle(deck, rng)
+        assert sorted(deck) == list(range(52))
+        assert deck != list(range(52))
+        assert int(rng - check) < 51
+        other = list(range(52))
+        pcg_extras.packed_shuffle(other, check)
+        assert other == deck
@@ -0,0 +1,130 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import SeedSequence
+from pcg_random.permutation import RandomPermutation, ShardedSampler
+
+import pickle
+import pytest
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg32'
+
+
+class TestRandomPermutation:
+    @pytest.mark.parametrize('n', [0, 1, 2, 3, 10, 255, 256, 1000])
+    def test_bijection(self, n):
+        perm = RandomPermutation(n, 42)
+        values = list(perm)
+        assert sorted(values) == list(range(n))
+        assert all(perm.index(x) == i for i, x in enumerate(values))
+
+    def test_shuffled(self):
+        perm = RandomPermutation(1000, 42)
+        fixed = sum(perm[i] == i for i in range(1000))
+        assert fixed < 10
+        assert list(RandomPermutation(1000, 43)) != list(perm)
+
+    def test_huge(self, make_engine):
+        n = 10 ** 10
+        perm = RandomPermutation(n, make_engine())
+        assert len(perm) == n
+        head = perm[:50]
+        assert len(set(head)) == 50
+        assert all(0 <= x < n for x in head)
+        assert perm[-1] == perm[n - 1]
+        assert perm.index(head[17]) == 17
+        big = RandomPermutation(1 << 200, SeedSequence(7))
+        assert big.index(big[12345]) == 12345
+        with pytest.raises(ValueError):
+            RandomPermutation((1 << 256) + 1, 0)
+
+    def test_errors(self):
+        perm = RandomPermutation(10, 1)
+        with pytest.raises(IndexError):
+            perm[10]
+        with pytest.raises(ValueError):
+            perm.index(10)
+        assert 9 in perm and 10 not in perm
+
+    def test_keys(self, make_engine):
+        engine = make_engine()
+        check = make_engine()
+        perm = RandomPermutation(100, engine)
+        # the engine is consumed, one 64-bit key per round
+        assert int(engine - check) == 2 * RandomPermutation.ROUNDS
+        assert RandomPermutation(100, make_engine()) == perm
+        assert RandomPermutation(100, SeedSequence(5)) == RandomPermutation(100, 5)
+        copy = pickle.loads(pickle.dumps(perm))
+        assert copy == perm and list(copy) == list(perm)
+
+    def test_chunks(self):
+        perm = RandomPermutation(1000, 3)
+        chunks = list(perm.chunks(64))
+        assert [len(c) for c in chunks] == [64] * 15 + [40]
+        assert sum(chunks, []) == list(perm)
+        assert next(perm.chunks(10, start=990)) == perm[990:]
+
+
+class TestShardedSampler:
+    @pytest.mark.parametrize('world_size', [1, 2, 3, 8])
+    def test_interleave(self, world_size):
+        expected = list(ShardedSampler(103, 7, epoch=2))
+        assert sorted(expected) == list(range(103))
+        merged = [None] * 103
+        for rank in range(world_size):
+            merged[rank::world_size] = list(ShardedSampler(103, 7, 2, rank, world_size))
+        assert merged == expected
+
+    def test_epochs(self):
+        sampler = ShardedSampler(50, 7)
+        first = list(sampler)
+        sampler.set_epoch(1)
+        assert list(sampler) != first
+        assert list(sampler) == list(ShardedSampler(50, 7, epoch=1))
+        assert list(ShardedSampler(50, 8)) != first
+
+    def test_pad(self):
+        shards = [ShardedSampler(10, 1, rank=r, world_size=4, pad=True) for r in range(4)]
+        assert [len(s) for s in shards] == [3] * 4
+        order = list(ShardedSampler(10, 1))
+        assert list(shards[2]) == [order[2], order[6], order[0]]
+        assert [len(s) for s in (ShardedSampler(10, 1, rank=r, world_size=4) for r in range(4))] == [3, 3, 2, 2]
+
+    def test_batches(self):
+        sampler = ShardedSampler(100, 3, rank=1, world_size=3)
+        batches = list(sampler.batches(8))
+        assert sum(batches, []) == list(sampler)
+        assert [len(b) for b in sampler.batches(8, drop_last=True)] == [8] * 4
+        assert sampler[0] == batches[0][0]
+
+    def test_slice(self):
+        sampler = ShardedSampler(10, 1, rank=1, world_size=4, pad=True)
+        everything = list(sampler)
+        assert sampler[:] == everything
+        assert sampler[1:] == everything[1:]
+        assert sampler[::-1] == everything[::-1]
+        assert sampler[-1] == everything[-1]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            ShardedSampler(10, None)
+        with pytest.raises(ValueError):
+            ShardedSampler(10, 1, rank=2, world_size=2)
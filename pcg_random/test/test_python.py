@@ -0,0 +1,175 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+
+import copy as copy_module
+import pickle
+import pytest
+
+
+def slow_getrandbits(engine, k):
+    # The original word-by-word accumulation.
+    BITS_PER_CALL = engine.result_type.BITS
+    shift = 0
+    rv = 0
+    while k >= BITS_PER_CALL:
+        rv |= int(engine()) << shift
+        shift += BITS_PER_CALL
+        k -= BITS_PER_CALL
+    if k:
+        rv |= (int(engine()) % (1 << k)) << shift
+    return rv
+
+
+class TestGetrandbits:
+    @pytest.mark.parametrize('k', [0, 1, 5, 8, 31, 32, 33, 64, 100, 128, 1000, 4099])
+    def test_unchanged(self, make_random, k):
+        rng = make_random()
+        check = make_random()
+        assert rng.getrandbits(k) == slow_getrandbits(check._engine, k)
+        assert rng._engine == check._engine
+
+
+class TestBitReservoir:
+    def test_single_bits(self, make_random):
+        rng = make_random(bit_reservoir=True)
+        check = make_random()
+        BITS = check._engine.result_type.BITS
+        bits = [rng.getrandbits(1) for _ in range(2 * BITS)]
+        word = check.getrandbits(2 * BITS)
+        assert bits == [word >> i & 1 for i in range(2 * BITS)]
+        assert rng._engine == check._engine
+
+    def test_mixed_sizes(self, make_random):
+        rng = make_random(bit_reservoir=True)
+        check = make_random()
+        sizes = [3, 1, 17, 64, 2, 0, 130, 5]
+        values = [rng.getrandbits(k) for k in sizes]
+        stream = check.getrandbits(sum(sizes) + rng._reservoir_bits)
+        for k, v in zip(sizes, values):
+            assert v == stream & ((1 << k) - 1)
+            stream >>= k
+        assert rng._engine == check._engine
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_state(self, make_random):
+        rng = make_random(bit_reservoir=True)
+        rng.getrandbits(5)
+        state = rng.getstate()
+        expected = [rng.getrandbits(7) for _ in range(10)]
+        rng.setstate(state)
+        assert [rng.getrandbits(7) for _ in range(10)] == expected
+        rng.seed(pcg_random.pcg32.itype(1))
+        assert rng._reservoir_bits == 0
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_round_trip(self, make_random):
+        rng = make_random(bit_reservoir=True)
+        rng.getrandbits(5)
+        copies = [pickle.loads(pickle.dumps(rng)), copy_module.deepcopy(rng)]
+        other = make_random(bit_reservoir=True)
+        other.setstate(rng.getstate())
+        copies.append(other)
+        expected = [rng.getrandbits(3) for _ in range(20)]
+        for copy in copies:
+            assert copy._bit_reservoir
+            assert [copy.getrandbits(3) for _ in range(20)] == expected
+        copy = pickle.loads(pickle.dumps(make_random()))
+        assert not copy._bit_reservoir
+        assert copy.getstate() == make_random().getstate()
+
+    def test_mixed_round_trip(self, make_random):
+        # setstate() keeps the mode of the instance it is called on
+        source = make_random(bit_reservoir=True)
+        source.getrandbits(5)
+        plain = make_random()
+        plain.setstate(source.getstate())
+        assert not plain._bit_reservoir
+        check = make_random()
+        check.getrandbits(5)
+        assert [plain.getrandbits(3) for _ in range(20)] == [check.getrandbits(3) for _ in range(20)]
+        assert plain.getstate() == check.getstate()
+        reservoir = make_random(bit_reservoir=True)
+        reservoir.getrandbits(5)
+        reservoir.setstate(make_random().getstate())
+        assert reservoir._bit_reservoir
+        assert reservoir._reservoir_bits == 0
+        check = make_random(bit_reservoir=True)
+        assert [reservoir.getrandbits(3) for _ in range(20)] == [check.getrandbits(3) for _ in range(20)]
+
+
+class TestBoundedMethods:
+    def test_randrange(self, make_engine, make_random):
+        rng = make_random()
+        check = make_engine()
+        bound = min(1000, int(check.MAX))
+        assert [rng.randrange(bound) for _ in range(50)] == [check(bound) for _ in range(50)]
+        assert [rng.randrange(10, 20) for _ in range(50)] == [10 + check(10) for _ in range(50)]
+        assert rng._engine == check
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_full_word(self, make_engine, make_random):
+        rng = make_random()
+        check = make_engine()
+        assert rng.randrange(1 << 32) == int(check())
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_huge(self, make_random):
+        rng = make_random()
+        values = [rng.randrange(10**30) for _ in range(50)]
+        assert all(0 <= v < 10**30 for v in values)
+        assert max(values) > 10**20
+
+    def test_shuffle(self, make_engine, make_random):
+        rng = make_random()
+        check = make_engine()
+        a = list(range(52))
+        b = list(range(52))
+        rng.shuffle(a)
+        pcg_random.pcg_extras.shuffle(b, check)
+        assert a == b
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_choice_sample(self, make_random):
+        rng = make_random()
+        population = 'abcdefghij'
+        assert all(rng.choice(population) in population for _ in range(50))
+        sample = rng.sample(range(100), 10)
+        assert len(set(sample)) == 10
+        with pytest.raises(IndexError):
+            rng.choice([])
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_choices(self, make_engine, make_random):
+        rng = make_random()
+        check = make_engine()
+        assert rng.choices('abcdef', k=20) == ['abcdef'[check(6)] for _ in range(20)]
+        assert rng.choices([], k=0) == []
+        with pytest.raises(IndexError):
+            rng.choices([])
+        weighted = rng.choices('ab', weights=[0, 1], k=10)
+        assert weighted == ['b'] * 10
+
+
+class TestRandom:
+    def test_fast_path(self, make_random):
+        # random() must still agree with the definition
+        rng = make_random()
+        check = make_random()
+        assert [rng.random() for _ in range(20)] == [check.getrandbits(53) / 2**53 for _ in range(20)]
@@ -0,0 +1,129 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random.reservoir import Reservoir, WeightedReservoir, reservoir_sample, weighted_reservoir_sample
+
+import collections
+import pytest
+
+
+@pytest.fixture
+def engine_name():
+    return 'pcg64'
+
+
+class TestReservoir:
+    def test_short(self, make_random):
+        assert reservoir_sample(iter('abc'), 5, make_random()) == ['a', 'b', 'c']
+        assert reservoir_sample(range(10), 0, make_random()) == []
+
+    def test_uniform(self, make_random):
+        rng = make_random()
+        counts = collections.Counter()
+        for _ in range(10000):
+            counts.update(reservoir_sample(range(10), 3, rng))
+        assert all(abs(c - 3000) < 200 for c in counts.values())
+        assert len(counts) == 10
+
+    def test_skip_ahead(self, make_random):
+        rng = make_random()
+        check = rng._engine.copy()
+        sample = reservoir_sample(iter(range(10 ** 6)), 10, rng)
+        assert len(set(sample)) == 10
+        # about 3 draws per replacement, and k log(n/k) replacements
+        assert int(rng._engine - check) < 1000
+
+    def test_chunking(self, make_random):
+        expected = reservoir_sample(iter(range(100000)), 10, make_random())
+        assert reservoir_sample(range(100000), 10, make_random()) == expected
+        r = Reservoir(10, make_random())
+        for start in range(0, 100000, 7777):
+            r.extend(iter(range(start, min(start + 7777, 100000))))
+        assert r.sample() == expected
+        assert r.seen == 100000
+        r = Reservoir(10, make_random())
+        for start in range(0, 100000, 3333):
+            r.extend(list(range(start, min(start + 3333, 100000))))
+        assert r.sample() == expected
+
+    def test_small_chunks(self, make_random):
+        assert reservoir_sample(['a', 'b', 'c'], 5, make_random()) == ['a', 'b', 'c']
+        expected = reservoir_sample(iter(range(1000)), 10, make_random())
+        r = Reservoir(10, make_random())
+        for start in range(0, 1000, 3):
+            r.extend(list(range(start, min(start + 3, 1000))))
+        assert r.sample() == expected
+        assert r.seen == 1000
+
+    def test_fill_across_chunks(self, make_random):
+        rng = make_random()
+        counts = collections.Counter()
+        for _ in range(6000):
+            r = Reservoir(2, rng)
+            r.extend(iter([0]))
+            r.extend([1, 2, 3, 4, 5])
+            counts.update(r.sample())
+        assert len(counts) == 6
+        assert all(abs(c - 2000) < 200 for c in counts.values())
+
+    def test_numpy(self, make_random):
+        np = pytest.importorskip('numpy')
+        expected = reservoir_sample(range(100000), 10, make_random())
+        r = Reservoir(10, make_random())
+        for chunk in np.array_split(np.arange(100000), 13):
+            r.extend(chunk)
+        assert [int(x) for x in r.sample()] == expected
+
+
+class TestWeightedReservoir:
+    def test_proportional(self, make_random):
+        rng = make_random()
+        counts = collections.Counter()
+        for _ in range(10000):
+            counts.update(weighted_reservoir_sample([(i, i) for i in range(5)], 1, rng))
+        assert 0 not in counts
+        for i in range(1, 5):
+            assert abs(counts[i] / 10000 - i / 10) < 0.02
+
+    def test_without_replacement(self, make_random):
+        rng = make_random()
+        sample = weighted_reservoir_sample(((i, 1 + i % 3) for i in range(1000)), 50, rng)
+        assert len(set(sample)) == 50
+        with pytest.raises(ValueError):
+            weighted_reservoir_sample([('a', -1)], 1, rng)
+
+    def test_chunking(self, make_random):
+        pairs = [(i, (i * 7919) % 13 + 1) for i in range(5000)]
+        expected = weighted_reservoir_sample(iter(pairs), 8, make_random())
+        r = WeightedReservoir(8, make_random())
+        for start in range(0, 5000, 333):
+            r.extend(pairs[start:start + 333])
+        assert r.sample() == expected
+        assert r.seen == 5000
+
+    def test_numpy(self, make_random):
+        np = pytest.importorskip('numpy')
+        weights = np.arange(1, 2001, dtype=np.float64)
+        expected = weighted_reservoir_sample(zip(range(2000), weights.tolist()), 5, make_random())
+        r = WeightedReservoir(5, make_random())
+        r.extend(np.arange(2000), weights)
+        assert [int(x) for x in r.sample()] == expected
+        r = WeightedReservoir(5, make_random())
+        for start in range(0, 2000, 77):
+            r.extend(np.arange(start, min(start + 77, 2000)), weights[start:start + 77])
+        assert [int(x) for x in r.sample()] == expected
@@ -0,0 +1,125 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import pcg_extras
+from pcg_random.ints import *
+from pcg_random.pcg_extras import SeedSequence
+
+import os
+import pickle
+import pytest
+import signal
+
+
+class TestSeedSequence:
+    def test_deterministic(self):
+        a = SeedSequence(1234)
+        b = SeedSequence(1234)
+        assert a.generate(uint64_t, 5) == b.generate(uint64_t, 5)
+        assert a.generate(uint32_t) == b.generate(uint32_t)
+
+    def test_successive(self):
+        ss = SeedSequence('key')
+        values = ss.generate(uint64_t, 3) + ss.generate(uint64_t, 3)
+        assert len({int(v) for v in values}) == 6
+
+    @pytest.mark.parametrize('a, b', [
+        (1, b'\x01'),
+        (1, '\x01'),
+        ('1', b'1'),
+        ((1, 2), (12,)),
+        ((1, 2), (2, 1)),
+        (0, -1),
+    ])
+    def test_keys_differ(self, a, b):
+        assert SeedSequence(a).generate(uint64_t) != SeedSequence(b).generate(uint64_t)
+
+    def test_bad_key(self):
+        with pytest.raises(TypeError):
+            SeedSequence(1.5)
+
+    def test_pooled(self):
+        a = SeedSequence()
+        b = SeedSequence()
+        assert a.entropy != b.entropy
+        assert len(a.entropy) == SeedSequence.ENTROPY_BYTES
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+    def test_fork_while_locked(self):
+        r, w = os.pipe()
+        with pcg_extras._entropy_lock:
+            pid = os.fork()
+            if not pid:
+                try:
+                    signal.alarm(10)
+                    os.write(w, SeedSequence().entropy)
+                finally:
+                    os._exit(0)
+        os.close(w)
+        with os.fdopen(r, 'rb') as f:
+            child_entropy = f.read()
+        os.waitpid(pid, 0)
+        assert len(child_entropy) == SeedSequence.ENTROPY_BYTES
+
+    def test_spawn(self):
+        ss = SeedSequence(99)
+        children = ss.spawn(3) + ss.spawn(2)
+        assert [c.spawn_key for c in children] == [(0,), (1,), (2,), (3,), (4,)]
+        words = {int(c.generate(uint64_t)) for c in children}
+        assert len(words) == 5
+        again = SeedSequence(99).spawn(5)
+        assert [c.generate(uint64_t) for c in again] == [SeedSequence(99, (i,)).generate(uint64_t) for i in range(5)]
+        grandchild, = children[1].spawn(1)
+        assert grandchild.spawn_key == (1, 0)
+
+    def test_pickle(self):
+        ss = SeedSequence('abc')
+        ss.generate(uint8_t)
+        copy = pickle.loads(pickle.dumps(ss))
+        assert copy.generate(uint128_t, 4) == ss.generate(uint128_t, 4)
+
+
+class TestEngineSeeding:
+    @pytest.mark.parametrize('name', ['pcg32', 'pcg32_oneseq', 'pcg64_fast', 'pcg32_k64', 'pcg64_c32'])
+    def test_reproducible(self, name):
+        rng_class = getattr(pcg_random, name)
+        a = rng_class(SeedSequence(7))
+        b = rng_class(SeedSequence(7))
+        assert a == b
+        assert [a() for _ in range(100)] == [b() for _ in range(100)]
+        c = rng_class(SeedSequence(8))
+        assert a != c
+
+    def test_stream(self):
+        a = pcg_random.pcg32(SeedSequence(7))
+        b = pcg_random.pcg32(SeedSequence(7), False)
+        assert a.stream() != b.stream()
+        assert b.stream() == pcg_random.pcg32(seed=False).stream()
+
+    def test_spawned(self):
+        engines = [pcg_random.pcg64(ss) for ss in SeedSequence(0).spawn(8)]
+        assert len({int(e.stream()) for e in engines}) == 8
+
+    def test_default(self):
+        a = pcg_random.pcg32()
+        b = pcg_random.pcg32()
+        assert a != b
+        c = pcg_random.pcg32_k2()
+        d = pcg_random.pcg32_k2()
+        assert c != d
@@ -0,0 +1,56 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pytest
+
+
+class TestJumped:
+    def test_jumped(self, make_engine):
+        rng = make_engine()
+        child = rng.jumped(3)
+        assert rng == make_engine()
+        half = rng.period_pow2() // 2
+        assert int(child - rng) == 3 << half
+        assert child.jumped(2) == rng.jumped(5)
+        assert rng.jumped(0) == rng
+
+
+class TestSplit:
+    def test_deterministic(self, make_engine):
+        a = make_engine()
+        b = make_engine()
+        ca = a.split()
+        cb = b.split()
+        assert a == b
+        assert ca == cb
+        assert [ca() for _ in range(8)] == [cb() for _ in range(8)]
+        assert ca.split() == cb.split()
+
+    def test_distinct(self, make_engine):
+        rng = make_engine()
+        children = [rng.split() for _ in range(4)]
+        assert len({tuple(map(int, c.compare_args())) for c in children}) == 4
+        for child in children:
+            assert child.stream_mixin is rng.stream_mixin
+            assert child != rng
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_stream(self, make_engine):
+        rng = make_engine()
+        child = rng.split()
+        assert child.stream() != rng.stream()
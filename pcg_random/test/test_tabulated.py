@@ -0,0 +1,95 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import Tabulated, pcg_engines
+
+import pickle
+import pytest
+
+
+@pytest.fixture(params=['pcg8_once_insecure', 'pcg8_oneseq_once_insecure', 'mcg_xsh_rs_16_8', 'setseq_xsh_rr_16_8'])
+def engine_name(request):
+    # small enough to tabulate
+    return request.param
+
+
+class TestTabulated:
+    def test_outputs(self, make_engine):
+        engine = make_engine()
+        table = Tabulated(engine)
+        # more than a full period, to cover the wraparound
+        count = (1 << engine.period_pow2()) + 100
+        assert [table() for _ in range(count)] == [engine() for _ in range(count)]
+        assert table == engine
+
+    def test_advance(self, make_engine):
+        engine = make_engine()
+        table = Tabulated(engine.copy())
+        table.advance(200)
+        engine.advance(200)
+        assert table == engine and engine == table
+        table.backstep(77)
+        engine.backstep(77)
+        assert table() == engine()
+        assert table.period_pow2() == engine.period_pow2()
+
+    def test_distance(self, make_engine):
+        start = make_engine()
+        table = Tabulated(start)
+        table.advance(123)
+        assert int(table - start) == 123
+        assert int(start - table) == int(start - table._logical())
+        assert int(table - Tabulated(start)) == 123
+
+    @pytest.mark.parametrize('engine_name', ['pcg8_once_insecure'])
+    def test_fill(self, make_engine):
+        engine = make_engine()
+        table = Tabulated(engine)
+        assert table.fill([None] * 600) == [engine() for _ in range(600)]
+        assert table == engine
+
+    @pytest.mark.parametrize('engine_name', ['pcg8_once_insecure'])
+    def test_shared(self, make_engine):
+        a = Tabulated(make_engine())
+        b = Tabulated(make_engine())
+        assert a._outputs is b._outputs
+        other = make_engine()
+        other.set_stream(other.itype(7))
+        assert Tabulated(other)._outputs is not a._outputs
+
+    @pytest.mark.parametrize('engine_name', ['setseq_xsh_rr_16_8'])
+    def test_copy_pickle_seed(self, make_engine):
+        table = Tabulated(make_engine())
+        table.advance(1000)
+        copy = table.copy()
+        table()
+        assert copy != table
+        assert pickle.loads(pickle.dumps(table)) == table
+        table.seed(table.itype(42), table.itype(54))
+        assert table == make_engine()
+        assert table(10) < 10
+
+    @pytest.mark.parametrize('engine_name', ['pcg8_once_insecure'])
+    def test_errors(self, make_engine):
+        with pytest.raises(ValueError):
+            Tabulated(pcg_random.pcg32(pcg_random.pcg32.itype(1)))
+        with pytest.raises(TypeError):
+            Tabulated(pcg_engines.unique_xsh_rr_16_8(pcg_engines.unique_xsh_rr_16_8.itype(1)))
+        with pytest.raises(TypeError):
+            Tabulated(Tabulated(make_engine()))
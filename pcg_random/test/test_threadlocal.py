@@ -0,0 +1,108 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+import pcg_random
+from pcg_random import PcgRandom, SeedSequence, ThreadLocalEngine
+
+import os
+import pickle
+import pytest
+import threading
+
+
+def run_threads(count, target):
+    results = [None] * count
+    def work(i):
+        results[i] = target()
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestThreadLocalEngine:
+    def test_same_thread(self):
+        tle = ThreadLocalEngine(SeedSequence(5))
+        assert tle.local() is tle.local()
+        first = tle()
+        expected = pcg_random.pcg32(SeedSequence(5).spawn(1)[0])
+        assert first == expected()
+
+    @pytest.mark.parametrize('master', [
+        lambda: SeedSequence(5),
+        lambda: pcg_random.pcg32(pcg_random.pcg32.itype(1), pcg_random.pcg32.itype(2)),
+    ])
+    def test_distinct_streams(self, master):
+        tle = ThreadLocalEngine(master())
+        results = run_threads(16, lambda: (tle.local(), [tle() for _ in range(8)]))
+        engines = [r[0] for r in results]
+        assert len({id(e) for e in engines}) == 16
+        assert len({int(e.stream()) for e in engines}) == 16
+        assert len({tuple(map(int, r[1])) for r in results}) == 16
+
+    def test_engine_master_is_split(self):
+        itype = pcg_random.pcg64.itype
+        master = pcg_random.pcg64(itype(3), itype(4))
+        tle = ThreadLocalEngine(master)
+        check = pcg_random.pcg64(itype(3), itype(4))
+        assert tle.local() == check.split()
+        assert master == check
+
+    def test_no_pickle(self):
+        with pytest.raises(TypeError):
+            pickle.dumps(ThreadLocalEngine())
+
+    def test_copy_and_view(self):
+        tle = ThreadLocalEngine(SeedSequence(7))
+        tle()
+        copy = tle.copy()
+        assert copy == tle.local() and copy is not tle.local()
+        view = tle.view()
+        expected = [tle() for _ in range(5)]
+        assert [view[i] for i in range(5)] == expected
+        assert copy() == expected[0]
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+    def test_fork(self):
+        tle = ThreadLocalEngine(SeedSequence(5))
+        tle()
+        r, w = os.pipe()
+        pid = os.fork()
+        if not pid:
+            try:
+                os.write(w, b'%d' % int(tle()))
+            finally:
+                os._exit(0)
+        os.close(w)
+        with os.fdopen(r, 'rb') as f:
+            child_value = int(f.read())
+        os.waitpid(pid, 0)
+        # without the reset, the child would have continued our stream
+        assert child_value != int(tle())
+
+
+class TestThreadLocalPcgRandom:
+    def test_threads(self):
+        rng = PcgRandom.thread_local(SeedSequence(11), pcg_random.pcg64)
+        assert isinstance(rng._engine, ThreadLocalEngine)
+        results = run_threads(8, lambda: [rng.random() for _ in range(16)])
+        assert len({tuple(r) for r in results}) == 8
+        for r in results:
+            assert all(0 <= x < 1 for x in r)
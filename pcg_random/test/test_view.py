@@ -0,0 +1,80 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+from pcg_random import Buffered, EngineView
+
+import pytest
+
+
+class TestEngineView:
+    def test_index(self, make_engine):
+        rng = make_engine()
+        check = rng.copy()
+        view = rng.view()
+        expected = [check() for _ in range(50)]
+        assert [view[i] for i in range(50)] == expected
+        assert [view[i] for i in reversed(range(50))] == expected[::-1]
+        assert rng == make_engine()
+
+    def test_negative(self, make_engine):
+        rng = make_engine()
+        view = rng.view()
+        back = rng.copy()
+        back.backstep(3)
+        assert view[-3:] == [back() for _ in range(3)]
+        assert view[-1] == view[-1:][0]
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_slices(self, make_engine):
+        rng = make_engine()
+        view = rng.view()
+        expected = [rng() for _ in range(100)]
+        assert view[10:20] == expected[10:20]
+        assert view[5:60:7] == expected[5:60:7]
+        assert view[60:5:-3] == expected[60:5:-3]
+        assert view[20:10] == []
+
+    @pytest.mark.parametrize('engine_name', ['pcg64'])
+    def test_not_disturbed(self, make_engine):
+        rng = make_engine()
+        view = rng.view()
+        first = view[1000]
+        rng()
+        rng.advance(12345)
+        assert view[1000] == first
+        assert view.engine_at(1000)() == first
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_checkpoints(self, make_engine):
+        view = make_engine().view(checkpoints=3)
+        for i in range(0, 1000, 100):
+            view[i]
+        assert len(view._checkpoints) == 3
+        assert 901 in view._checkpoints
+        with pytest.raises(ValueError):
+            make_engine().view(checkpoints=0)
+
+    @pytest.mark.parametrize('engine_name', ['pcg32'])
+    def test_buffered(self, make_engine):
+        rng = Buffered(make_engine(), 16)
+        rng()
+        check = make_engine()
+        check()
+        view = rng.view()
+        assert isinstance(view, EngineView)
+        assert view[0:40] == [check() for _ in range(40)]
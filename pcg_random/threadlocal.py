@@ -0,0 +1,130 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Per-thread engines, so that threads can share one generator object.
+'''
+
+import os
+import threading
+import weakref
+
+from .pcg_detail import AbstractEngine, Engine
+from .pcg_engines import setseq_xsh_rr_64_32 as pcg32
+from .pcg_extras import SeedSequence
+
+
+_instances = weakref.WeakSet()
+
+def _after_fork_in_child():
+    for instance in list(_instances):
+        instance._reset_after_fork()
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class ThreadLocalEngine(AbstractEngine):
+    ''' Lazily give every thread its own engine, derived from a master.
+
+        The master is either an Engine, which is split() once per thread,
+        or a SeedSequence, which is spawn()ed once per thread to seed a new
+        `engine`. Only that first use takes a lock; after it, every thread
+        draws from its own engine without any synchronization.
+
+        A forked child process throws away all the engines and reseeds the
+        master from fresh entropy, so it never repeats its parent's streams.
+    '''
+    def __init__(self, master=None, engine=pcg32):
+        if master is None:
+            master = SeedSequence()
+        if isinstance(master, Engine):
+            prototype = master
+        elif isinstance(master, SeedSequence):
+            prototype = engine(seed=False)
+        else:
+            raise TypeError('Master must be an Engine or a SeedSequence!')
+        self._master = master
+        self._factory = engine
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.itype = prototype.itype
+        self.xtype = prototype.xtype
+        self.MIN = prototype.MIN
+        self.MAX = prototype.MAX
+        self.state_type = prototype.state_type
+        self.result_type = prototype.result_type
+
+        _instances.add(self)
+
+    def __repr__(self):
+        return 'ThreadLocalEngine(%r, %s)' % (self._master, self._factory.__qualname__)
+
+    def __reduce__(self):
+        raise TypeError('Thread-local engines cannot be pickled; pickle local() instead')
+
+    def _reset_after_fork(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if isinstance(self._master, Engine):
+            self._master = self._master.copy()
+            self._master.seed()
+        else:
+            self._master = SeedSequence()
+
+    def local(self):
+        ''' The calling thread's engine, created on first use.
+        '''
+        try:
+            return self._local.engine
+        except AttributeError:
+            pass
+        with self._lock:
+            if isinstance(self._master, Engine):
+                rv = self._master.split()
+            else:
+                rv = self._factory(self._master.spawn(1)[0])
+        self._local.engine = rv
+        return rv
+
+    def copy(self):
+        ''' A plain copy of the calling thread's engine, as it is now.
+        '''
+        return self.local().copy()
+
+    def __call__(self, upper_bound=None):
+        return self.local()(upper_bound)
+
+    def fill(self, out):
+        return self.local().fill(out)
+
+    def _bulk_words(self, n):
+        return self.local()._bulk_words(n)
+
+    def seed(self, *seed_args, **seed_kwargs):
+        self.local().seed(*seed_args, **seed_kwargs)
+
+    def advance(self, delta):
+        self.local().advance(delta)
+
+    def backstep(self, delta):
+        self.local().backstep(delta)
+
+    discard = advance
+
+    def period_pow2(self):
+        return self.local().period_pow2()
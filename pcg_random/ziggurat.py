@@ -0,0 +1,158 @@
+# PCG Random Number Generation for C++ (ported to Python)
+#
+# Copyright 2017 Ben Longbons <brlongbons@gmail.com>
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+#
+# Licensed under the Apache License, Version 2.0 (provided in
+# LICENSE-APACHE.txt and at http://www.apache.org/licenses/LICENSE-2.0)
+# or under the MIT license (provided in LICENSE-MIT.txt and at
+# http://opensource.org/licenses/MIT), at your option. This file may not
+# be copied, modified, or distributed except according to those terms.
+#
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTY OF ANY KIND, either
+# express or implied.  See your chosen license for details.
+#
+# For additional information about the PCG random number generation scheme,
+# visit http://www.pcg-random.org/.
+
+''' Normal and exponential variates by the ziggurat method.
+
+    See Marsaglia and Tsang, "The Ziggurat Method for Generating Random
+    Variables", Journal of Statistical Software (2000). This version uses
+    256 layers and one 64-bit draw per attempt: the low 8 bits pick the
+    layer, and (for the normal) the next bit picks the sign.
+
+    Every function takes any engine. Pass `size` to get a NumPy array;
+    the batched form consumes the engine in a different order than the
+    same number of scalar calls would, but is just as deterministic.
+'''
+
+import math
+
+
+_LAYERS = 256
+_MASK64 = (1 << 64) - 1
+
+
+def _build(r, v, f, finv, mbits):
+    # x[i] is the width of layer i; layer 0 is the base strip plus the
+    # tail, so its width is the one that gives it area v too.
+    x = [0.0] * (_LAYERS + 1)
+    x[0] = v / f(r)
+    x[1] = r
+    for i in range(1, _LAYERS - 1):
+        x[i+1] = finv(v / x[i] + f(x[i]))
+    # the top layer narrows to a point
+    x[_LAYERS] = 0.0
+    scale = 2.0 ** mbits
+    k = [int(x[i+1] / x[i] * scale) for i in range(_LAYERS)]
+    w = [x[i] / scale for i in range(_LAYERS)]
+    fx = [f(xi) for xi in x]
+    return k, w, fx
+
+def _normal_pdf(x):
+    return math.exp(-0.5 * x * x)
+
+def _exponential_pdf(x):
+    return math.exp(-x)
+
+_NOR_R = 3.6541528853610088
+_NOR_V = 0.00492867323399
+_NOR_MBITS = 52
+_nor_k, _nor_w, _nor_f = _build(_NOR_R, _NOR_V, _normal_pdf,
+        lambda y: math.sqrt(-2.0 * math.log(y)), _NOR_MBITS)
+
+_EXP_R = 7.69711747013104972
+_EXP_V = 0.0039496598225815571993
+_EXP_MBITS = 56
+_exp_k, _exp_w, _exp_f = _build(_EXP_R, _EXP_V, _exponential_pdf,
+        lambda y: -math.log(y), _EXP_MBITS)
+
+
+def _next64(engine):
+    # Same layout as PcgRandom.getrandbits(64).
+    BITS = engine.result_type.BITS
+    if BITS >= 64:
+        return int(engine()) & _MASK64
+    rv = 0
+    for shift in range(0, 64, BITS):
+        rv |= int(engine()) << shift
+    return rv
+
+def _next_double(engine):
+    return (_next64(engine) >> 11) * 2.0**-53
+
+
+def _normal_from(engine, u):
+    # Finish one normal variate, given the first attempt's draw.
+    while True:
+        i = u & 0xff
+        m = u >> (64 - _NOR_MBITS)
+        z = m * _nor_w[i]
+        if m < _nor_k[i]:
+            pass
+        elif i == 0:
+            # Sample from the tail beyond r.
+            while True:
+                a = -math.log1p(-_next_double(engine)) / _NOR_R
+                b = -math.log1p(-_next_double(engine))
+                if b + b > a * a:
+                    break
+            z = _NOR_R + a
+        elif _nor_f[i+1] + _next_double(engine) * (_nor_f[i] - _nor_f[i+1]) >= _normal_pdf(z):
+            u = _next64(engine)
+            continue
+        return -z if u & 0x100 else z
+
+def _exponential_from(engine, u):
+    while True:
+        i = u & 0xff
+        m = u >> (64 - _EXP_MBITS)
+        z = m * _exp_w[i]
+        if m < _exp_k[i]:
+            return z
+        if i == 0:
+            # The tail is just another exponential, shifted.
+            return _EXP_R - math.log1p(-_next_double(engine))
+        if _exp_f[i+1] + _next_double(engine) * (_exp_f[i] - _exp_f[i+1]) < _exponential_pdf(z):
+            return z
+        u = _next64(engine)
+
+
+def _batch(engine, size, mbits, k, w, slow, signed):
+    from . import arrays
+    import numpy as np
+
+    n = int(np.prod(size))
+    u = arrays.random_bits(engine, n, 64)
+    i = (u & np.uint64(0xff)).astype(np.intp)
+    m = u >> np.uint64(64 - mbits)
+    z = m.astype(np.float64) * np.asarray(w)[i]
+    if signed:
+        z = np.where(u & np.uint64(0x100), -z, z)
+    for j in np.flatnonzero(m >= np.asarray(k, np.uint64)[i]):
+        z[j] = slow(engine, int(u[j]))
+    return z.reshape(size)
+
+def standard_normal(engine, size=None):
+    ''' Normal variates with mean 0 and standard deviation 1.
+    '''
+    if size is None:
+        return _normal_from(engine, _next64(engine))
+    return _batch(engine, size, _NOR_MBITS, _nor_k, _nor_w, _normal_from, True)
+
+def normal(engine, mu=0.0, sigma=1.0, size=None):
+    return mu + sigma * standard_normal(engine, size)
+
+def standard_exponential(engine, size=None):
+    ''' Exponential variates with rate (and mean) 1.
+    '''
+    if size is None:
+        return _exponential_from(engine, _next64(engine))
+    return _batch(engine, size, _EXP_MBITS, _exp_k, _exp_w, _exponential_from, False)
+
+def exponential(engine, lambd=1.0, size=None):
+    ''' Exponential variates with rate lambd, like random.expovariate.
+    '''
+    return standard_exponential(engine, size) / lambd